@@ -0,0 +1,235 @@
+"""
+Big-integer factorial engine.
+
+factorial_recursive/factorial_iterative in task4.py multiply 1 * 2 * ... * n
+one step at a time, so most of the work is multiplying a huge number by a
+small one, and the recursive version hits the recursion limit around
+n = 1000.
+
+This module provides:
+- factorial / binomial: math.factorial and math.comb, which already use
+  binary splitting in C, with the task4 argument checks. Uses gmpy2 for
+  large n when it is installed.
+- product_range / falling_factorial: exact products of a range, built from
+  balanced product trees.
+- factorial_mod / binomial_mod / FactorialTable: modular helpers that never
+  build the full n!.
+"""
+
+import math
+
+# Optional gmpy2 import - GMP's factorial is much faster for very large n
+try:
+    import gmpy2
+    GMPY2_AVAILABLE = True
+except ImportError:
+    gmpy2 = None
+    GMPY2_AVAILABLE = False
+
+# Below this n, converting from gmpy2's mpz costs more than it saves
+GMPY2_CUTOFF = 1000
+
+# Ranges shorter than this are multiplied in a simple loop
+_LOOP_CUTOFF = 16
+
+
+def _validate(n, name="n"):
+    """Raise TypeError/ValueError for non-integer or negative input"""
+    if not isinstance(n, int):
+        raise TypeError(f"{name} must be an integer")
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers.")
+
+
+def product_range(lo, hi):
+    """
+    Return lo * (lo + 1) * ... * (hi - 1) by binary splitting.
+
+    Splitting the range in half keeps both factors of every multiplication
+    about the same size, which lets Python's Karatsuba multiplication do
+    the heavy lifting. Returns 1 for an empty range.
+    """
+    if hi - lo <= _LOOP_CUTOFF:
+        result = 1
+        for i in range(lo, hi):
+            result *= i
+        return result
+    mid = (lo + hi) // 2
+    return product_range(lo, mid) * product_range(mid, hi)
+
+
+def factorial(n):
+    """
+    Calculate n! exactly.
+
+    Args:
+        n (int): Non-negative integer
+
+    Returns:
+        int: n!
+
+    Raises:
+        TypeError: If n is not an integer
+        ValueError: If n is negative
+
+    >>> factorial(5)
+    120
+    >>> factorial(200) % 10**9
+    0
+    """
+    _validate(n)
+    if GMPY2_AVAILABLE and n >= GMPY2_CUTOFF:
+        return int(gmpy2.fac(n))
+    return math.factorial(n)
+
+
+def falling_factorial(n, k):
+    """
+    Return n * (n - 1) * ... * (n - k + 1), i.e. n! / (n - k)!.
+
+    >>> falling_factorial(10, 3)
+    720
+    """
+    _validate(n)
+    _validate(k, "k")
+    if k > n:
+        return 0
+    return product_range(n - k + 1, n + 1)
+
+
+def binomial(n, k):
+    """
+    Return the binomial coefficient C(n, k) exactly.
+
+    >>> binomial(10, 3)
+    120
+    >>> binomial(5, 7)
+    0
+    """
+    _validate(n)
+    _validate(k, "k")
+    return math.comb(n, k)
+
+
+def factorial_mod(n, m):
+    """
+    Return n! mod m without building n!.
+
+    For n >= m the result is 0, since m itself is one of the factors.
+
+    >>> factorial_mod(10, 7)
+    0
+    >>> factorial_mod(6, 1000)
+    720
+    """
+    _validate(n)
+    if m <= 0:
+        raise ValueError("Modulus must be a positive integer")
+    if n >= m:
+        return 0
+    result = 1 % m
+    for i in range(2, n + 1):
+        result = result * i % m
+    return result
+
+
+def binomial_mod(n, k, p):
+    """
+    Return C(n, k) mod p for a prime p, using Lucas' theorem.
+
+    Works for arbitrarily large n and k; each base-p digit pair needs at
+    most O(p) work.
+
+    >>> binomial_mod(1000, 300, 13)
+    10
+    """
+    _validate(n)
+    _validate(k, "k")
+    if p < 2:
+        raise ValueError("Modulus must be a prime")
+    result = 1
+    while n or k:
+        n_digit, k_digit = n % p, k % p
+        if k_digit > n_digit:
+            return 0
+        numerator = factorial_mod(n_digit, p)
+        denominator = factorial_mod(k_digit, p) * factorial_mod(n_digit - k_digit, p) % p
+        result = result * numerator * pow(denominator, p - 2, p) % p
+        n //= p
+        k //= p
+    return result
+
+
+class FactorialTable:
+    """
+    Precomputed factorials and inverse factorials modulo a prime.
+
+    After O(limit) setup, factorial(n) and binomial(n, k) for n <= limit are
+    O(1), which suits workloads that need many binomials mod the same prime.
+    """
+
+    def __init__(self, limit, p=10**9 + 7):
+        _validate(limit, "limit")
+        if limit >= p:
+            raise ValueError("limit must be smaller than the prime modulus")
+        self.limit = limit
+        self.p = p
+
+        facts = [1] * (limit + 1)
+        for i in range(1, limit + 1):
+            facts[i] = facts[i - 1] * i % p
+
+        inverse = [1] * (limit + 1)
+        inverse[limit] = pow(facts[limit], p - 2, p)
+        for i in range(limit, 0, -1):
+            inverse[i - 1] = inverse[i] * i % p
+
+        self.facts = facts
+        self.inverse_facts = inverse
+
+    def _check(self, n):
+        _validate(n)
+        if n > self.limit:
+            raise ValueError(f"n must not exceed the table limit {self.limit}, got {n}")
+
+    def factorial(self, n):
+        """Return n! mod p"""
+        self._check(n)
+        return self.facts[n]
+
+    def binomial(self, n, k):
+        """Return C(n, k) mod p"""
+        self._check(n)
+        if not isinstance(k, int):
+            raise TypeError("k must be an integer")
+        if k < 0 or k > n:
+            return 0
+        return self.facts[n] * self.inverse_facts[k] % self.p * self.inverse_facts[n - k] % self.p
+
+
+# Example usage
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from task4 import factorial_iterative
+
+    print(f"Factorial of 5: {factorial(5)}")
+    print(f"C(52, 5) = {binomial(52, 5)}")
+    print(f"C(10^18, 10^9) mod 13 = {binomial_mod(10**18, 10**9, 13)}")
+    print(f"gmpy2 available: {GMPY2_AVAILABLE}")
+
+    for n in (10_000, 50_000):
+        start = time.perf_counter()
+        expected = factorial_iterative(n)
+        iterative_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        result = factorial(n)
+        fast_seconds = time.perf_counter() - start
+        assert result == expected
+        print(f"{n}!: iterative {iterative_seconds:.3f}s, factorial {fast_seconds:.3f}s")
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    start = time.perf_counter()
+    result = factorial(n)
+    print(f"{n}! has {result.bit_length()} bits ({time.perf_counter() - start:.2f}s)")
@@ -0,0 +1,216 @@
+"""
+Bulk primality utilities built on top of task2.is_prime().
+
+- `primes_up_to` — classic Sieve of Eratosthenes for small limits.
+- `segmented_sieve` / `count_primes` — Sieve of Eratosthenes processed in
+  fixed-size segments, so primes up to 10^10 and beyond can be produced
+  with memory bounded by the segment size plus the base primes up to
+  sqrt(high).
+- `is_prime_many` — primality of many integers at once. With NumPy it
+  returns a boolean array and answers small values by indexing a
+  vectorised sieve; large values go through is_prime() (Miller-Rabin).
+  Without NumPy it falls back to plain lists.
+"""
+from itertools import compress
+from math import isqrt
+from typing import Iterable, Iterator, List
+
+from task2 import is_prime
+
+# Optional NumPy import - only needed for vectorised is_prime_many()
+try:
+	import numpy as np
+	NUMPY_AVAILABLE = True
+except ImportError:
+	np = None
+	NUMPY_AVAILABLE = False
+
+# Default number of integers covered by one segment of segmented_sieve()
+DEFAULT_SEGMENT_SIZE = 1 << 20
+
+# is_prime_many() never builds a lookup sieve larger than this
+SIEVE_LIMIT = 10_000_000
+
+
+def sieve_flags(limit: int) -> bytearray:
+	"""Return a bytearray where flags[i] == 1 exactly when i is prime (0 <= i <= limit)."""
+	if limit < 2:
+		return bytearray(max(limit + 1, 0))
+	flags = bytearray([1]) * (limit + 1)
+	flags[0] = flags[1] = 0
+	for p in range(2, isqrt(limit) + 1):
+		if flags[p]:
+			start = p * p
+			flags[start::p] = bytes((limit - start) // p + 1)
+	return flags
+
+
+def primes_up_to(limit: int) -> List[int]:
+	"""Return all primes <= limit.
+
+	>>> primes_up_to(30)
+	[2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+	"""
+	flags = sieve_flags(limit)
+	return list(compress(range(len(flags)), flags))
+
+
+def _segments(low: int, high: int, segment_size: int) -> Iterator[tuple]:
+	"""Yield (segment_low, flags) for each segment of [low, high]."""
+	if segment_size < 1:
+		raise ValueError("segment_size must be positive")
+	low = max(low, 2)
+	if high < low:
+		return
+
+	base_primes = primes_up_to(isqrt(high))
+	zeros = memoryview(bytes(segment_size))
+
+	for seg_low in range(low, high + 1, segment_size):
+		seg_high = min(seg_low + segment_size - 1, high)
+		size = seg_high - seg_low + 1
+		flags = bytearray([1]) * size
+		for p in base_primes:
+			if p * p > seg_high:
+				break
+			# First multiple of p in the segment, but never p itself
+			start = max(p * p, (seg_low + p - 1) // p * p) - seg_low
+			if start < size:
+				flags[start::p] = zeros[:(size - 1 - start) // p + 1]
+		yield seg_low, flags
+
+
+def segmented_sieve(low: int, high: int, segment_size: int = DEFAULT_SEGMENT_SIZE) -> Iterator[int]:
+	"""Yield the primes in [low, high] in increasing order.
+
+	Memory use is O(segment_size + sqrt(high)) regardless of the range.
+
+	>>> list(segmented_sieve(90, 110, segment_size=8))
+	[97, 101, 103, 107, 109]
+	"""
+	for seg_low, flags in _segments(low, high, segment_size):
+		yield from compress(range(seg_low, seg_low + len(flags)), flags)
+
+
+def count_primes(low: int, high: int, segment_size: int = DEFAULT_SEGMENT_SIZE) -> int:
+	"""Count the primes in [low, high] without materialising them.
+
+	>>> count_primes(1, 10**6)
+	78498
+	"""
+	return sum(flags.count(1) for _, flags in _segments(low, high, segment_size))
+
+
+def _numpy_sieve(limit: int):
+	"""Boolean NumPy array where sieve[i] is True exactly when i is prime."""
+	sieve = np.ones(limit + 1, dtype=bool)
+	sieve[:2] = False
+	for p in range(2, isqrt(limit) + 1):
+		if sieve[p]:
+			sieve[p * p::p] = False
+	return sieve
+
+
+def is_prime_many(values: Iterable[int]):
+	"""Test many integers for primality at once.
+
+	When the largest value is small relative to the number of inputs, one
+	sieve is built and every value is answered by a table lookup; otherwise
+	each value goes through is_prime(), which uses Miller-Rabin for large
+	inputs.
+
+	Returns:
+		A NumPy boolean array when NumPy is installed, otherwise a list of bools.
+
+	Raises:
+		TypeError: if any value is not an integer (matching is_prime()).
+
+	>>> [bool(x) for x in is_prime_many([1, 2, 9, 97, 2**61 - 1])]
+	[False, True, False, True, True]
+	"""
+	if NUMPY_AVAILABLE:
+		return _is_prime_many_numpy(values)
+
+	values = list(values)
+	for value in values:
+		if not isinstance(value, int):
+			raise TypeError("is_prime_many() only accepts integers")
+	if not values:
+		return []
+
+	max_value = max(values)
+	if max_value <= min(SIEVE_LIMIT, 256 * len(values)):
+		flags = sieve_flags(max_value)
+		return [value >= 0 and bool(flags[value]) for value in values]
+	return [is_prime(value) for value in values]
+
+
+def _int_array(values):
+	"""Array of Python ints as int64, else uint64, else object dtype.
+
+	np.asarray would infer the dtype itself and turns a mix such as
+	[-1, 2**64 - 59] into float64, losing precision.
+	"""
+	for value in values:
+		if not isinstance(value, int):
+			raise TypeError("is_prime_many() only accepts integers")
+	for dtype in (np.int64, np.uint64):
+		try:
+			return np.array(values, dtype=dtype)
+		except OverflowError:
+			pass
+	return np.array(values, dtype=object)
+
+
+def _is_prime_many_numpy(values):
+	"""NumPy implementation of is_prime_many()."""
+	if isinstance(values, np.ndarray):
+		arr = values
+	else:
+		arr = _int_array(list(values))
+	if arr.size == 0:
+		return np.zeros(arr.shape, dtype=bool)
+
+	# Python ints beyond 64 bits (object dtype) are checked one by one
+	if arr.dtype.kind not in "iu":
+		if arr.dtype.kind == "O":
+			return np.array([is_prime(value) for value in arr.ravel()], dtype=bool).reshape(arr.shape)
+		raise TypeError("is_prime_many() only accepts integers")
+
+	result = np.zeros(arr.shape, dtype=bool)
+	max_value = int(arr.max())
+	if max_value < 2:
+		return result
+
+	sieve_limit = min(max_value, SIEVE_LIMIT, 256 * arr.size)
+	small = (arr >= 0) & (arr <= sieve_limit)
+	if small.any():
+		sieve = _numpy_sieve(sieve_limit)
+		result[small] = sieve[arr[small]]
+
+	large = arr > sieve_limit
+	if large.any():
+		result[large] = [is_prime(int(value)) for value in arr[large]]
+	return result
+
+
+if __name__ == "__main__":
+	import time
+
+	print("Primes up to 50:", primes_up_to(50))
+
+	for limit in (10**6, 10**7, 10**8):
+		start = time.perf_counter()
+		count = count_primes(2, limit)
+		print(f"pi({limit:.0e}) = {count} ({time.perf_counter() - start:.3f}s, segmented)")
+
+	values = list(range(100_000))
+	start = time.perf_counter()
+	bulk = is_prime_many(values)
+	bulk_seconds = time.perf_counter() - start
+	start = time.perf_counter()
+	single = [is_prime(v) for v in values]
+	single_seconds = time.perf_counter() - start
+	assert [bool(x) for x in bulk] == single
+	print(f"is_prime_many over 10^5 values: {bulk_seconds:.4f}s vs {single_seconds:.4f}s one by one")
+	print(f"NumPy available: {NUMPY_AVAILABLE}")
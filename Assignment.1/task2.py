@@ -2,18 +2,31 @@
 Small utility: is_prime() implementation and quick tests.
 s
 This file provides a compact, efficient primality check using the
-6k ± 1 optimization and integer square root from the standard library.
+6k ± 1 optimization and integer square root from the standard library,
+plus a deterministic Miller-Rabin test that is_prime() switches to for
+large inputs. Bulk workloads (sieves, arrays) live in prime_sieve.py.
 """
 from math import isqrt
 
+# Below this, 6k ± 1 trial division beats Miller-Rabin
+TRIAL_DIVISION_LIMIT = 1_000_000
+
+# Miller-Rabin with the first 13 prime bases is deterministic below this
+# bound (it covers every 64-bit integer)
+MILLER_RABIN_LIMIT = 3_317_044_064_679_887_385_961_981
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
 def is_prime(n: int) -> bool:
 	"""Return True if n is a prime number, otherwise False.
 
 	Implementation notes:
 	- Accepts only integers (raises TypeError for other types).
 	- Numbers < 2 are not prime.
-	- Uses simple checks for small primes and divisibility by 2 and 3,
-	  then tests potential divisors of the form 6k-1 and 6k+1 up to sqrt(n).
+	- Dispatches by size: trial division below TRIAL_DIVISION_LIMIT,
+	  deterministic Miller-Rabin up to MILLER_RABIN_LIMIT (all 64-bit
+	  integers and beyond), and trial division again above that so the
+	  answer is always exact.
 
 	Examples:
 	>>> is_prime(2)
@@ -26,6 +39,16 @@ def is_prime(n: int) -> bool:
 	if not isinstance(n, int):
 		raise TypeError("is_prime() only accepts integers")
 
+	if TRIAL_DIVISION_LIMIT <= n < MILLER_RABIN_LIMIT:
+		return is_prime_miller_rabin(n)
+	return is_prime_trial_division(n)
+
+
+def is_prime_trial_division(n: int) -> bool:
+	"""Primality by trial division with divisors of the form 6k ± 1.
+
+	Exact for every integer, but O(sqrt(n)); best for small n.
+	"""
 	if n < 2:
 		return False
 	if n in (2, 3):
@@ -42,6 +65,46 @@ def is_prime(n: int) -> bool:
 	return True
 
 
+def is_prime_miller_rabin(n: int) -> bool:
+	"""Deterministic Miller-Rabin primality test.
+
+	Exact for n < MILLER_RABIN_LIMIT (including every 64-bit integer);
+	raises ValueError above that bound, where the fixed bases are no
+	longer proven to be sufficient.
+
+	>>> is_prime_miller_rabin(2**61 - 1)
+	True
+	>>> is_prime_miller_rabin(3215031751)
+	False
+	"""
+	if n >= MILLER_RABIN_LIMIT:
+		raise ValueError("is_prime_miller_rabin() is only deterministic below MILLER_RABIN_LIMIT")
+	if n < 2:
+		return False
+	for p in MILLER_RABIN_BASES:
+		if n % p == 0:
+			return n == p
+
+	# Write n - 1 as d * 2^s with d odd
+	d = n - 1
+	s = 0
+	while d % 2 == 0:
+		d //= 2
+		s += 1
+
+	for a in MILLER_RABIN_BASES:
+		x = pow(a, d, n)
+		if x == 1 or x == n - 1:
+			continue
+		for _ in range(s - 1):
+			x = x * x % n
+			if x == n - 1:
+				break
+		else:
+			return False
+	return True
+
+
 if __name__ == "__main__":
 	# Quick self-checks (happy path + a few edge cases)
 	test_cases = [
@@ -56,6 +119,11 @@ if __name__ == "__main__":
 		(7919, True),  # known prime
 		(7920, False),
 		(-7, False),
+		(1_000_003, True),
+		(3215031751, False),  # strong pseudoprime to bases 2, 3, 5 and 7
+		(2**61 - 1, True),  # Mersenne prime
+		(2**64 - 59, True),  # largest 64-bit prime
+		(2**64 - 1, False),
 	]
 
 	for n, expected in test_cases:
@@ -0,0 +1,27 @@
+import pytest
+
+from prime_sieve import is_prime_many
+from task2 import is_prime
+
+
+@pytest.mark.parametrize("values", [
+    [5, 2**64 - 59],
+    [-1, 2**64 - 59],
+    [2**63 - 25, 2**63 + 29, 7, 0],
+    [2**64 + 13, 3, -7],
+])
+def test_mixed_ints_around_64_bits(values):
+    assert [bool(x) for x in is_prime_many(values)] == [is_prime(v) for v in values]
+
+
+def test_generator_input():
+    values = [2**63 + 29, 11, 12]
+    assert [bool(x) for x in is_prime_many(iter(values))] == [True, True, False]
+
+
+def test_floats_rejected():
+    with pytest.raises(TypeError):
+        is_prime_many([1.0, 2])
+    np = pytest.importorskip("numpy")
+    with pytest.raises(TypeError):
+        is_prime_many(np.array([1.5, 2.0]))
@@ -0,0 +1,339 @@
+"""
+Set operations for find_common and friends.
+
+- intersect_many: intersection of any number of iterables, smallest first,
+  keeping the order in which items appear in the first input
+- galloping_intersection / intersect_sorted: merge-style intersection of
+  pre-sorted sequences that skips ahead with exponential search, so a short
+  list against a long one costs O(m log(n/m)) comparisons
+- stream_intersection: common lines of text files far larger than memory,
+  using hash partitioning on disk and an optional Bloom-filter prefilter
+- BloomFilter: compact probabilistic membership test (no false negatives)
+"""
+import math
+import os
+import shutil
+import tempfile
+from bisect import bisect_left
+from itertools import islice
+
+# Optional NumPy import - only used to hash Bloom-filter batches faster
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Rough memory cost of holding a text file's lines in a set, per input byte
+IN_MEMORY_BYTES_FACTOR = 8
+DEFAULT_MEMORY_LIMIT = 256 * 2 ** 20
+
+# Items hashed together by BloomFilter.update / BloomFilter.filter
+BLOOM_BATCH_SIZE = 65536
+
+# Mixed into the second Bloom-filter hash so it is independent of hash(item)
+_SECOND_HASH_SALT = 0x9E3779B97F4A7C15
+
+
+def intersect_many(*iterables):
+    """
+    Return the items common to all iterables, without duplicates.
+
+    The sets are intersected smallest first, so the working set is never
+    larger than the smallest input and the loop stops as soon as it is
+    empty. Items come back in the order they first appear in the first
+    iterable.
+
+    Args:
+        *iterables: Two or more iterables of hashable items
+
+    Returns:
+        List of common elements
+    """
+    if not iterables:
+        return []
+    inputs = [items if isinstance(items, (set, frozenset)) else list(items) for items in iterables]
+    first = inputs[0]
+    inputs.sort(key=len)
+
+    common = set(inputs[0])
+    for other in inputs[1:]:
+        if not common:
+            break
+        common.intersection_update(other)
+    if not common:
+        return []
+
+    result = []
+    for item in first:
+        if item in common:
+            result.append(item)
+            common.discard(item)  # report each item once
+    return result
+
+
+def _gallop(values, target, lo):
+    """Smallest index i >= lo with values[i] >= target, by exponential search."""
+    step = 1
+    hi = lo
+    while hi < len(values) and values[hi] < target:
+        lo = hi + 1
+        hi += step
+        step *= 2
+    return bisect_left(values, target, lo, min(hi, len(values)))
+
+
+def galloping_intersection(a, b):
+    """
+    Intersect two ascending sorted sequences.
+
+    Walks the shorter sequence and gallops through the longer one, so the
+    cost is O(m log(n / m)) for lengths m <= n - much less than a linear
+    merge when the sizes differ a lot. Duplicates are reported once.
+
+    Args:
+        a: First sorted sequence (supports len and indexing)
+        b: Second sorted sequence
+
+    Returns:
+        Sorted list of common elements
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    result = []
+    position = 0
+    previous = None
+    for value in a:
+        if result and value == previous:
+            continue
+        position = _gallop(b, value, position)
+        if position == len(b):
+            break
+        if b[position] == value:
+            result.append(value)
+            previous = value
+    return result
+
+
+def intersect_sorted(*sequences):
+    """Intersect any number of ascending sorted sequences, shortest first."""
+    if not sequences:
+        return []
+    ordered = sorted(sequences, key=len)
+    if len(ordered) == 1:
+        return galloping_intersection(ordered[0], ordered[0])  # only drops duplicates
+    result = ordered[0]
+    for sequence in ordered[1:]:
+        result = galloping_intersection(result, sequence)
+        if not result:
+            break
+    return list(result)
+
+
+class BloomFilter:
+    """
+    Bloom filter: a bit array answering "possibly present" or "definitely absent".
+
+    Sized for `capacity` items at a false-positive rate of `error_rate`
+    (about 1.2 bytes per item at 1%). Positions come from Python's hash(),
+    so any hashable item works and equal items such as 1 and 1.0 match, but
+    string hashes are salted per process: a filter is only meaningful inside
+    the process that built it.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing: k positions from two independent hashes, reduced
+        # modulo size first so the NumPy batch path computes the same values
+        size = self.size
+        h1 = hash(item) % size
+        h2 = (hash((item, _SECOND_HASH_SALT)) | 1) % size
+        return [(h1 + i * h2) % size for i in range(self.hash_count)]
+
+    def _batch_positions(self, items):
+        size = self.size
+        h1 = np.fromiter((hash(item) for item in items), dtype=np.int64, count=len(items)) % size
+        h2 = np.fromiter((hash((item, _SECOND_HASH_SALT)) | 1 for item in items),
+                         dtype=np.int64, count=len(items)) % size
+        steps = np.arange(self.hash_count, dtype=np.int64)
+        return (h1[:, None] + steps[None, :] * h2[:, None]) % size
+
+    def add(self, item):
+        bits = self.bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def update(self, items):
+        if not NUMPY_AVAILABLE:
+            for item in items:
+                self.add(item)
+            return
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        iterator = iter(items)
+        while True:
+            batch = list(islice(iterator, BLOOM_BATCH_SIZE))
+            if not batch:
+                return
+            positions = self._batch_positions(batch).ravel()
+            np.bitwise_or.at(bits, positions >> 3, (1 << (positions & 7)).astype(np.uint8))
+
+    def filter(self, items):
+        """Yield the items that may be in the filter, dropping definite misses."""
+        if not NUMPY_AVAILABLE:
+            yield from (item for item in items if item in self)
+            return
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        iterator = iter(items)
+        while True:
+            batch = list(islice(iterator, BLOOM_BATCH_SIZE))
+            if not batch:
+                return
+            positions = self._batch_positions(batch)
+            hits = ((bits[positions >> 3] >> (positions & 7)) & 1).all(axis=1)
+            for index in np.flatnonzero(hits).tolist():
+                yield batch[index]
+
+    def __contains__(self, item):
+        bits = self.bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+def _read_lines(path, encoding):
+    """Yield the non-empty lines of a text file without their line endings."""
+    with open(path, "r", encoding=encoding, newline="") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if line:
+                yield line
+
+
+def _partition_file(path, parts, directory, tag, encoding, keep=None):
+    """Split a file's lines into `parts` files by hash; return their paths."""
+    paths = [os.path.join(directory, f"{tag}-{i}.part") for i in range(parts)]
+    outputs = [open(p, "w", encoding=encoding, newline="") for p in paths]
+    try:
+        lines = _read_lines(path, encoding)
+        if keep is not None:
+            lines = keep.filter(lines)
+        for line in lines:
+            outputs[hash(line) % parts].write(line + "\n")
+    finally:
+        for output in outputs:
+            output.close()
+    return paths
+
+
+def stream_intersection(paths, memory_limit=DEFAULT_MEMORY_LIMIT, use_bloom=True,
+                        bloom_error_rate=0.01, encoding="utf-8", tmp_dir=None):
+    """
+    Yield the lines common to all files, each once, using bounded memory.
+
+    Files are processed smallest first. If the smallest file's lines fit in
+    memory_limit they are loaded into a set and the other files are streamed
+    against it, yielding in the order of the smallest file. Otherwise every
+    file is hash-partitioned into temporary files so that each partition of
+    the smallest file fits in memory, and the partitions are intersected one
+    at a time (output is then grouped by partition). With use_bloom, a Bloom
+    filter of the smallest file keeps lines that cannot be common out of the
+    other files' partitions, which usually shrinks the temporary data by
+    orders of magnitude.
+
+    Args:
+        paths: Two or more text files; each non-empty line is one item
+        memory_limit: Approximate bytes available for the in-memory sets
+        use_bloom: Prefilter the larger files with a Bloom filter
+        bloom_error_rate: False-positive rate of that filter
+        encoding: Text encoding of the files
+        tmp_dir: Directory for partition files (default: system temp dir)
+
+    Yields:
+        Common lines, without line endings
+    """
+    if not paths:
+        return
+    paths = sorted(paths, key=os.path.getsize)
+    smallest, others = paths[0], paths[1:]
+    estimated = os.path.getsize(smallest) * IN_MEMORY_BYTES_FACTOR
+
+    if estimated <= memory_limit:
+        common = set(_read_lines(smallest, encoding))
+        for path in others:
+            if not common:
+                return
+            common.intersection_update(_read_lines(path, encoding))
+        for line in _read_lines(smallest, encoding):
+            if line in common:
+                common.discard(line)
+                yield line
+        return
+
+    bloom = None
+    if use_bloom:
+        # One pass to count lines so the filter is sized correctly
+        count = sum(1 for _ in _read_lines(smallest, encoding))
+        bloom = BloomFilter(max(count, 1), bloom_error_rate)
+        bloom.update(_read_lines(smallest, encoding))
+
+    parts = math.ceil(estimated / memory_limit)
+    directory = tempfile.mkdtemp(prefix="intersect-", dir=tmp_dir)
+    try:
+        partitioned = [_partition_file(smallest, parts, directory, "0", encoding)]
+        for index, path in enumerate(others, start=1):
+            partitioned.append(_partition_file(path, parts, directory, str(index), encoding, keep=bloom))
+
+        for part in range(parts):
+            common = set(_read_lines(partitioned[0][part], encoding))
+            for file_parts in partitioned[1:]:
+                if not common:
+                    break
+                common.intersection_update(_read_lines(file_parts[part], encoding))
+            yield from common
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("intersect_many:", intersect_many([5, 1, 4, 2, 3], [2, 4, 6, 8], range(0, 10)))
+    print("galloping_intersection:", galloping_intersection([1, 3, 5, 7, 9], list(range(0, 100, 3))))
+
+    small = sorted(random.sample(range(10 ** 7), 1_000))
+    large = list(range(0, 10 ** 7, 2))
+    for name, func in [
+        ("set(a) & set(b)", lambda: sorted(set(small) & set(large))),
+        ("intersect_many", lambda: intersect_many(small, large)),
+        ("galloping_intersection", lambda: galloping_intersection(small, large)),
+    ]:
+        start = time.perf_counter()
+        result = func()
+        print(f"  {name:<24} {time.perf_counter() - start:.4f}s ({len(result)} common)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = []
+        for i, (count, span) in enumerate([(200_000, 10 ** 6), (400_000, 10 ** 6), (300_000, 10 ** 6)]):
+            path = os.path.join(directory, f"ids{i}.txt")
+            with open(path, "w") as f:
+                f.writelines(f"id{random.randrange(span)}\n" for _ in range(count))
+            files.append(path)
+        expected = set(intersect_many(*(_read_lines(p, "utf-8") for p in files)))
+        for label, limit in [("in memory", DEFAULT_MEMORY_LIMIT), ("partitioned + Bloom", 2 ** 20)]:
+            start = time.perf_counter()
+            found = set(stream_intersection(files, memory_limit=limit))
+            assert found == expected
+            print(f"  stream_intersection, {label:<20} {time.perf_counter() - start:.3f}s ({len(found)} common)")
@@ -0,0 +1,361 @@
+"""
+One-pass statistics accumulator.
+
+StreamingStats consumes numbers from any iterable (including generators and
+files too large for memory) in a single pass and keeps:
+
+- count, sum and mean
+- variance and standard deviation, with Welford's update, which stays
+  accurate where the textbook sum-of-squares formula cancels catastrophically
+- min and max
+- approximate quantiles from a fixed-size uniform sample
+
+Accumulators are mergeable: stats computed separately on chunks (in other
+processes, on other machines, per file) combine with merge() into exactly
+the count/mean/variance/min/max of the whole data (Chan et al.'s parallel
+variance formula), and into a uniform sample of the whole data.
+"""
+import heapq
+import math
+import numbers
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+# Optional NumPy import - only used for array inputs to update()
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Values kept for quantile estimates; rank error is roughly 1/sqrt(size)
+DEFAULT_SAMPLE_SIZE = 1024
+
+DEFAULT_QUANTILES = (0.25, 0.5, 0.75)
+
+# Items taken from a generic iterable at a time by update()
+CHUNK_SIZE = 65536
+
+_NUMBER_TYPES = {int, float, bool}
+
+
+def _as_float(value):
+    """float(value) for any number type (Decimal, Fraction, NumPy scalars...)."""
+    if isinstance(value, numbers.Number):
+        try:
+            return float(value)
+        except TypeError:
+            pass  # complex numbers have no ordering or float value
+    raise TypeError(f"StreamingStats accepts numbers only, got {value!r}")
+
+
+class StreamingStats:
+    """
+    Running count, mean, variance, min, max and quantile sample of numbers.
+
+    Any real number type is accepted. sum, min and max keep the input type
+    (so Decimal scores give a Decimal mean, as sum(scores) / len(scores)
+    would); variance and quantiles are computed in floats.
+
+    Quantiles come from a bottom-k sample: every value gets a random tag and
+    the sample_size values with the smallest tags are kept. That is a
+    uniform sample of everything seen, and the union of two such samples
+    truncated to the smallest tags is a uniform sample of the combined data,
+    which is what makes the sample mergeable. Quantiles are exact while
+    count <= sample_size.
+
+    Example:
+        >>> stats = StreamingStats()
+        >>> stats.update([85, 92, 78, 96, 88, 90])
+        >>> stats.count, stats.min, stats.max
+        (6, 78, 96)
+    """
+
+    def __init__(self, sample_size=DEFAULT_SAMPLE_SIZE, seed=None):
+        if sample_size < 1:
+            raise ValueError("sample_size must be positive")
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.sample_size = sample_size
+        self._sample = []  # max-heap of (-tag, value)
+        self._random = random.Random(seed)
+
+    def add(self, value):
+        """Add a single number."""
+        x = _as_float(value)
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (x - self._mean)
+        self._offer(self._random.random(), x)
+
+    def _offer(self, tag, value):
+        sample = self._sample
+        if len(sample) < self.sample_size:
+            heapq.heappush(sample, (-tag, value))
+        elif tag < -sample[0][0]:
+            heapq.heapreplace(sample, (-tag, value))
+
+    def update(self, values):
+        """
+        Add every number from an iterable.
+
+        NumPy arrays are reduced with vectorised operations; other iterables
+        are consumed chunk by chunk, so generators of any length work.
+
+        Args:
+            values: Iterable of numbers (or a numeric NumPy array)
+
+        Raises:
+            TypeError: If a value is not a number
+        """
+        if NUMPY_AVAILABLE and isinstance(values, np.ndarray):
+            self._update_array(values.ravel())
+            return
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, CHUNK_SIZE))
+            if not chunk:
+                return
+            self._update_chunk(chunk)
+
+    def _update_chunk(self, chunk):
+        if set(map(type, chunk)) <= _NUMBER_TYPES:
+            floats = chunk
+        else:
+            # Other number types (Decimal, Fraction, NumPy scalars) get
+            # float copies for the variance and the quantile sample
+            floats = [_as_float(value) for value in chunk]
+        # Exact two-pass statistics for the chunk, merged with Chan's formula
+        part = StreamingStats(self.sample_size)
+        part.count = len(chunk)
+        part.total = sum(chunk)
+        part.min = min(chunk)
+        part.max = max(chunk)
+        part._mean = math.fsum(floats) / part.count
+        mean = part._mean
+        part._m2 = math.fsum((x - mean) * (x - mean) for x in floats)
+        tags = [self._random.random() for _ in chunk]
+        if len(chunk) > self.sample_size:
+            part._sample = [(-tag, value) for tag, value in
+                            heapq.nsmallest(self.sample_size, zip(tags, floats), key=lambda pair: pair[0])]
+        else:
+            part._sample = [(-tag, value) for tag, value in zip(tags, floats)]
+        heapq.heapify(part._sample)
+        self.merge(part)
+
+    def _update_array(self, arr):
+        if arr.size == 0:
+            return
+        if arr.dtype.kind not in "biuf":
+            raise TypeError(f"StreamingStats accepts numbers only, got dtype {arr.dtype}")
+        part = StreamingStats(self.sample_size)
+        part.count = int(arr.size)
+        part.total = arr.sum().item()
+        part.min = arr.min().item()
+        part.max = arr.max().item()
+        values = arr.astype(np.float64)
+        part._mean = float(values.mean())
+        part._m2 = float(((values - part._mean) ** 2).sum())
+        tags = np.random.default_rng(self._random.getrandbits(64)).random(arr.size)
+        if arr.size > self.sample_size:
+            keep = np.argpartition(tags, self.sample_size - 1)[:self.sample_size]
+        else:
+            keep = np.arange(arr.size)
+        part._sample = [(-tag, value) for tag, value in zip(tags[keep].tolist(), arr[keep].tolist())]
+        heapq.heapify(part._sample)
+        self.merge(part)
+
+    def merge(self, other):
+        """
+        Fold another accumulator into this one and return self.
+
+        Args:
+            other: StreamingStats computed over a disjoint part of the data
+        """
+        if other.count == 0:
+            return self
+        if other.sample_size < self.sample_size:
+            # A bottom-k sample cannot be grown, only cut down to the smaller k
+            self.sample_size = other.sample_size
+            while len(self._sample) > self.sample_size:
+                heapq.heappop(self._sample)
+        if self.count == 0:
+            self.count, self.total = other.count, other.total
+            self.min, self.max = other.min, other.max
+            self._mean, self._m2 = other._mean, other._m2
+        else:
+            count = self.count + other.count
+            delta = other._mean - self._mean
+            self._m2 += other._m2 + delta * delta * self.count * other.count / count
+            self._mean += delta * other.count / count
+            self.count = count
+            self.total += other.total
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        for neg_tag, value in other._sample:
+            self._offer(-neg_tag, value)
+        return self
+
+    @classmethod
+    def combine(cls, parts):
+        """Return a new accumulator equal to merging all parts."""
+        parts = list(parts)
+        result = cls(max((part.sample_size for part in parts), default=DEFAULT_SAMPLE_SIZE))
+        for part in parts:
+            result.merge(part)
+        return result
+
+    def _require_data(self, what):
+        if self.count == 0:
+            raise ValueError(f"Cannot calculate {what} of empty data")
+
+    @property
+    def mean(self):
+        """Arithmetic mean, computed as sum / count like calculate_average."""
+        self._require_data("average")
+        return self.total / self.count
+
+    @property
+    def variance(self):
+        """Population variance (divides by count)."""
+        self._require_data("variance")
+        return self._m2 / self.count
+
+    @property
+    def sample_variance(self):
+        """Sample variance (divides by count - 1)."""
+        if self.count < 2:
+            raise ValueError("Sample variance needs at least two values")
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stdev(self):
+        """Population standard deviation."""
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        """
+        Estimate the q-quantile (0 <= q <= 1) by linear interpolation.
+
+        Exact while count <= sample_size, otherwise estimated from the
+        uniform sample.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        self._require_data("quantiles")
+        values = sorted(value for _, value in self._sample)
+        position = q * (len(values) - 1)
+        lower = math.floor(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    def quantiles(self, qs=DEFAULT_QUANTILES):
+        return {q: self.quantile(q) for q in qs}
+
+    def as_dict(self, qs=DEFAULT_QUANTILES):
+        """All statistics in one dictionary (empty data gives only the count)."""
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "variance": self.variance,
+            "stdev": self.stdev,
+            "min": self.min,
+            "max": self.max,
+            "quantiles": self.quantiles(qs),
+        }
+
+    def __repr__(self):
+        if self.count == 0:
+            return "StreamingStats(count=0)"
+        return (f"StreamingStats(count={self.count}, mean={float(self.mean):.6g}, "
+                f"stdev={self.stdev:.6g}, min={self.min}, max={self.max})")
+
+
+def _stats_for_chunk(args):
+    chunk, sample_size, seed = args
+    stats = StreamingStats(sample_size, seed)
+    stats.update(chunk)
+    return stats
+
+
+def parallel_stats(values, chunk_size=1_000_000, workers=None, sample_size=DEFAULT_SAMPLE_SIZE):
+    """
+    Compute StreamingStats over values with one process per chunk.
+
+    Chunks are read lazily from the iterable: at most 2 * workers chunks are
+    in flight at once, and a new one is only read when a worker's
+    accumulator has been merged, so memory stays bounded for inputs of any
+    length.
+
+    Args:
+        values: Iterable of numbers
+        chunk_size: Numbers sent to a worker at a time
+        workers: Number of processes (default: CPU count)
+        sample_size: Quantile sample size of the result
+
+    Returns:
+        StreamingStats for all values
+    """
+    iterator = iter(values)
+    chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+    seeds = random.Random()
+    tasks = ((chunk, sample_size, seeds.getrandbits(64)) for chunk in chunks)
+    workers = workers or os.cpu_count() or 1
+    result = StreamingStats(sample_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for task in tasks:
+            pending.add(pool.submit(_stats_for_chunk, task))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result.merge(future.result())
+        for future in pending:
+            result.merge(future.result())
+    return result
+
+
+if __name__ == "__main__":
+    import statistics
+    import time
+
+    scores = [85, 92, 78, 96, 88, 90]
+    stats = StreamingStats()
+    stats.update(scores)
+    print(stats)
+    print("Quartiles:", stats.quantiles())
+
+    data = [random.gauss(50, 10) for _ in range(1_000_000)]
+
+    start = time.perf_counter()
+    three_pass = (sum(data) / len(data), max(data), min(data), statistics.pvariance(data))
+    print(f"\nsum/max/min/statistics.pvariance: {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    one_pass = StreamingStats()
+    one_pass.update(x for x in data)
+    print(f"StreamingStats.update (generator): {time.perf_counter() - start:.3f}s")
+
+    halves = [StreamingStats(), StreamingStats()]
+    halves[0].update(data[:400_000])
+    halves[1].update(data[400_000:])
+    merged = StreamingStats.combine(halves)
+    print(f"merged halves agree: mean {math.isclose(merged.mean, three_pass[0])}, "
+          f"variance {math.isclose(merged.variance, three_pass[3])}")
+    print(f"median estimate {one_pass.quantile(0.5):.3f} vs exact {statistics.median(data):.3f}")
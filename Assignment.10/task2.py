@@ -1,3 +1,6 @@
+from set_operations import intersect_many
+
+
 def find_common(a, b):
     """
     Find common elements between two lists using set intersection.
@@ -7,9 +10,9 @@ def find_common(a, b):
         b: Second list
     
     Returns:
-        List of common elements
+        List of common elements, in the order they first appear in a
     """
-    return list(set(a) & set(b))
+    return intersect_many(a, b)
 
 
 # Test the function
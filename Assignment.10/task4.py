@@ -1,3 +1,6 @@
+from streaming_stats import StreamingStats
+
+
 def calculate_average(scores):
     """
     Calculate the average of a list of scores.
@@ -49,19 +52,21 @@ def find_lowest(scores):
 
 def process_scores(scores):
     """
-    Process a list of scores and display statistics.
+    Process scores and display statistics.
+
+    Makes a single pass, so scores may be any iterable (including a
+    generator or a file too large to load); see streaming_stats.
     Args:
-        scores (list): List of numeric scores
+        scores (iterable): Numeric scores
     """
-    if not scores:
+    stats = StreamingStats()
+    stats.update(scores)
+    if not stats.count:
         print("No scores to process")
         return
-    avg = calculate_average(scores)
-    highest = find_highest(scores)
-    lowest = find_lowest(scores)
-    print("Average:", avg)
-    print("Highest:", highest)
-    print("Lowest:", lowest)
+    print("Average:", stats.mean)
+    print("Highest:", stats.max)
+    print("Lowest:", stats.min)
 
 # Test the functions
 if __name__ == "__main__":
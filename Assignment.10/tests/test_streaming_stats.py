@@ -0,0 +1,46 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from streaming_stats import StreamingStats
+from task4 import process_scores
+
+
+def test_decimal_scores_keep_decimal_results(capsys):
+    process_scores([Decimal('1.5'), Decimal('2')])
+    assert capsys.readouterr().out.splitlines() == ["Average: 1.75", "Highest: 2", "Lowest: 1.5"]
+
+
+def test_fraction_scores():
+    stats = StreamingStats()
+    stats.update([Fraction(1, 3), Fraction(2, 3), Fraction(1, 1)])
+    assert stats.mean == Fraction(2, 3)
+    assert stats.min == Fraction(1, 3)
+    assert stats.variance == pytest.approx(2 / 27)
+
+
+def test_add_accepts_non_float_numbers():
+    stats = StreamingStats()
+    for value in (Fraction(5, 2), Fraction(1, 2), 3):
+        stats.add(value)
+    assert stats.count == 3
+    assert stats.max == 3
+    assert stats.quantile(0.5) == pytest.approx(2.5)
+
+
+def test_numpy_integer_scalars():
+    np = pytest.importorskip("numpy")
+    stats = StreamingStats()
+    stats.update([np.int64(4), np.int64(8), np.int64(6)])
+    assert stats.mean == 6
+    assert stats.min == 4 and stats.max == 8
+    assert stats.stdev == pytest.approx((8 / 3) ** 0.5)
+
+
+@pytest.mark.parametrize("bad", ["7", 1 + 2j, None])
+def test_non_numbers_rejected(bad):
+    with pytest.raises(TypeError):
+        StreamingStats().update([1, bad])
+    with pytest.raises(TypeError):
+        StreamingStats().add(bad)
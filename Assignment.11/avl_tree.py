@@ -0,0 +1,231 @@
+import random
+import sys
+import time
+
+
+class AVLNode:
+    __slots__ = ("value", "left", "right", "height")
+
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _update(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class AVLTree:
+    """Self-balancing binary search tree with the BinarySearchTree interface.
+
+    Height stays O(log n) for any insertion order (including sorted input),
+    so insert, search and delete are O(log n). Like BinarySearchTree,
+    duplicate values are allowed and go to the right subtree.
+    """
+
+    def __init__(self):
+        self.root = None
+        self._size = 0
+
+    @classmethod
+    def from_sorted(cls, values):
+        """Build a perfectly balanced tree from already-sorted values in O(n)."""
+        values = list(values)
+
+        def build(lo, hi):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = AVLNode(values[mid])
+            node.left = build(lo, mid)
+            node.right = build(mid + 1, hi)
+            _update(node)
+            return node
+
+        tree = cls()
+        tree.root = build(0, len(values))
+        tree._size = len(values)
+        return tree
+
+    def insert(self, value):
+        def insert_at(node):
+            if node is None:
+                return AVLNode(value)
+            if value < node.value:
+                node.left = insert_at(node.left)
+            else:
+                node.right = insert_at(node.right)
+            return _rebalance(node)
+
+        self.root = insert_at(self.root)
+        self._size += 1
+
+    def delete(self, value):
+        """Remove one occurrence of value; raise KeyError if it is absent."""
+        def delete_at(node):
+            if node is None:
+                raise KeyError(value)
+            if value < node.value:
+                node.left = delete_at(node.left)
+            elif node.value < value:
+                node.right = delete_at(node.right)
+            else:
+                if node.left is None:
+                    return node.right
+                if node.right is None:
+                    return node.left
+                # Replace with the in-order successor, then remove that
+                successor = node.right
+                while successor.left is not None:
+                    successor = successor.left
+                node.value = successor.value
+                node.right = delete_min(node.right)
+            return _rebalance(node)
+
+        def delete_min(node):
+            if node.left is None:
+                return node.right
+            node.left = delete_min(node.left)
+            return _rebalance(node)
+
+        self.root = delete_at(self.root)
+        self._size -= 1
+
+    def search(self, value):
+        current = self.root
+        while current is not None:
+            if value < current.value:
+                current = current.left
+            elif current.value < value:
+                current = current.right
+            else:
+                return True
+        return False
+
+    def range_query(self, low, high):
+        """Return the values v with low <= v <= high, in sorted order."""
+        return list(self.iter_range(low, high))
+
+    def iter_range(self, low, high):
+        # In-order walk that skips subtrees lying entirely outside [low, high]
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                if current.value < low:
+                    current = current.right
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            current = stack.pop()
+            if high < current.value:
+                return
+            yield current.value
+            current = current.right
+
+    def inorder_traversal(self):
+        return list(self)
+
+    def __iter__(self):
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.value
+            current = current.right
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def __len__(self):
+        return self._size
+
+    def height(self):
+        return _height(self.root)
+
+
+def benchmark(n=100_000, bst_limit=5_000):
+    from task4 import BinarySearchTree
+
+    keys = list(range(n))
+    shuffled = keys[:]
+    random.shuffle(shuffled)
+
+    def timed(label, func):
+        start = time.perf_counter()
+        result = func()
+        print(f"  {label:<40} {time.perf_counter() - start:8.3f}s")
+        return result
+
+    print(f"n = {n:,}")
+    for order, data in (("random", shuffled), ("sorted", keys)):
+        tree = AVLTree()
+        timed(f"AVLTree insert ({order})", lambda: [tree.insert(k) for k in data])
+        print(f"    height {tree.height()}")
+        timed(f"AVLTree search all ({order})", lambda: [tree.search(k) for k in data])
+
+        m = n if order == "random" else min(n, bst_limit)
+        bst = BinarySearchTree()
+        timed(f"BinarySearchTree insert ({order}, n={m:,})", lambda: [bst.insert(k) for k in data[:m]])
+
+    tree = timed("AVLTree.from_sorted", lambda: AVLTree.from_sorted(keys))
+    timed("iterate in order", lambda: sum(1 for _ in tree))
+    timed("range_query over 1% of keys", lambda: tree.range_query(n // 2, n // 2 + n // 100))
+    timed("delete half the keys", lambda: [tree.delete(k) for k in shuffled[: n // 2]])
+
+
+if __name__ == "__main__":
+    tree = AVLTree()
+    for number in [50, 30, 70, 20, 40, 60, 80]:
+        tree.insert(number)
+
+    print("Inorder traversal:", tree.inorder_traversal())
+    print("Range 25..65:", tree.range_query(25, 65))
+    tree.delete(30)
+    print("After deleting 30:", tree.inorder_traversal(), "height", tree.height())
+    print()
+
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
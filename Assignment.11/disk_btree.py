@@ -0,0 +1,404 @@
+import array
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+from bisect import bisect_left, bisect_right, insort_right
+from collections import OrderedDict
+
+# Page 0 holds the file header; every other page holds one tree node
+HEADER = struct.Struct("<8sIqqqq")  # magic, page_size, root, page_count, size, height
+MAGIC = b"BPTREE01"
+
+# Node page layout: is_leaf (H), key count (H), next leaf page (q), padding
+NODE_HEADER = struct.Struct("<HHq")
+NODE_HEADER_SIZE = 16
+
+KEY_SIZE = 8
+KEY_MIN, KEY_MAX = -2 ** 63, 2 ** 63 - 1
+
+DEFAULT_PAGE_SIZE = 4096
+DEFAULT_CACHE_PAGES = 1024
+
+
+def _pack(values):
+    # Pages are little-endian on every platform so files stay portable
+    packed = array.array("q", values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack(data):
+    values = array.array("q")
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tolist()
+
+
+class BTreeNode:
+    __slots__ = ("page", "is_leaf", "keys", "children", "next", "dirty")
+
+    def __init__(self, page, is_leaf, keys=None, children=None, next_leaf=0):
+        self.page = page
+        self.is_leaf = is_leaf
+        self.keys = keys if keys is not None else []
+        self.children = children if children is not None else []
+        self.next = next_leaf
+        self.dirty = True
+
+
+class DiskBPlusTree:
+    """Persistent B+tree of signed 64-bit integer keys stored in one file.
+
+    Offers the insert/inorder_traversal interface of BinarySearchTree plus
+    search, range_scan and bulk_load. Duplicate keys are allowed, as in
+    BinarySearchTree. The file is memory-mapped and only the pages being
+    touched are decoded, into an LRU cache of at most cache_pages nodes, so
+    RAM stays bounded however many keys the file holds. Reopening an
+    existing file only reads its header.
+
+    Call flush() (or close(), or use the tree as a context manager) to make
+    changes durable; modified pages otherwise live in the cache until they
+    are evicted.
+    """
+
+    def __init__(self, path, page_size=DEFAULT_PAGE_SIZE, cache_pages=DEFAULT_CACHE_PAGES):
+        if cache_pages < 8:
+            raise ValueError("cache_pages must be at least 8")
+        self.path = path
+        self._cache = OrderedDict()
+        self._cache_pages = cache_pages
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            magic, page_size, root, page_count, size, height = HEADER.unpack(self._file.read(HEADER.size))
+            if magic != MAGIC:
+                self._file.close()
+                raise ValueError(f"{path} is not a B+tree file")
+            self._set_page_size(page_size)
+            self._root, self._page_count, self._size, self._height = root, page_count, size, height
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        else:
+            if page_size < 64 or page_size % KEY_SIZE:
+                raise ValueError("page_size must be a multiple of 8 and at least 64")
+            self._set_page_size(page_size)
+            self._page_count = 1
+            self._file.truncate(page_size * 16)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+            self._root = self._new_node(is_leaf=True).page
+            self._size = 0
+            self._height = 1
+            self._write_header()
+
+    def _set_page_size(self, page_size):
+        self.page_size = page_size
+        self.leaf_capacity = (page_size - NODE_HEADER_SIZE) // KEY_SIZE
+        # An internal node holds n keys and n + 1 child page numbers
+        self.internal_capacity = (page_size - NODE_HEADER_SIZE - KEY_SIZE) // (2 * KEY_SIZE)
+        self._children_offset = NODE_HEADER_SIZE + self.internal_capacity * KEY_SIZE
+
+    # ------------------------------------------------------------- pages ---
+
+    def _allocate(self):
+        page = self._page_count
+        self._page_count += 1
+        needed = self._page_count * self.page_size
+        if needed > len(self._map):
+            # Grow geometrically so remapping stays rare
+            new_size = max(needed, 2 * len(self._map))
+            self._map.close()
+            self._file.truncate(new_size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        return page
+
+    def _new_node(self, is_leaf, keys=None, children=None, next_leaf=0):
+        node = BTreeNode(self._allocate(), is_leaf, keys, children, next_leaf)
+        self._cache_put(node)
+        return node
+
+    def _read(self, page):
+        node = self._cache.get(page)
+        if node is not None:
+            self._cache.move_to_end(page)
+            return node
+        offset = page * self.page_size
+        is_leaf, count, next_leaf = NODE_HEADER.unpack_from(self._map, offset)
+        start = offset + NODE_HEADER_SIZE
+        keys = _unpack(self._map[start:start + count * KEY_SIZE])
+        children = []
+        if not is_leaf:
+            start = offset + self._children_offset
+            children = _unpack(self._map[start:start + (count + 1) * KEY_SIZE])
+        node = BTreeNode(page, bool(is_leaf), keys, children, next_leaf)
+        node.dirty = False
+        self._cache_put(node)
+        return node
+
+    def _mark_dirty(self, node):
+        # Re-add the node in case it was evicted while the caller held it
+        node.dirty = True
+        self._cache_put(node)
+
+    def _cache_put(self, node):
+        self._cache[node.page] = node
+        self._cache.move_to_end(node.page)
+        while len(self._cache) > self._cache_pages:
+            _, evicted = self._cache.popitem(last=False)
+            if evicted.dirty:
+                self._write_node(evicted)
+
+    def _write_node(self, node):
+        offset = node.page * self.page_size
+        NODE_HEADER.pack_into(self._map, offset, int(node.is_leaf), len(node.keys), node.next)
+        start = offset + NODE_HEADER_SIZE
+        self._map[start:start + len(node.keys) * KEY_SIZE] = _pack(node.keys)
+        if not node.is_leaf:
+            start = offset + self._children_offset
+            self._map[start:start + len(node.children) * KEY_SIZE] = _pack(node.children)
+        node.dirty = False
+
+    def _write_header(self):
+        HEADER.pack_into(self._map, 0, MAGIC, self.page_size, self._root,
+                         self._page_count, self._size, self._height)
+
+    # ---------------------------------------------------------- mutation ---
+
+    def insert(self, key):
+        if not isinstance(key, int):
+            raise TypeError(f"keys must be integers, got {key!r}")
+        if not KEY_MIN <= key <= KEY_MAX:
+            raise OverflowError("key does not fit in a signed 64-bit integer")
+
+        path = []
+        node = self._read(self._root)
+        while not node.is_leaf:
+            index = bisect_right(node.keys, key)
+            path.append((node, index))
+            node = self._read(node.children[index])
+
+        insort_right(node.keys, key)
+        self._mark_dirty(node)
+        self._size += 1
+        if len(node.keys) <= self.leaf_capacity:
+            return
+
+        separator, right = self._split_leaf(node)
+        while path:
+            parent, index = path.pop()
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, right.page)
+            self._mark_dirty(parent)
+            if len(parent.keys) <= self.internal_capacity:
+                return
+            separator, right = self._split_internal(parent)
+
+        root = self._new_node(is_leaf=False, keys=[separator], children=[self._root, right.page])
+        self._root = root.page
+        self._height += 1
+
+    def _split_leaf(self, node):
+        middle = len(node.keys) // 2
+        right = self._new_node(is_leaf=True, keys=node.keys[middle:], next_leaf=node.next)
+        del node.keys[middle:]
+        node.next = right.page
+        self._mark_dirty(node)
+        return right.keys[0], right
+
+    def _split_internal(self, node):
+        middle = len(node.keys) // 2
+        separator = node.keys[middle]
+        right = self._new_node(is_leaf=False, keys=node.keys[middle + 1:],
+                               children=node.children[middle + 1:])
+        del node.keys[middle:]
+        del node.children[middle + 1:]
+        self._mark_dirty(node)
+        return separator, right
+
+    def bulk_load(self, sorted_keys):
+        """Build the tree from keys in ascending order, writing each page once.
+
+        Much faster than repeated insert() for large inputs because leaves
+        are filled left to right and never split. The tree must be empty.
+        """
+        if self._size:
+            raise ValueError("bulk_load requires an empty tree")
+        # Check every key before the first page is allocated, so bad input
+        # cannot leave a half-written index behind
+        sorted_keys = list(sorted_keys)
+        last_key = None
+        for key in sorted_keys:
+            if not isinstance(key, int):
+                raise TypeError(f"keys must be integers, got {key!r}")
+            if not KEY_MIN <= key <= KEY_MAX:
+                raise OverflowError("key does not fit in a signed 64-bit integer")
+            if last_key is not None and key < last_key:
+                raise ValueError("bulk_load requires keys in ascending order")
+            last_key = key
+
+        level = []  # (first key, page) of every node on the level being built
+        keys = []
+        previous_leaf = None
+
+        def emit_leaf():
+            nonlocal previous_leaf
+            leaf = self._new_node(is_leaf=True, keys=keys[:])
+            if previous_leaf is not None:
+                previous_leaf.next = leaf.page
+                self._mark_dirty(previous_leaf)
+            previous_leaf = leaf
+            level.append((keys[0], leaf.page))
+
+        count = 0
+        for key in sorted_keys:
+            keys.append(key)
+            count += 1
+            if len(keys) == self.leaf_capacity:
+                emit_leaf()
+                keys.clear()
+        if keys:
+            emit_leaf()
+        if not level:
+            return
+
+        # The empty root leaf created by __init__ is simply abandoned
+        height = 1
+        fanout = self.internal_capacity + 1
+        while len(level) > 1:
+            groups = [level[i:i + fanout] for i in range(0, len(level), fanout)]
+            if len(groups) > 1 and len(groups[-1]) == 1:
+                # Never leave an internal node with a single child
+                groups[-1].insert(0, groups[-2].pop())
+            level = []
+            for group in groups:
+                node = self._new_node(is_leaf=False, keys=[first for first, _ in group[1:]],
+                                      children=[page for _, page in group])
+                level.append((group[0][0], node.page))
+            height += 1
+
+        self._root = level[0][1]
+        self._height = height
+        self._size = count
+
+    # ------------------------------------------------------------ queries ---
+
+    def search(self, key):
+        for _ in self.range_scan(key, key):
+            return True
+        return False
+
+    def range_scan(self, low=None, high=None):
+        """Yield keys with low <= key <= high in ascending order (None = unbounded)."""
+        node = self._read(self._root)
+        while not node.is_leaf:
+            index = 0 if low is None else bisect_left(node.keys, low)
+            node = self._read(node.children[index])
+
+        index = 0 if low is None else bisect_left(node.keys, low)
+        while True:
+            keys = node.keys
+            for position in range(index, len(keys)):
+                key = keys[position]
+                if high is not None and key > high:
+                    return
+                yield key
+            if not node.next:
+                return
+            node = self._read(node.next)
+            index = 0
+
+    def range_query(self, low, high):
+        return list(self.range_scan(low, high))
+
+    def inorder_traversal(self):
+        return list(self.range_scan())
+
+    def __iter__(self):
+        return self.range_scan()
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __len__(self):
+        return self._size
+
+    def height(self):
+        return self._height
+
+    # ------------------------------------------------------------ lifecycle ---
+
+    def flush(self):
+        for node in self._cache.values():
+            if node.dirty:
+                self._write_node(node)
+        self._write_header()
+        self._map.flush()
+
+    def close(self):
+        if self._map.closed:
+            return
+        self.flush()
+        self._cache.clear()
+        self._map.close()
+        self._file.truncate(self._page_count * self.page_size)
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def benchmark(n=200_000, bulk_n=2_000_000):
+    from task4 import BinarySearchTree
+
+    keys = random.sample(range(n * 10), n)
+
+    def timed(label, func):
+        start = time.perf_counter()
+        result = func()
+        print(f"  {label:<45} {time.perf_counter() - start:8.3f}s")
+        return result
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "random.bpt")
+        print(f"Random inserts, n = {n:,}")
+        bst = BinarySearchTree()
+        timed("BinarySearchTree insert (in memory)", lambda: [bst.insert(k) for k in keys])
+        with DiskBPlusTree(path) as tree:
+            timed("DiskBPlusTree insert", lambda: [tree.insert(k) for k in keys])
+            timed("DiskBPlusTree flush", tree.flush)
+        print(f"    file size {os.path.getsize(path) / 2**20:.1f} MiB")
+
+        path = os.path.join(directory, "bulk.bpt")
+        print(f"\nBulk load of {bulk_n:,} sorted keys")
+        with DiskBPlusTree(path) as tree:
+            timed("DiskBPlusTree.bulk_load", lambda: tree.bulk_load(range(0, 2 * bulk_n, 2)))
+        print(f"    file size {os.path.getsize(path) / 2**20:.1f} MiB")
+
+        tree = timed("reopen (maps the file, reads the header)", lambda: DiskBPlusTree(path, cache_pages=64))
+        print(f"    {len(tree):,} keys, height {tree.height()}")
+        probes = random.sample(range(2 * bulk_n), 10_000)
+        timed("10,000 searches (64-page cache)", lambda: [tree.search(k) for k in probes])
+        timed("range scan of 1% of the keys", lambda: tree.range_query(bulk_n, bulk_n + bulk_n // 50))
+        tree.close()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "demo.bpt")
+        with DiskBPlusTree(path) as tree:
+            for number in [50, 30, 70, 20, 40, 60, 80]:
+                tree.insert(number)
+        with DiskBPlusTree(path) as tree:
+            print("Inorder traversal after reopening:", tree.inorder_traversal())
+            print("Range 25..65:", tree.range_query(25, 65))
+    print()
+
+    benchmark()
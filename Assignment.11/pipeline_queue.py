@@ -0,0 +1,239 @@
+import queue
+import threading
+import time
+from collections import deque
+
+from task2 import Queue
+
+
+class PipelineQueue(Queue):
+    """Queue for multi-producer / multi-consumer thread pipelines.
+
+    Producers never take a lock: deque.append and deque.popleft are atomic
+    in CPython, so enqueue() is one append plus a check whether any consumer
+    is asleep. Consumers drain in batches with dequeue_many(), paying for
+    the condition variable once per batch rather than once per item, and
+    only when the queue is empty.
+
+    close() wakes every waiting consumer; after it, dequeue_many() returns
+    the remaining items and then [] immediately, so consumer loops can stop
+    on `not batch and q.closed`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._sleepers = 0
+        self._closed = False
+
+        # Metrics; consumer-side counters are updated under _lock once per batch
+        self._max_depth = 0
+        self._dequeued = 0
+        self._batches = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def enqueue(self, item):
+        if self._closed:
+            raise ValueError("enqueue on closed queue")
+        self._items.append(item)
+        self._after_put()
+
+    def enqueue_many(self, items):
+        if self._closed:
+            raise ValueError("enqueue on closed queue")
+        self._items.extend(items)
+        self._after_put()
+
+    def _after_put(self):
+        depth = len(self._items)
+        if depth > self._max_depth:
+            self._max_depth = depth  # approximate under contention
+        # A consumer registers in _sleepers before re-checking the deque, so
+        # if it is not registered yet it will still see the item just added
+        if self._sleepers:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def dequeue(self):
+        try:
+            item = self._items.popleft()
+        except IndexError:
+            raise IndexError("dequeue from empty queue") from None
+        with self._lock:
+            self._dequeued += 1
+        return item
+
+    def dequeue_many(self, max_n, timeout=None):
+        """Remove and return up to max_n items, oldest first.
+
+        Blocks until at least one item is available, the queue is closed, or
+        timeout seconds pass (None waits forever, 0 never waits); returns []
+        in the last two cases.
+        """
+        if max_n < 1:
+            raise ValueError("max_n must be a positive integer")
+        items = self._items
+        popleft = items.popleft
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if not items:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not self._wait(remaining):
+                    return []
+
+            batch = []
+            try:
+                for _ in range(max_n):
+                    batch.append(popleft())
+            except IndexError:
+                pass  # another consumer drained the rest
+            if batch:
+                with self._lock:
+                    self._dequeued += len(batch)
+                    self._batches += 1
+                return batch
+            # Another consumer emptied the deque after the wait: wait again
+            # for the rest of the timeout rather than return a false []
+
+    def _wait(self, timeout):
+        """Sleep until the queue is non-empty; False on timeout or close."""
+        if timeout is not None and timeout <= 0:
+            return bool(self._items)
+        start = time.perf_counter()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._not_empty:
+            self._sleepers += 1
+            self._waits += 1
+            try:
+                while not self._items:
+                    if self._closed:
+                        return False
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self._timeouts += 1
+                        return False
+                    self._not_empty.wait(remaining)
+                if len(self._items) > 1:
+                    # Let another sleeper start on what this batch may leave
+                    self._not_empty.notify()
+                return True
+            finally:
+                self._sleepers -= 1
+                self._wait_seconds += time.perf_counter() - start
+
+    def close(self):
+        with self._not_empty:
+            self._closed = True
+            self._not_empty.notify_all()
+
+    def __len__(self):
+        return len(self._items)
+
+    def metrics(self):
+        """Snapshot of queue depth and consumer batch/wait statistics."""
+        with self._lock:
+            return {
+                "depth": len(self._items),
+                "max_depth": self._max_depth,
+                "dequeued": self._dequeued,
+                "batches": self._batches,
+                "mean_batch_size": self._dequeued / self._batches if self._batches else 0.0,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "wait_seconds": self._wait_seconds,
+                "mean_wait_seconds": self._wait_seconds / self._waits if self._waits else 0.0,
+            }
+
+
+def _run_pipeline(producers, consumers, items_per_producer, make_queue, produce, consume):
+    q = make_queue()
+    counts = [0] * consumers
+
+    def producer():
+        produce(q, items_per_producer)
+
+    def consumer(slot):
+        counts[slot] = consume(q)
+
+    producer_threads = [threading.Thread(target=producer) for _ in range(producers)]
+    consumer_threads = [threading.Thread(target=consumer, args=(i,)) for i in range(consumers)]
+    start = time.perf_counter()
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    if isinstance(q, PipelineQueue):
+        q.close()
+    else:
+        for _ in range(consumers):
+            q.put(None)
+    for thread in consumer_threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    assert sum(counts) == producers * items_per_producer
+    return q, seconds
+
+
+def benchmark(producers=8, consumers=8, items_per_producer=50_000, batch_size=256):
+    def produce_std(q, n):
+        put = q.put
+        for i in range(n):
+            put(i)
+
+    def consume_std(q):
+        get = q.get
+        count = 0
+        while get() is not None:
+            count += 1
+        return count
+
+    def produce_pipeline(q, n):
+        enqueue = q.enqueue
+        for i in range(n):
+            enqueue(i)
+
+    def produce_pipeline_bulk(q, n):
+        for start in range(0, n, batch_size):
+            q.enqueue_many(range(start, min(start + batch_size, n)))
+
+    def consume_pipeline(q):
+        count = 0
+        while True:
+            batch = q.dequeue_many(batch_size)
+            if not batch and q.closed:
+                return count
+            count += len(batch)
+
+    total = producers * items_per_producer
+    print(f"{producers} producers, {consumers} consumers, {total:,} items")
+    for name, make_queue, produce, consume in [
+        ("queue.Queue put/get", queue.Queue, produce_std, consume_std),
+        (f"PipelineQueue enqueue/dequeue_many({batch_size})", PipelineQueue, produce_pipeline, consume_pipeline),
+        (f"PipelineQueue enqueue_many/dequeue_many({batch_size})", PipelineQueue, produce_pipeline_bulk,
+         consume_pipeline),
+    ]:
+        q, seconds = _run_pipeline(producers, consumers, items_per_producer, make_queue, produce, consume)
+        print(f"  {name:<52} {seconds:7.3f}s  {total / seconds:>12,.0f} items/s")
+        if isinstance(q, PipelineQueue):
+            stats = q.metrics()
+            print(f"    max depth {stats['max_depth']:,}, mean batch {stats['mean_batch_size']:.1f}, "
+                  f"{stats['waits']:,} waits averaging {stats['mean_wait_seconds'] * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    pipeline = PipelineQueue()
+    pipeline.enqueue_many(range(10))
+    print("First batch:", pipeline.dequeue_many(4))
+    print("Second batch:", pipeline.dequeue_many(100, timeout=0))
+    print("Empty queue with timeout:", pipeline.dequeue_many(10, timeout=0.05))
+    print("Metrics:", pipeline.metrics())
+    print()
+
+    benchmark()
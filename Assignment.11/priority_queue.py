@@ -0,0 +1,327 @@
+import heapq
+import queue
+import random
+import threading
+import time
+
+
+class IndexedPriorityQueue:
+    """Min-priority queue on a d-ary heap with an item -> position index.
+
+    Items must be hashable and unique; the index makes contains, remove and
+    decrease_key O(log n) instead of the O(n) search a plain heap needs.
+    d=2 is a binary heap; d=4 is usually faster in Python because the tree is
+    half as tall, so there are fewer swaps per push and pop.
+    """
+
+    def __init__(self, d=4):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self._d = d
+        self._items = []
+        self._priorities = []
+        self._index = {}
+
+    @classmethod
+    def from_pairs(cls, pairs, d=4):
+        """Build a queue from (item, priority) pairs in O(n) (bulk heapify)."""
+        heap = cls(d)
+        for item, priority in pairs:
+            if item in heap._index:
+                raise ValueError(f"duplicate item {item!r}")
+            heap._index[item] = len(heap._items)
+            heap._items.append(item)
+            heap._priorities.append(priority)
+        for position in range((len(heap._items) - 2) // d, -1, -1):
+            heap._sift_down(position)
+        return heap
+
+    def push(self, item, priority):
+        if item in self._index:
+            raise ValueError(f"item {item!r} is already queued; use change_priority")
+        position = len(self._items)
+        self._items.append(item)
+        self._priorities.append(priority)
+        self._index[item] = position
+        self._sift_up(position)
+
+    def pop(self):
+        """Remove and return (item, priority) with the smallest priority."""
+        if not self._items:
+            raise IndexError("pop from empty priority queue")
+        return self._remove_at(0)
+
+    def peek(self):
+        if not self._items:
+            raise IndexError("peek from empty priority queue")
+        return self._items[0], self._priorities[0]
+
+    def priority(self, item):
+        return self._priorities[self._index[item]]
+
+    def decrease_key(self, item, priority):
+        position = self._index[item]
+        if self._priorities[position] < priority:
+            raise ValueError("new priority is larger than the current one")
+        self._priorities[position] = priority
+        self._sift_up(position)
+
+    def change_priority(self, item, priority):
+        position = self._index[item]
+        old = self._priorities[position]
+        self._priorities[position] = priority
+        if priority < old:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def push_or_decrease(self, item, priority):
+        """Queue item, or lower its priority if it is queued with a larger one.
+
+        Returns True if the queue changed; this is the relaxation step of
+        Dijkstra's and Prim's algorithms.
+        """
+        position = self._index.get(item)
+        if position is None:
+            self.push(item, priority)
+            return True
+        if priority < self._priorities[position]:
+            self._priorities[position] = priority
+            self._sift_up(position)
+            return True
+        return False
+
+    def remove(self, item):
+        return self._remove_at(self._index[item])[1]
+
+    def is_empty(self):
+        return len(self._items) == 0
+
+    def __contains__(self, item):
+        return item in self._index
+
+    def __len__(self):
+        return len(self._items)
+
+    def _remove_at(self, position):
+        items, priorities = self._items, self._priorities
+        result = items[position], priorities[position]
+        del self._index[result[0]]
+        last_item, last_priority = items.pop(), priorities.pop()
+        if position < len(items):
+            items[position] = last_item
+            priorities[position] = last_priority
+            self._index[last_item] = position
+            if position and last_priority < priorities[(position - 1) // self._d]:
+                self._sift_up(position)
+            else:
+                self._sift_down(position)
+        return result
+
+    def _sift_up(self, position):
+        # Move the hole upwards and place the item once, instead of swapping
+        items, priorities, index, d = self._items, self._priorities, self._index, self._d
+        item, priority = items[position], priorities[position]
+        while position:
+            parent = (position - 1) // d
+            if not priority < priorities[parent]:
+                break
+            items[position] = items[parent]
+            priorities[position] = priorities[parent]
+            index[items[position]] = position
+            position = parent
+        items[position] = item
+        priorities[position] = priority
+        index[item] = position
+
+    def _sift_down(self, position):
+        items, priorities, index, d = self._items, self._priorities, self._index, self._d
+        size = len(items)
+        item, priority = items[position], priorities[position]
+        while True:
+            first = d * position + 1
+            if first >= size:
+                break
+            child = first
+            child_priority = priorities[first]
+            for candidate in range(first + 1, min(first + d, size)):
+                if priorities[candidate] < child_priority:
+                    child, child_priority = candidate, priorities[candidate]
+            if not child_priority < priority:
+                break
+            items[position] = items[child]
+            priorities[position] = child_priority
+            index[items[position]] = position
+            position = child
+        items[position] = item
+        priorities[position] = priority
+        index[item] = position
+
+
+class ThreadSafePriorityQueue:
+    """IndexedPriorityQueue guarded by a lock, with a blocking get().
+
+    get() waits while the queue is empty and raises queue.Empty on timeout,
+    like queue.PriorityQueue, but decrease_key and remove are also available.
+    """
+
+    def __init__(self, d=4):
+        self._heap = IndexedPriorityQueue(d)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def put(self, item, priority):
+        with self._not_empty:
+            self._heap.push(item, priority)
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        with self._not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._heap.is_empty():
+                if not block:
+                    raise queue.Empty
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._not_empty.wait(remaining)
+            return self._heap.pop()
+
+    def push(self, item, priority):
+        self.put(item, priority)
+
+    def pop(self):
+        with self._lock:
+            return self._heap.pop()
+
+    def peek(self):
+        with self._lock:
+            return self._heap.peek()
+
+    def decrease_key(self, item, priority):
+        with self._lock:
+            self._heap.decrease_key(item, priority)
+
+    def change_priority(self, item, priority):
+        with self._lock:
+            self._heap.change_priority(item, priority)
+
+    def remove(self, item):
+        with self._lock:
+            return self._heap.remove(item)
+
+    def is_empty(self):
+        with self._lock:
+            return self._heap.is_empty()
+
+    def __contains__(self, item):
+        with self._lock:
+            return item in self._heap
+
+    def __len__(self):
+        with self._lock:
+            return len(self._heap)
+
+
+def benchmark(n=200_000, k=100):
+    priorities = [random.random() for _ in range(n)]
+
+    def timed(label, func):
+        start = time.perf_counter()
+        func()
+        print(f"  {label:<45} {time.perf_counter() - start:8.3f}s")
+
+    def push_pop_heapq():
+        heap = []
+        for item, priority in enumerate(priorities):
+            heapq.heappush(heap, (priority, item))
+        while heap:
+            heapq.heappop(heap)
+
+    def push_pop_indexed(d):
+        def run():
+            heap = IndexedPriorityQueue(d)
+            for item, priority in enumerate(priorities):
+                heap.push(item, priority)
+            while heap:
+                heap.pop()
+        return run
+
+    def sort_everything():
+        sorted(zip(priorities, range(n)))
+
+    def top_k_repeated_sort():
+        # Anti-pattern: keep a list and re-sort it on every arrival
+        best = []
+        for priority in priorities[:n // 20]:
+            best.append(priority)
+            best.sort()
+            del best[k:]
+
+    def top_k_heapq():
+        heapq.nsmallest(k, priorities)
+
+    def top_k_indexed():
+        # Bounded max-heap of the k best, keyed by negated priority
+        heap = IndexedPriorityQueue()
+        for item, priority in enumerate(priorities):
+            if len(heap) < k:
+                heap.push(item, -priority)
+            elif -priority > heap.peek()[1]:
+                heap.pop()
+                heap.push(item, -priority)
+
+    # Dijkstra-style workload: many priority decreases on a fixed item set
+    updates = [(random.randrange(n // 10), random.random()) for _ in range(n)]
+
+    def decrease_heapq_lazy():
+        best = {}
+        heap = []
+        for item, priority in updates:
+            if priority < best.get(item, 2.0):
+                best[item] = priority
+                heapq.heappush(heap, (priority, item))
+        while heap:
+            priority, item = heapq.heappop(heap)
+            if best.get(item) == priority:
+                del best[item]
+
+    def decrease_indexed():
+        heap = IndexedPriorityQueue()
+        for item, priority in updates:
+            heap.push_or_decrease(item, priority)
+        while heap:
+            heap.pop()
+
+    print(f"n = {n:,}")
+    timed("heapq push + pop all", push_pop_heapq)
+    timed("IndexedPriorityQueue d=2 push + pop all", push_pop_indexed(2))
+    timed("IndexedPriorityQueue d=4 push + pop all", push_pop_indexed(4))
+    timed("sorted()", sort_everything)
+    timed("heapq.heapify", lambda: heapq.heapify([(p, i) for i, p in enumerate(priorities)]))
+    timed("IndexedPriorityQueue.from_pairs", lambda: IndexedPriorityQueue.from_pairs(enumerate(priorities)))
+    print(f"Top {k}:")
+    timed(f"append + sort per item ({n // 20:,} items)", top_k_repeated_sort)
+    timed("heapq.nsmallest", top_k_heapq)
+    timed("bounded IndexedPriorityQueue", top_k_indexed)
+    print(f"{n:,} priority updates on {n // 10:,} items:")
+    timed("heapq with lazy deletion", decrease_heapq_lazy)
+    timed("IndexedPriorityQueue.push_or_decrease", decrease_indexed)
+
+
+if __name__ == "__main__":
+    tasks = IndexedPriorityQueue()
+    for name, priority in [("write report", 3), ("fix bug", 1), ("review PR", 2), ("lunch", 5)]:
+        tasks.push(name, priority)
+    tasks.decrease_key("lunch", 0)
+    print("Tasks by priority:", [tasks.pop() for _ in range(len(tasks))])
+
+    shared = ThreadSafePriorityQueue()
+    consumer = threading.Thread(target=lambda: print("Consumer got:", [shared.get()[0] for _ in range(3)]))
+    consumer.start()
+    for priority, name in enumerate(["a", "b", "c"]):
+        shared.put(name, priority)
+    consumer.join()
+    print()
+
+    benchmark()
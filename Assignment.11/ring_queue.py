@@ -0,0 +1,212 @@
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+
+
+class RingBufferQueue:
+    """FIFO queue on a circular buffer: O(1) enqueue and dequeue.
+
+    With a capacity the buffer never grows and enqueue on a full queue
+    raises IndexError; without one it doubles when full.
+    """
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        self._capacity = capacity
+        self._buffer = [None] * (capacity or 8)
+        self._head = 0
+        self._size = 0
+
+    def enqueue(self, item):
+        if self._size == len(self._buffer):
+            if self._capacity is not None:
+                raise IndexError("enqueue to full queue")
+            self._grow()
+        self._buffer[(self._head + self._size) % len(self._buffer)] = item
+        self._size += 1
+
+    def dequeue(self):
+        if self._size == 0:
+            raise IndexError("dequeue from empty queue")
+        item = self._buffer[self._head]
+        self._buffer[self._head] = None  # drop the reference for the GC
+        self._head = (self._head + 1) % len(self._buffer)
+        self._size -= 1
+        return item
+
+    def peek(self):
+        if self._size == 0:
+            raise IndexError("peek from empty queue")
+        return self._buffer[self._head]
+
+    def is_empty(self):
+        return self._size == 0
+
+    def is_full(self):
+        return self._capacity is not None and self._size == self._capacity
+
+    def __len__(self):
+        return self._size
+
+    def _grow(self):
+        # Unroll the wrapped contents into a buffer twice the size
+        old = self._buffer
+        self._buffer = old[self._head:] + old[:self._head] + [None] * len(old)
+        self._head = 0
+
+
+class BlockingQueue:
+    """Thread-safe FIFO queue with blocking put/get and an optional capacity.
+
+    put() waits while the queue is full and get() waits while it is empty;
+    with a timeout they raise queue.Full / queue.Empty like queue.Queue.
+    """
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        self._capacity = capacity
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, item, block=True, timeout=None):
+        with self._not_full:
+            if self._capacity is not None:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while len(self._items) >= self._capacity:
+                    if not block:
+                        raise queue.Full
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise queue.Full
+                    self._not_full.wait(remaining)
+            self._items.append(item)
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        with self._not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self._items:
+                if not block:
+                    raise queue.Empty
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._not_empty.wait(remaining)
+            item = self._items.popleft()
+            self._not_full.notify()
+            return item
+
+    def enqueue(self, item):
+        self.put(item)
+
+    def dequeue(self):
+        return self.get()
+
+    def is_empty(self):
+        with self._lock:
+            return not self._items
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+
+class AsyncQueue:
+    """asyncio FIFO queue with the enqueue/dequeue interface of Queue.
+
+    Coroutines awaiting enqueue() on a full queue or dequeue() on an empty
+    one are suspended instead of blocking the event loop.
+    """
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        self._queue = asyncio.Queue(maxsize=capacity or 0)
+
+    async def enqueue(self, item):
+        await self._queue.put(item)
+
+    async def dequeue(self):
+        return await self._queue.get()
+
+    def is_empty(self):
+        return self._queue.empty()
+
+    def __len__(self):
+        return self._queue.qsize()
+
+
+class _ListQueue:
+    # The original list-backed Queue, kept only as the benchmark baseline
+    def __init__(self):
+        self._items = []
+
+    def enqueue(self, item):
+        self._items.append(item)
+
+    def dequeue(self):
+        if not self._items:
+            raise IndexError("dequeue from empty queue")
+        return self._items.pop(0)
+
+
+def benchmark(sizes=(10_000, 100_000, 200_000)):
+    from task2 import Queue
+
+    class _StdQueue(queue.Queue):
+        enqueue = queue.Queue.put_nowait
+        dequeue = queue.Queue.get_nowait
+
+    implementations = [
+        ("list.pop(0) (original)", _ListQueue),
+        ("Queue (deque)", Queue),
+        ("RingBufferQueue", RingBufferQueue),
+        ("BlockingQueue", BlockingQueue),
+        ("queue.Queue", _StdQueue),
+    ]
+
+    print(f"{'Implementation':<25}" + "".join(f"{n:>14,}" for n in sizes))
+    for name, cls in implementations:
+        row = f"{name:<25}"
+        for n in sizes:
+            q = cls()
+            start = time.perf_counter()
+            for i in range(n):
+                q.enqueue(i)
+            for _ in range(n):
+                q.dequeue()
+            row += f"{time.perf_counter() - start:>13.3f}s"
+        print(row)
+
+
+if __name__ == "__main__":
+    ring = RingBufferQueue(capacity=3)
+    for value in [1, 2, 3]:
+        ring.enqueue(value)
+    print("Ring buffer full?", ring.is_full())
+    print("Dequeued:", ring.dequeue(), ring.dequeue(), ring.dequeue())
+
+    blocking = BlockingQueue(capacity=2)
+    consumer = threading.Thread(target=lambda: print("Consumer got:", [blocking.get() for _ in range(5)]))
+    consumer.start()
+    for value in range(5):
+        blocking.put(value)
+    consumer.join()
+
+    async def demo_async():
+        q = AsyncQueue(capacity=1)
+        producer = asyncio.ensure_future(asyncio.gather(*(q.enqueue(i) for i in range(3))))
+        received = [await q.dequeue() for _ in range(3)]
+        await producer
+        print("Async consumer got:", received)
+
+    asyncio.run(demo_async())
+
+    print("\nEnqueue then drain n items:")
+    benchmark()
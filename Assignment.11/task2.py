@@ -1,7 +1,9 @@
+from collections import deque
+
 
 class Queue:
     def __init__(self):
-        self._items = []
+        self._items = deque()
 
     def enqueue(self, item):
         self._items.append(item)
@@ -9,7 +11,7 @@ class Queue:
     def dequeue(self):
         if self.is_empty():
             raise IndexError("dequeue from empty queue")
-        return self._items.pop(0)
+        return self._items.popleft()
 
     def is_empty(self):
         return len(self._items) == 0
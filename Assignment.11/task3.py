@@ -1,36 +1,69 @@
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 class SinglyLinkedList:
-    def __init__(self):
+    def __init__(self, iterable=None):
         self.head = None
+        self.tail = None
+        self._size = 0
+        if iterable is not None:
+            self.extend(iterable)
 
     def insert_at_beginning(self, data):
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self._size += 1
 
     def insert_at_end(self, data):
         new_node = Node(data)
         if self.head is None:
             self.head = new_node
-            return
-        current = self.head
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self._size += 1
 
-        while current.next:
-            current = current.next
-        current.next = new_node
+    def extend(self, iterable):
+        # Link the new nodes locally and touch the attributes only once
+        head = tail = None
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            if tail is None:
+                head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            count += 1
+        if head is None:
+            return
+        if self.head is None:
+            self.head = head
+        else:
+            self.tail.next = head
+        self.tail = tail
+        self._size += count
 
-    def display(self):
-        elements = []
+    def __iter__(self):
         current = self.head
-
         while current:
-            elements.append(str(current.data))
+            yield current.data
             current = current.next
-        return " -> ".join(elements) if elements else "List is empty"
+
+    def __len__(self):
+        return self._size
+
+    def display(self):
+        if self.head is None:
+            return "List is empty"
+        return " -> ".join(map(str, self))
 
 if __name__ == "__main__":
     linked_list = SinglyLinkedList()
@@ -45,4 +78,7 @@ if __name__ == "__main__":
     linked_list.insert_at_beginning(0)
     print("After inserting at beginning:", linked_list.display())
 
+    linked_list.extend([40, 50])
+    print("After extend:", linked_list.display(), f"(length {len(linked_list)})")
+
 
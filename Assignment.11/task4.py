@@ -27,17 +27,20 @@ class BinarySearchTree:
                 current = current.right
 
     def inorder_traversal(self):
-        result = []
+        return list(self)
 
-        def traverse(node):
-            if node is None:
-                return
-            traverse(node.left)
-            result.append(node.value)
-            traverse(node.right)
-
-        traverse(self.root)
-        return result
+    def __iter__(self):
+        # Explicit stack instead of recursion, so degenerate (sorted-input)
+        # trees cannot overflow the call stack
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.value
+            current = current.right
 
 
 if __name__ == "__main__":
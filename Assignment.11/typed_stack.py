@@ -0,0 +1,140 @@
+import array
+import importlib.util
+import os
+import time
+import tracemalloc
+
+
+class TypedStack:
+    """LIFO stack of machine numbers stored unboxed in an array.array.
+
+    typecode is any array module code ("q" for 64-bit ints, "d" for
+    doubles, ...). Each item costs its raw size (8 bytes for "q") instead
+    of a list slot plus a boxed Python object. Pushing a value the
+    typecode cannot hold raises TypeError or OverflowError, like array.
+    """
+
+    def __init__(self, typecode="q", items=()):
+        self._items = array.array(typecode, items)
+
+    @property
+    def typecode(self):
+        return self._items.typecode
+
+    def push(self, item):
+        self._items.append(item)
+
+    def push_many(self, items):
+        """Push every item, or none of them if any cannot be stored."""
+        # Converting first keeps a bad value from leaving a partial push
+        # behind. Only an array of the same typecode skips the per-item
+        # conversion and is appended as one memory block.
+        if not (isinstance(items, array.array) and items.typecode == self.typecode):
+            items = array.array(self.typecode, items)
+        self._items.extend(items)
+
+    def pop(self):
+        if not self._items:
+            raise IndexError("pop from empty stack")
+        return self._items.pop()
+
+    def pop_many(self, n):
+        """Pop n items and return them as a list, top of the stack first."""
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if n > len(self._items):
+            raise IndexError("pop_many from stack with too few items")
+        if n == 0:
+            return []
+        popped = self._items[-n:]
+        del self._items[-n:]
+        popped.reverse()
+        return popped.tolist()
+
+    def peek(self):
+        if not self._items:
+            raise IndexError("peek from empty stack")
+        return self._items[-1]
+
+    def is_empty(self):
+        return len(self._items) == 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+def _load_generic_stack():
+    # "task1 (1).py" is not a valid module name, so load it by path
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "task1 (1).py")
+    spec = importlib.util.spec_from_file_location("task1_stack", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Stack
+
+
+def _measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def benchmark(n=1_000_000):
+    Stack = _load_generic_stack()
+    # Large ints so the generic stack pays for real boxed objects rather
+    # than the interpreter's small-int cache
+    offset = 10 ** 12
+    values = range(offset, offset + n)
+    packed = array.array("q", values)
+
+    def fill_generic():
+        stack = Stack()
+        for value in values:
+            stack.push(value)
+        return stack
+
+    def fill_typed():
+        stack = TypedStack("q")
+        for value in values:
+            stack.push(value)
+        return stack
+
+    def fill_typed_bulk():
+        stack = TypedStack("q")
+        stack.push_many(packed)
+        return stack
+
+    def drain(stack):
+        while not stack.is_empty():
+            stack.pop()
+
+    def drain_bulk(stack, batch=4096):
+        while len(stack):
+            stack.pop_many(min(batch, len(stack)))
+
+    print(f"n = {n:,} 64-bit integers")
+    print(f"{'Implementation':<30} {'push (s)':>10} {'pop (s)':>10} {'peak memory':>14}")
+    for name, fill, empty in [
+        ("Stack (list of objects)", fill_generic, drain),
+        ("TypedStack push/pop", fill_typed, drain),
+        ("TypedStack push_many(array)", fill_typed_bulk, drain_bulk),
+    ]:
+        stack, push_seconds, peak = _measure(fill)
+        start = time.perf_counter()
+        empty(stack)
+        pop_seconds = time.perf_counter() - start
+        print(f"{name:<30} {push_seconds:>10.3f} {pop_seconds:>10.3f} {peak / 2**20:>11.1f} MiB")
+
+
+if __name__ == "__main__":
+    stack = TypedStack("q")
+    stack.push_many([10, 20, 30, 40])
+    print("Peek:", stack.peek())
+    print("pop_many(2):", stack.pop_many(2))
+    print("Remaining:", len(stack), "items, top", stack.pop())
+    print()
+
+    benchmark()
@@ -0,0 +1,196 @@
+"""
+Parameter sweeps over the task3 chocolate production model.
+
+ChocolateModel builds the PuLP problem once and re-solves it with new
+coefficients for every scenario, and solve_scenarios spreads scenarios over
+worker processes that each keep one model. A scenario only lists the
+parameters it changes; everything else comes from DEFAULT_PARAMETERS, so
+every result depends on its own scenario alone, whatever the process count
+or chunk size.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+import random
+import statistics
+import time
+
+from pulp import LpContinuous, LpInteger, LpMaximize, LpProblem, LpStatus, LpVariable, PULP_CBC_CMD, value  # type: ignore
+
+# Coefficients of the model hard-coded in task3.optimize_chocolates
+DEFAULT_PARAMETERS = {
+    "profit_a": 6,
+    "profit_b": 5,
+    "milk_a": 1,
+    "milk_b": 1,
+    "milk_capacity": 5,
+    "choco_a": 3,
+    "choco_b": 2,
+    "choco_capacity": 12,
+}
+
+
+def _expression(constraint):
+    """Return the coefficient mapping of a constraint (PuLP 2.x and 3.x)."""
+    return getattr(constraint, "expr", constraint)
+
+
+class ChocolateModel:
+    """Reusable two-product production model.
+
+    The LpProblem, its variables and its constraints are built once; each
+    scenario only overwrites the objective/constraint coefficients and the
+    right-hand sides before solving again. With integer=True the units are
+    whole numbers and CBC is warm-started from the previous solution.
+    """
+
+    def __init__(self, integer=False, warm_start=True):
+        category = LpInteger if integer else LpContinuous
+        self.model = LpProblem("Chocolate_Production", LpMaximize)
+        self.units_a = LpVariable("Units_A", lowBound=0, cat=category)
+        self.units_b = LpVariable("Units_B", lowBound=0, cat=category)
+
+        p = DEFAULT_PARAMETERS
+        self.model += p["profit_a"] * self.units_a + p["profit_b"] * self.units_b
+        self.model += p["milk_a"] * self.units_a + p["milk_b"] * self.units_b <= p["milk_capacity"], "Milk"
+        self.model += p["choco_a"] * self.units_a + p["choco_b"] * self.units_b <= p["choco_capacity"], "Choco"
+
+        self.solver = PULP_CBC_CMD(msg=False, warmStart=warm_start and integer)
+        self.parameters = dict(DEFAULT_PARAMETERS)
+
+    def update(self, **parameters):
+        """Set model coefficients in place; keys as in DEFAULT_PARAMETERS.
+
+        Parameters not given revert to DEFAULT_PARAMETERS rather than keeping
+        the values of an earlier scenario solved on this model.
+        """
+        unknown = set(parameters) - set(DEFAULT_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown model parameters: {', '.join(sorted(unknown))}")
+        self.parameters = {**DEFAULT_PARAMETERS, **parameters}
+        p = self.parameters
+
+        objective = self.model.objective
+        objective[self.units_a] = p["profit_a"]
+        objective[self.units_b] = p["profit_b"]
+
+        milk = self.model.constraints["Milk"]
+        _expression(milk)[self.units_a] = p["milk_a"]
+        _expression(milk)[self.units_b] = p["milk_b"]
+        milk.changeRHS(p["milk_capacity"])
+
+        choco = self.model.constraints["Choco"]
+        _expression(choco)[self.units_a] = p["choco_a"]
+        _expression(choco)[self.units_b] = p["choco_b"]
+        choco.changeRHS(p["choco_capacity"])
+
+    def solve(self, **parameters):
+        """Solve with parameters over the defaults; return the solution with its solve time."""
+        if parameters or self.parameters != DEFAULT_PARAMETERS:
+            self.update(**parameters)
+
+        start = time.perf_counter()
+        status = self.model.solve(self.solver)
+        solve_time = time.perf_counter() - start
+
+        return {
+            "status": LpStatus[status],
+            "units_a": value(self.units_a),
+            "units_b": value(self.units_b),
+            "max_profit": value(self.model.objective),
+            "solve_time": solve_time,
+        }
+
+
+# One model per worker process, built by _init_worker
+_worker_model = None
+
+
+def _init_worker(integer, warm_start):
+    global _worker_model
+    _worker_model = ChocolateModel(integer=integer, warm_start=warm_start)
+
+
+def _solve_in_worker(parameters):
+    return _worker_model.solve(**parameters)
+
+
+def solve_time_statistics(times):
+    """Summarise a list of solve times in seconds."""
+    if not times:
+        return {"count": 0}
+    ordered = sorted(times)
+    return {
+        "count": len(ordered),
+        "total": sum(ordered),
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def solve_scenarios(scenarios, processes=None, integer=False, warm_start=True, chunksize=8):
+    """Solve many parameter scenarios, optionally across worker processes.
+
+    Each worker builds the model once and re-solves it for every scenario it
+    receives. processes=1 solves in the current process.
+
+    Returns:
+        (results, report): one solution dict per scenario (in input order),
+        and a report with solve-time statistics, wall time and throughput.
+    """
+    scenarios = list(scenarios)
+    processes = processes or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    if processes == 1:
+        model = ChocolateModel(integer=integer, warm_start=warm_start)
+        results = [model.solve(**parameters) for parameters in scenarios]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=_init_worker, initargs=(integer, warm_start)
+        ) as executor:
+            results = list(executor.map(_solve_in_worker, scenarios, chunksize=chunksize))
+    wall_time = time.perf_counter() - start
+
+    report = {
+        "processes": processes,
+        "wall_time": wall_time,
+        "scenarios_per_second": len(scenarios) / wall_time if wall_time > 0 else 0.0,
+        "solve_time": solve_time_statistics([r["solve_time"] for r in results]),
+    }
+    return results, report
+
+
+def random_scenarios(count, seed=0):
+    """Generate price/capacity scenarios around the task3 defaults."""
+    rng = random.Random(seed)
+    scenarios = []
+    for _ in range(count):
+        scenarios.append({
+            "profit_a": round(rng.uniform(4, 8), 2),
+            "profit_b": round(rng.uniform(3, 7), 2),
+            "milk_capacity": rng.randint(3, 10),
+            "choco_capacity": rng.randint(8, 20),
+        })
+    return scenarios
+
+
+if __name__ == "__main__":
+    from task3 import optimize_chocolates
+
+    baseline = optimize_chocolates()
+    reused = ChocolateModel().solve()
+    assert abs(reused["max_profit"] - baseline["max_profit"]) < 1e-6
+    print(f"Default scenario: profit Rs {reused['max_profit']} (matches optimize_chocolates)")
+
+    scenarios = random_scenarios(200)
+    for processes in (1, os.cpu_count() or 1):
+        results, report = solve_scenarios(scenarios, processes=processes)
+        stats = report["solve_time"]
+        print(
+            f"{processes} process(es): {report['scenarios_per_second']:.1f} scenarios/s, "
+            f"solve time mean {stats['mean'] * 1000:.1f} ms, "
+            f"p95 {stats['p95'] * 1000:.1f} ms, max {stats['max'] * 1000:.1f} ms"
+        )
@@ -0,0 +1,209 @@
+from bisect import bisect_left
+import random
+import time
+
+from task1 import linear_search
+
+# Optional NumPy import - only needed for the vectorised scan and batch paths
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+STRATEGIES = ("auto", "hash", "bisect", "scan")
+
+
+def _is_sorted(values):
+    return all(a <= b for a, b in zip(values, values[1:]))
+
+
+def _scan_array(arr, target):
+    """First index of target in a 1-D NumPy array, or -1."""
+    matches = arr == target
+    if not isinstance(matches, np.ndarray) or not matches.size:
+        return -1  # empty, or an incomparable target such as a string
+    # argmax stops at the first True, so this is a short-circuiting scan
+    position = int(matches.argmax())
+    return position if matches[position] else -1
+
+
+def search(values, target):
+    """Return the index of the first occurrence of target in values, or -1.
+
+    One-off replacement for linear_search: NumPy arrays are scanned with one
+    vectorised comparison and lists/tuples with list.index, both in C. Like
+    list.index, an element that *is* target matches even if it is not equal
+    to itself (NaN), where linear_search would return -1.
+    """
+    if NUMPY_AVAILABLE and isinstance(values, np.ndarray):
+        return _scan_array(values.ravel(), target)
+    try:
+        return values.index(target)
+    except ValueError:
+        return -1
+    except AttributeError:
+        return linear_search(values, target)
+
+
+def search_many(values, targets):
+    """Return [search(values, t) for t in targets] in one pass over values.
+
+    Builds a first-occurrence map when the values are hashable, so k queries
+    cost O(n + k) instead of O(n * k).
+    """
+    targets = list(targets)
+    if len(targets) < 2:
+        return [search(values, target) for target in targets]
+    try:
+        return SearchIndex(values, strategy="hash").find_many(targets)
+    except TypeError:
+        return [search(values, target) for target in targets]
+
+
+class SearchIndex:
+    """Prepared search over a fixed sequence for repeated lookups.
+
+    find() returns the same answer as linear_search (index of the first
+    occurrence, -1 if absent) using one of:
+
+    - "hash": dict from value to first index; O(n) to build, O(1) per query.
+      Needs hashable values.
+    - "bisect": binary search; O(log n) per query with no extra memory, but
+      the values must already be sorted ascending.
+    - "scan": vectorised NumPy comparison per query; no build cost, suited
+      to one-off queries on large numeric arrays.
+
+    With strategy="auto", sorted data uses bisect, hashable data uses the
+    hash index and anything else falls back to a scan.
+    """
+
+    def __init__(self, values, strategy="auto"):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}, got {strategy!r}")
+        if NUMPY_AVAILABLE and isinstance(values, np.ndarray):
+            values = values.ravel()
+        self.values = values
+
+        if strategy == "auto":
+            strategy = self._choose_strategy()
+        if strategy == "bisect" and not _is_sorted(values):
+            raise ValueError("the bisect strategy requires values sorted ascending")
+        if strategy == "scan" and NUMPY_AVAILABLE and not isinstance(values, np.ndarray):
+            try:
+                converted = np.asarray(values)
+            except (ValueError, TypeError):
+                converted = None
+            # Only keep the array if it holds plain numbers, so == compares
+            # values exactly as the Python loop would
+            if converted is not None and converted.dtype.kind in "biuf":
+                self.values = converted
+        self.strategy = strategy
+
+        self._index = None
+        if strategy == "hash":
+            index = {}
+            for position, value in enumerate(values):
+                index.setdefault(value, position)
+            self._index = index
+
+    def _choose_strategy(self):
+        values = self.values
+        try:
+            if _is_sorted(values):
+                return "bisect"
+        except TypeError:
+            pass  # mixed types cannot be ordered
+        try:
+            for value in values:
+                hash(value)
+            return "hash"
+        except TypeError:
+            return "scan"
+
+    def find(self, target):
+        if self.strategy == "hash":
+            try:
+                return self._index.get(target, -1)
+            except TypeError:
+                return -1  # unhashable targets cannot equal a hashable value
+        if self.strategy == "bisect":
+            values = self.values
+            try:
+                position = bisect_left(values, target)
+            except TypeError:
+                return -1
+            if position < len(values) and values[position] == target:
+                return position
+            return -1
+        return search(self.values, target)
+
+    def find_many(self, targets):
+        """Return find(t) for every target, vectorised where possible."""
+        if self.strategy == "hash":
+            get = self._index.get
+            try:
+                return [get(target, -1) for target in targets]
+            except TypeError:
+                return [self.find(target) for target in targets]
+        if (self.strategy == "bisect" and NUMPY_AVAILABLE
+                and isinstance(self.values, np.ndarray) and len(self.values)):
+            targets = np.asarray(list(targets))
+            if targets.dtype.kind in "biuf":
+                positions = np.searchsorted(self.values, targets, side="left")
+                clipped = np.minimum(positions, len(self.values) - 1)
+                found = (positions < len(self.values)) & (self.values[clipped] == targets)
+                return np.where(found, positions, -1).tolist()
+        return [self.find(target) for target in targets]
+
+    def __contains__(self, target):
+        return self.find(target) != -1
+
+    def __len__(self):
+        return len(self.values)
+
+
+def benchmark(n=1_000_000, queries=1_000):
+    data = [random.randrange(n * 2) for _ in range(n)]
+    sorted_data = sorted(data)
+    targets = [random.randrange(n * 2) for _ in range(queries)]
+    loop_queries = targets[:20]
+
+    def timed(label, func, count):
+        start = time.perf_counter()
+        func()
+        per_query = (time.perf_counter() - start) / count
+        print(f"  {label:<42} {per_query * 1e6:12.2f} us/query")
+
+    print(f"n = {n:,}")
+    timed("linear_search (Python loop)", lambda: [linear_search(data, t) for t in loop_queries], len(loop_queries))
+    timed("search (list.index)", lambda: [search(data, t) for t in loop_queries], len(loop_queries))
+    if NUMPY_AVAILABLE:
+        arr = np.array(data)
+        timed("search (NumPy scan)", lambda: [search(arr, t) for t in loop_queries], len(loop_queries))
+
+    start = time.perf_counter()
+    index = SearchIndex(data, strategy="hash")
+    print(f"  hash index build {time.perf_counter() - start:.3f}s")
+    timed("SearchIndex hash find", lambda: [index.find(t) for t in targets], queries)
+    timed("SearchIndex hash find_many", lambda: index.find_many(targets), queries)
+
+    sorted_index = SearchIndex(sorted_data)
+    timed(f"SearchIndex {sorted_index.strategy} find (sorted list)",
+          lambda: [sorted_index.find(t) for t in targets], queries)
+    if NUMPY_AVAILABLE:
+        array_index = SearchIndex(np.array(sorted_data))
+        timed("SearchIndex bisect find_many (searchsorted)", lambda: array_index.find_many(targets), queries)
+    timed("search_many (one pass, unsorted list)", lambda: search_many(data, targets), queries)
+
+
+if __name__ == "__main__":
+    data = [5, 3, 8, 6, 7, 2]
+    index = SearchIndex(data)
+    print(f"Strategy chosen for {data}: {index.strategy}")
+    print("find(6) ->", index.find(6), "| find_many([2, 9, 5]) ->", index.find_many([2, 9, 5]))
+    print("search(data, 7) ->", search(data, 7))
+    print()
+
+    benchmark()
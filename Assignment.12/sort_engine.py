@@ -0,0 +1,442 @@
+from heapq import merge as heap_merge
+from itertools import islice
+import math
+import pickle
+import random
+import tempfile
+import time
+
+from task2 import bubble_sort
+
+# Optional NumPy import - only needed for the array and radix paths
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+ALGORITHMS = ("auto", "timsort", "numpy", "merge", "introsort", "radix", "external", "bubble")
+
+# Below this size sorted() beats converting a list to a NumPy array and back
+NUMPY_MIN_SIZE = 50_000
+
+# Partitions this small are finished with insertion sort inside introsort
+INSERTION_SORT_THRESHOLD = 16
+
+DEFAULT_RUN_SIZE = 500_000
+DEFAULT_FAN_IN = 64
+
+# Items pickled together in a run file; bounds the read buffer per run
+RUN_BLOCK_SIZE = 4096
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+# ------------------------------------------------------------- merge sort ---
+
+def _merge(left, right, reverse):
+    """Stable merge of two sorted lists (equal items keep left-then-right order)."""
+    result = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if (left[i] < right[j]) if reverse else (right[j] < left[i]):
+            result.append(right[j])
+            j += 1
+        else:
+            result.append(left[i])
+            i += 1
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
+
+
+def merge_sort(values, key=None, reverse=False):
+    """Return a new list sorted by bottom-up (iterative) merge sort.
+
+    Stable, O(n log n) in every case, and accepts key/reverse like sorted().
+    """
+    values = list(values)
+    if key is not None:
+        # Sort (key, position) pairs so items themselves are never compared;
+        # negating the position keeps equal keys in input order when reversed
+        sign = -1 if reverse else 1
+        decorated = merge_sort([(key(value), sign * i) for i, value in enumerate(values)], reverse=reverse)
+        return [values[sign * i] for _, i in decorated]
+
+    runs = [[value] for value in values]
+    while len(runs) > 1:
+        merged = [_merge(runs[i], runs[i + 1], reverse) for i in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return runs[0] if runs else []
+
+
+# -------------------------------------------------------------- introsort ---
+
+def _insertion_sort(arr, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        value = arr[i]
+        j = i - 1
+        while j >= lo and value < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = value
+
+
+def _sift_down(arr, lo, start, end):
+    # Max-heap over arr[lo:end] with the root at lo
+    root = start
+    while True:
+        child = 2 * (root - lo) + 1 + lo
+        if child >= end:
+            return
+        if child + 1 < end and arr[child] < arr[child + 1]:
+            child += 1
+        if not arr[root] < arr[child]:
+            return
+        arr[root], arr[child] = arr[child], arr[root]
+        root = child
+
+
+def _heapsort(arr, lo, hi):
+    end = hi + 1
+    for start in range(lo + (end - lo) // 2 - 1, lo - 1, -1):
+        _sift_down(arr, lo, start, end)
+    for last in range(hi, lo, -1):
+        arr[lo], arr[last] = arr[last], arr[lo]
+        _sift_down(arr, lo, lo, last)
+
+
+def _partition(arr, lo, hi):
+    """Hoare partition around the median of arr[lo], arr[mid], arr[hi]."""
+    mid = (lo + hi) // 2
+    if arr[mid] < arr[lo]:
+        arr[lo], arr[mid] = arr[mid], arr[lo]
+    if arr[hi] < arr[lo]:
+        arr[lo], arr[hi] = arr[hi], arr[lo]
+    if arr[hi] < arr[mid]:
+        arr[mid], arr[hi] = arr[hi], arr[mid]
+    pivot = arr[mid]
+    i, j = lo - 1, hi + 1
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            return j
+        arr[i], arr[j] = arr[j], arr[i]
+
+
+def introsort(arr):
+    """Sort a list in place with introsort and return None, like list.sort().
+
+    Median-of-three quicksort that switches to heapsort when recursion gets
+    deeper than 2*log2(n), so the worst case stays O(n log n), and finishes
+    small partitions with insertion sort. Not stable. Uses an explicit stack
+    of pending ranges and recurses into no Python frames.
+    """
+    if len(arr) < 2:
+        return
+    stack = [(0, len(arr) - 1, 2 * int(math.log2(len(arr))))]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo >= INSERTION_SORT_THRESHOLD:
+            if depth == 0:
+                _heapsort(arr, lo, hi)
+                break
+            depth -= 1
+            split = _partition(arr, lo, hi)
+            # Continue with the smaller side, defer the larger one
+            if split - lo < hi - split:
+                stack.append((split + 1, hi, depth))
+                hi = split
+            else:
+                stack.append((lo, split, depth))
+                lo = split + 1
+        else:
+            _insertion_sort(arr, lo, hi)
+
+
+# ------------------------------------------------------------- radix sort ---
+
+def _radix_sort_array(arr):
+    """LSD radix sort of a 1-D integer array on 16-bit digits."""
+    if arr.size < 2:
+        return arr.copy()
+    low = arr.min()
+    # Offsetting by the minimum makes every key non-negative and skips the
+    # passes for digits that are zero everywhere (small value ranges)
+    if arr.dtype.kind == "u":
+        keys = (arr - low).astype(np.uint64)
+    else:
+        keys = (arr.astype(np.int64) - np.int64(low)).view(np.uint64)
+    passes = max(1, (int(keys.max()).bit_length() + 15) // 16)
+
+    order = np.arange(arr.size)
+    for shift in range(0, 16 * passes, 16):
+        digits = ((keys[order] >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(np.uint16)
+        # NumPy's stable sort of 16-bit integers is itself a counting sort
+        order = order[np.argsort(digits, kind="stable")]
+    return arr[order]
+
+
+def _radix_sort_list(values):
+    """Pure-Python LSD radix sort of integers, one byte per pass."""
+    if len(values) < 2:
+        return list(values)
+    low = min(values)
+    keys = [value - low for value in values]
+    result = list(values)
+    shift = 0
+    largest = max(keys)
+    while largest >> shift:
+        buckets = [[] for _ in range(256)]
+        for key, value in zip(keys, result):
+            buckets[(key >> shift) & 0xFF].append((key, value))
+        pairs = [pair for bucket in buckets for pair in bucket]
+        keys = [key for key, _ in pairs]
+        result = [value for _, value in pairs]
+        shift += 8
+    return result
+
+
+def radix_sort(values):
+    """Return the integers in values sorted by LSD radix sort.
+
+    NumPy integer arrays (and lists of ints when NumPy is installed) are
+    sorted 16 bits per pass in vectorised code and an array is returned for
+    array input; otherwise a pure-Python byte-wise radix sort returns a list.
+    O(n * w) for w-bit keys, independent of the input order.
+
+    Raises:
+        TypeError: If values contains non-integers.
+    """
+    if NUMPY_AVAILABLE and isinstance(values, np.ndarray):
+        if values.dtype.kind not in "biu":
+            raise TypeError(f"radix_sort needs an integer array, got dtype {values.dtype}")
+        return _radix_sort_array(values.ravel())
+    values = list(values)
+    for value in values:
+        if not isinstance(value, int):
+            raise TypeError(f"radix_sort needs integers, got {value!r}")
+    if NUMPY_AVAILABLE and values and _INT64_MIN <= min(values) and max(values) <= _INT64_MAX:
+        return _radix_sort_array(np.array(values, dtype=np.int64)).tolist()
+    return _radix_sort_list(values)
+
+
+# ---------------------------------------------------------- external sort ---
+
+def _write_run(items, tmp_dir):
+    run = tempfile.TemporaryFile(dir=tmp_dir)
+    for start in range(0, len(items), RUN_BLOCK_SIZE):
+        pickle.dump(items[start:start + RUN_BLOCK_SIZE], run, pickle.HIGHEST_PROTOCOL)
+    run.seek(0)
+    return run
+
+
+def _read_run(run):
+    # Only one block of the run is held in memory at a time
+    while True:
+        try:
+            block = pickle.load(run)
+        except EOFError:
+            return
+        yield from block
+
+
+def _merge_runs(group, key, reverse, tmp_dir):
+    """Merge several run files into one new run file and close the inputs."""
+    merged = tempfile.TemporaryFile(dir=tmp_dir)
+    block = []
+    for item in heap_merge(*map(_read_run, group), key=key, reverse=reverse):
+        block.append(item)
+        if len(block) == RUN_BLOCK_SIZE:
+            pickle.dump(block, merged, pickle.HIGHEST_PROTOCOL)
+            block = []
+    if block:
+        pickle.dump(block, merged, pickle.HIGHEST_PROTOCOL)
+    for run in group:
+        run.close()
+    merged.seek(0)
+    return merged
+
+
+def external_sort(iterable, key=None, reverse=False, run_size=DEFAULT_RUN_SIZE,
+                  fan_in=DEFAULT_FAN_IN, tmp_dir=None):
+    """Sort an iterable that may not fit in memory; yield items in order.
+
+    The input is cut into runs of run_size items, each sorted in memory and
+    pickled to a temporary file, then the runs are k-way merged with
+    heapq.merge (at most fan_in files at once, in several passes if needed).
+    Memory use is about run_size items. Stable, and accepts key/reverse like
+    sorted(). Temporary files are removed when the generator finishes or is
+    closed.
+    """
+    if run_size < 1 or fan_in < 2:
+        raise ValueError("run_size must be >= 1 and fan_in >= 2")
+    iterator = iter(iterable)
+    runs = []
+    groups = []
+    try:
+        while True:
+            chunk = list(islice(iterator, run_size))
+            if not chunk:
+                break
+            chunk.sort(key=key, reverse=reverse)
+            if not runs and len(chunk) < run_size:
+                yield from chunk  # everything fitted in one run
+                return
+            runs.append(_write_run(chunk, tmp_dir))
+            del chunk
+
+        while len(runs) > fan_in:
+            # Merge neighbouring groups and keep the groups in input order,
+            # so equal items from earlier input still come out first
+            groups = [runs[i:i + fan_in] for i in range(0, len(runs), fan_in)]
+            runs = []
+            for group in groups:
+                runs.append(_merge_runs(group, key, reverse, tmp_dir) if len(group) > 1 else group[0])
+
+        yield from heap_merge(*map(_read_run, runs), key=key, reverse=reverse)
+    finally:
+        for run in runs + [run for group in groups for run in group]:
+            run.close()  # closing a TemporaryFile deletes it; repeats are harmless
+
+
+# -------------------------------------------------------------- selection ---
+
+def _is_int64_list(values):
+    return (set(map(type, values)) == {int}
+            and _INT64_MIN <= min(values) and max(values) <= _INT64_MAX)
+
+
+def choose_algorithm(values, key=None, max_items_in_memory=None):
+    """Name of the algorithm sort() would use for these arguments.
+
+    - iterators without a length, or more items than max_items_in_memory:
+      "external"
+    - NumPy arrays: "numpy" (np.sort with kind="stable", which NumPy itself
+      runs as a C radix sort for 8- and 16-bit ints and as timsort for
+      wider dtypes)
+    - large lists of plain ints (NUMPY_MIN_SIZE or more, no key): "numpy",
+      because converting to an int64 array, sorting and converting back beats
+      sorted() on the boxed ints
+    - everything else: "timsort" (the builtin sorted())
+
+    "radix" is never picked automatically: on small-int arrays and lists
+    np.sort's built-in radix path is several times faster than radix_sort,
+    so radix_sort is only used when asked for by name.
+    """
+    if not hasattr(values, "__len__"):
+        return "external"
+    if max_items_in_memory is not None and len(values) > max_items_in_memory:
+        return "external"
+    if NUMPY_AVAILABLE and isinstance(values, np.ndarray):
+        return "numpy"
+    if (NUMPY_AVAILABLE and key is None and len(values) >= NUMPY_MIN_SIZE
+            and isinstance(values, (list, tuple)) and _is_int64_list(values)):
+        return "numpy"
+    return "timsort"
+
+
+def sort(values, algorithm="auto", key=None, reverse=False, max_items_in_memory=None):
+    """Return values sorted with the chosen (or automatically picked) algorithm.
+
+    Args:
+        values: A list/tuple, NumPy array, or any iterable.
+        algorithm: One of ALGORITHMS; "auto" uses choose_algorithm().
+        key, reverse: As for sorted(); supported by "timsort", "merge",
+            "external" and, for reverse only, the others.
+        max_items_in_memory: With "auto", inputs longer than this are sorted
+            externally.
+
+    Returns:
+        A new list (a NumPy array for array input to "numpy"/"radix"), or an
+        iterator for "external". The input is never modified.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"algorithm must be one of {ALGORITHMS}, got {algorithm!r}")
+    if algorithm == "auto":
+        algorithm = choose_algorithm(values, key, max_items_in_memory)
+    if key is not None and algorithm not in ("timsort", "merge", "external"):
+        raise ValueError(f"the {algorithm} algorithm does not support key=")
+
+    if algorithm == "external":
+        kwargs = {} if max_items_in_memory is None else {"run_size": max_items_in_memory}
+        return external_sort(values, key=key, reverse=reverse, **kwargs)
+    if algorithm == "timsort":
+        return sorted(values, key=key, reverse=reverse)
+    if algorithm == "merge":
+        return merge_sort(values, key=key, reverse=reverse)
+
+    if algorithm == "numpy":
+        if not NUMPY_AVAILABLE:
+            raise ImportError("the numpy algorithm requires NumPy")
+        if isinstance(values, np.ndarray):
+            result = np.sort(values, axis=None, kind="stable")
+            return result[::-1].copy() if reverse else result
+        result = np.sort(np.array(values), kind="stable").tolist()
+    elif algorithm == "radix":
+        result = radix_sort(values)
+    elif algorithm == "introsort":
+        result = list(values)
+        introsort(result)
+    else:
+        result = bubble_sort(list(values))
+
+    if reverse:
+        # Not stable for equal items, which these algorithms never promise
+        result = result[::-1]
+    return result
+
+
+def benchmark(sizes=(1_000, 100_000, 1_000_000)):
+    def timed(func):
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+    cases = [
+        ("sorted()", lambda data, arr: sorted(data)),
+        ("sort(auto)", lambda data, arr: sort(data)),
+        ("merge_sort", lambda data, arr: merge_sort(data)),
+        ("introsort", lambda data, arr: introsort(list(data))),
+        ("radix_sort (list)", lambda data, arr: radix_sort(data)),
+        ("external_sort", lambda data, arr: list(external_sort(data, run_size=max(len(data) // 8, 1)))),
+    ]
+    if NUMPY_AVAILABLE:
+        cases += [
+            ("np.sort (array)", lambda data, arr: np.sort(arr)),
+            ("radix_sort (array)", lambda data, arr: radix_sort(arr)),
+        ]
+
+    print(f"{'Algorithm':<20}" + "".join(f"{n:>14,}" for n in sizes))
+    slow = {"merge_sort", "introsort"}
+    for name, func in [("bubble_sort", lambda data, arr: bubble_sort(data))] + cases:
+        row = f"{name:<20}"
+        for n in sizes:
+            limit = 3_000 if name == "bubble_sort" else 200_000 if name in slow else None
+            if limit is not None and n > limit:
+                row += f"{'-':>14}"
+                continue
+            data = [random.randrange(-10 ** 9, 10 ** 9) for _ in range(n)]
+            arr = np.array(data) if NUMPY_AVAILABLE else None
+            row += f"{timed(lambda: func(data, arr)):>13.3f}s"
+        print(row)
+    print("(- = skipped, too slow at this size)")
+
+
+if __name__ == "__main__":
+    data = [64, 34, 25, 12, 22, 11, 90]
+    for algorithm in ALGORITHMS:
+        result = sort(data, algorithm)
+        print(f"{algorithm:<10} -> {list(result)}")
+    print("auto picks", choose_algorithm(list(range(NUMPY_MIN_SIZE))), "for", f"{NUMPY_MIN_SIZE:,} ints")
+    print()
+
+    benchmark()
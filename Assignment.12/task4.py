@@ -1,4 +1,12 @@
-import sympy as sp
+import math
+
+# Optional NumPy import - only needed for find_minimum_batch
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 def prompt_float(prompt: str, default: float) -> float:
     """Prompt the user for a floating-point value, using default if blank."""
@@ -11,7 +19,15 @@ def prompt_float(prompt: str, default: float) -> float:
         except ValueError:
             print("Please enter a valid number.")
 
-def find_minimum(a: float, b: float, c: float):
+def find_minimum(a: float, b: float, c: float, symbolic: bool = False):
+    """Find the local minimum of f(x) = ax^3 + bx + c.
+
+    f'(x) = 3ax^2 + b vanishes at x = +/- sqrt(-b / 3a), which is real only
+    when a and b have opposite signs, and f''(x) = 6ax is positive at the
+    root with the same sign as a. The answer is therefore computed in
+    closed form; pass symbolic=True to solve with SymPy instead (SymPy is
+    imported only in that case).
+    """
     if a == 0:
         if b == 0:
             return {
@@ -28,6 +44,38 @@ def find_minimum(a: float, b: float, c: float):
             ),
         }
 
+    if symbolic:
+        return _find_minimum_symbolic(a, b, c)
+
+    ratio = -b / (3 * a)
+    if ratio > 0:
+        best_x = math.copysign(math.sqrt(ratio), a)
+        best_value = a * best_x**3 + b * best_x + c
+        return _minimum_result(best_x, best_value)
+
+    return _no_minimum_result()
+
+def _minimum_result(best_x: float, best_value: float):
+    return {
+        "type": "minimum",
+        "x_min": best_x,
+        "f_min": best_value,
+        "message": f"Minimum occurs at x = {best_x:.4f}, where f(x) = {best_value:.4f}",
+    }
+
+def _no_minimum_result():
+    return {
+        "type": "none",
+        "message": (
+            "The derivative has no real roots, so the function is strictly monotonic "
+            "and does not attain a finite minimum."
+        ),
+    }
+
+def _find_minimum_symbolic(a: float, b: float, c: float):
+    """Solve f'(x) = 0 with SymPy (slow; imported on first use)."""
+    import sympy as sp
+
     x = sp.symbols("x", real=True)
     f = a * x**3 + b * x + c
     derivative = sp.diff(f, x)
@@ -46,20 +94,40 @@ def find_minimum(a: float, b: float, c: float):
     if minima:
         minima.sort(key=lambda item: item[1])
         best_x, best_value = minima[0]
-        return {
-            "type": "minimum",
-            "x_min": best_x,
-            "f_min": best_value,
-            "message": f"Minimum occurs at x = {best_x:.4f}, where f(x) = {best_value:.4f}",
-        }
+        return _minimum_result(best_x, best_value)
 
-    return {
-        "type": "none",
-        "message": (
-            "The derivative has no real roots, so the function is strictly monotonic "
-            "and does not attain a finite minimum."
-        ),
-    }
+    return _no_minimum_result()
+
+def find_minimum_batch(a, b, c):
+    """Vectorised find_minimum over arrays of coefficients.
+
+    Args:
+        a, b, c: Array-likes (or scalars) broadcastable to a common shape.
+
+    Returns:
+        dict with NumPy arrays:
+        - "has_minimum": True where f has a finite local minimum
+        - "x_min", "f_min": location and value of that minimum (NaN elsewhere)
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("find_minimum_batch requires NumPy")
+
+    a, b, c = np.broadcast_arrays(
+        np.asarray(a, dtype=float), np.asarray(b, dtype=float), np.asarray(c, dtype=float)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = -b / (3 * a)
+    has_minimum = (a != 0) & (ratio > 0)
+
+    x_min = np.full(a.shape, np.nan)
+    root = np.sqrt(ratio[has_minimum])
+    x_min[has_minimum] = np.copysign(root, a[has_minimum])
+
+    f_min = np.full(a.shape, np.nan)
+    xm = x_min[has_minimum]
+    f_min[has_minimum] = a[has_minimum] * xm**3 + b[has_minimum] * xm + c[has_minimum]
+
+    return {"has_minimum": has_minimum, "x_min": x_min, "f_min": f_min}
 
 if __name__ == "__main__":
     print("Analyze f(x) = ax^3 + bx + c")
@@ -71,40 +139,3 @@ if __name__ == "__main__":
 
     result = find_minimum(a_coeff, b_coeff, c_coeff)
     print(result["message"])
-import sympy as sp
-
-def find_minimum():
-    x = sp.symbols("x", real=True)
-    f = 2 * x**3 + 4 * x + 5
-
-    derivative = sp.diff(f, x)
-    critical_points = sp.solve(sp.Eq(derivative, 0), x)
-
-    real_points = [pt for pt in critical_points if sp.im(pt) == 0]
-
-    if real_points:
-        minima = [(pt, f.subs(x, pt).evalf()) for pt in real_points]
-        minima.sort(key=lambda item: item[1])
-        return {
-            "has_real_minimum": True,
-            "minimum_point": float(minima[0][0]),
-            "minimum_value": float(minima[0][1]),
-        }
-
-    return {
-        "has_real_minimum": False,
-        "message": (
-            "f(x) = 2x^3 + 4x + 5 has derivative 6x^2 + 4 > 0 for all real x, "
-            "so the function is strictly increasing and unbounded below "
-            "(no finite x gives a real minimum)."
-        ),
-    }
-
-if __name__ == "__main__":
-    result = find_minimum()
-    if result["has_real_minimum"]:
-        print(f"Minimum occurs at x = {result['minimum_point']}")
-        print(f"Minimum value f(x) = {result['minimum_value']}")
-    else:
-        print(result["message"])
-
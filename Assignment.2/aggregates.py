@@ -0,0 +1,296 @@
+"""
+aggregates.py
+
+Fast numeric aggregation kernels shared by the "sum" exercises:
+- sum_to_n / sum_range / sum_of_squares_to_n use closed-form formulas.
+- sum_of_squares and sum_even_odd pick a kernel by input type:
+    * range objects        -> closed form, O(1)
+    * 1-D NumPy arrays and buffers (array.array, memoryview) -> NumPy
+                              reductions (object arrays use the list kernel)
+    * lists and tuples     -> C-level builtins (map/sum/compress), no per-item
+                              Python loop
+    * any other iterable   -> the list kernel applied chunk by chunk, so
+                              generators far larger than memory can be summed
+
+Type-error behaviour matches the original loops: sum_of_squares raises
+TypeError naming the index of the first non-number, and sum_even_odd raises
+TypeError for values that do not support `% 2` and `+`.
+"""
+import array
+import operator
+from itertools import compress, islice, repeat
+from typing import Iterable, Iterator, List, Tuple, Union
+
+# Optional NumPy import - only needed for array/buffer inputs
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+Number = Union[int, float]
+
+# Number of items materialised at a time for generic iterables
+DEFAULT_CHUNK_SIZE = 65536
+
+_NUMBER_TYPES = {int, float, bool}
+
+# Integer NumPy reductions stay exact while every partial result fits in int64
+_INT64_LIMIT = 2 ** 63
+
+
+def sum_range(start: int, stop: int, step: int = 1) -> int:
+    """Return sum(range(start, stop, step)) using the arithmetic series formula."""
+    r = range(start, stop, step)
+    if not r:
+        return 0
+    return len(r) * (r[0] + r[-1]) // 2
+
+
+def sum_to_n(n: int) -> int:
+    """Return 1 + 2 + ... + n (0 for n <= 0) in O(1)."""
+    if not isinstance(n, int):
+        raise TypeError(f"n must be an integer, got {n!r}")
+    return n * (n + 1) // 2 if n > 0 else 0
+
+
+def sum_of_squares_to_n(n: int) -> int:
+    """Return 1^2 + 2^2 + ... + n^2 (0 for n <= 0) in O(1)."""
+    if not isinstance(n, int):
+        raise TypeError(f"n must be an integer, got {n!r}")
+    return n * (n + 1) * (2 * n + 1) // 6 if n > 0 else 0
+
+
+def iter_chunks(iterable: Iterable, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List]:
+    """Yield successive lists of at most chunk_size items from any iterable."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _as_array(numbers):
+    """Return a NumPy view of 1-D array/buffer inputs, or None for everything else.
+
+    Multi-dimensional arrays are not flattened: like the original loops they
+    are iterated row by row, so the rows are the elements (and are rejected
+    as non-numbers by sum_of_squares).
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+    if isinstance(numbers, np.ndarray):
+        arr = numbers
+    elif isinstance(numbers, (array.array, memoryview)):
+        arr = np.asarray(numbers)
+    else:
+        return None
+    return arr if arr.ndim == 1 else None
+
+
+def _check_numeric_dtype(arr):
+    """Raise TypeError unless arr holds ints, floats or bools."""
+    if arr.dtype.kind not in "biuf":
+        raise TypeError(f"Array of dtype {arr.dtype} does not contain numbers")
+
+
+def _int_reduction_is_exact(arr, power: int) -> bool:
+    """True if summing |x|**power over arr cannot overflow int64."""
+    if arr.size == 0:
+        return True
+    largest = max(abs(int(arr.min())), abs(int(arr.max())))
+    return largest ** power * arr.size < _INT64_LIMIT
+
+
+# ---------------------------------------------------------------- squares ---
+
+def _sum_of_squares_range(r: range) -> int:
+    """Closed form of sum(x * x for x in r): sum over i of (a + i*d)^2."""
+    n = len(r)
+    if n == 0:
+        return 0
+    a, d = r.start, r.step
+    sum_i = (n - 1) * n // 2
+    sum_i2 = (n - 1) * n * (2 * n - 1) // 6
+    return n * a * a + 2 * a * d * sum_i + d * d * sum_i2
+
+
+def _sum_of_squares_list(values: List, offset: int = 0) -> Number:
+    """Sum of squares of a list/tuple; offset is the index of values[0] in the full input."""
+    if not set(map(type, values)) <= _NUMBER_TYPES:
+        # Slow path only to find (and report) the first offending element;
+        # subclasses of int/float are still accepted, as in the original loop
+        for i, x in enumerate(values):
+            if not isinstance(x, (int, float)):
+                raise TypeError(f"Element at index {offset + i} is not a number: {x!r}")
+    return sum(map(operator.mul, values, values))
+
+
+def _sum_of_squares_array(arr) -> Number:
+    """Sum of squares of a 1-D NumPy array, returned as a Python number."""
+    if arr.dtype.kind == "O":
+        # Python objects (e.g. ints beyond 64 bits) get the list kernel's
+        # per-element type check
+        return _sum_of_squares_list(arr.tolist())
+    _check_numeric_dtype(arr)
+    if arr.dtype.kind == "f":
+        return float(np.dot(arr, arr))
+    if _int_reduction_is_exact(arr, 2):
+        arr = arr.astype(np.int64)
+        return int(np.dot(arr, arr))
+    return _sum_of_squares_list(arr.tolist())
+
+
+def sum_of_squares(numbers: Iterable[Number], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Number:
+    """Return the sum of squares of the given iterable of numbers.
+
+    Args:
+        numbers: An iterable of ints or floats (including ranges, lists,
+            NumPy arrays, array.array and generators).
+        chunk_size: Items materialised at a time for generic iterables.
+
+    Returns:
+        The sum of each value squared. Returns 0 for empty input.
+
+    Raises:
+        TypeError: If any element in `numbers` is not int/float.
+    """
+    if isinstance(numbers, range):
+        return _sum_of_squares_range(numbers)
+    arr = _as_array(numbers)
+    if arr is not None:
+        return _sum_of_squares_array(arr)
+    if isinstance(numbers, (list, tuple)):
+        return _sum_of_squares_list(numbers)
+
+    total: Number = 0
+    offset = 0
+    for chunk in iter_chunks(numbers, chunk_size):
+        total += _sum_of_squares_list(chunk, offset)
+        offset += len(chunk)
+    return total
+
+
+# --------------------------------------------------------------- even/odd ---
+
+def _sum_even_odd_range(r: range) -> Tuple[int, int]:
+    """Closed form for ranges: elements alternate parity only when step is odd."""
+    if not r:
+        return 0, 0
+    if r.step % 2 == 0:
+        total = sum_range(r.start, r.stop, r.step)
+        return (total, 0) if r.start % 2 == 0 else (0, total)
+    first, second = r[::2], r[1::2]
+    first_sum = len(first) and len(first) * (first[0] + first[-1]) // 2
+    second_sum = len(second) and len(second) * (second[0] + second[-1]) // 2
+    return (first_sum, second_sum) if r.start % 2 == 0 else (second_sum, first_sum)
+
+
+def _sum_even_odd_list(values: List) -> Tuple[Number, Number]:
+    """Even/odd sums of a list/tuple using C-level iteration only."""
+    odd_flags = list(map(operator.mod, values, repeat(2)))
+    sum_even = sum(compress(values, map(operator.not_, odd_flags)))
+    sum_odd = sum(compress(values, odd_flags))
+    return sum_even, sum_odd
+
+
+def _sum_even_odd_array(arr) -> Tuple[Number, Number]:
+    """Even/odd sums of a 1-D NumPy array, returned as Python numbers."""
+    if arr.dtype.kind == "O":
+        return _sum_even_odd_list(arr.tolist())
+    _check_numeric_dtype(arr)
+    if arr.dtype.kind != "f" and not _int_reduction_is_exact(arr, 1):
+        return _sum_even_odd_list(arr.tolist())
+    if arr.dtype.kind == "b":
+        arr = arr.astype(np.int64)
+    even_mask = arr % 2 == 0
+    return arr[even_mask].sum().item(), arr[~even_mask].sum().item()
+
+
+def _coerce_ints(numbers: Iterable) -> Iterator[int]:
+    """Yield int(value) for every value that converts, skipping the rest."""
+    for value in numbers:
+        try:
+            yield int(value)
+        except (ValueError, TypeError):
+            continue
+
+
+def sum_even_odd(numbers: Iterable, lenient: bool = False,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[Number, Number]:
+    """Return (sum_of_even, sum_of_odd) for the given numbers.
+
+    A value counts as even when `value % 2 == 0`, exactly like the loop in
+    Assignment.9/task1.py (so 2.5 is counted as odd).
+
+    Args:
+        numbers: Any iterable of numbers (ranges, lists, NumPy arrays,
+            buffers and generators all have dedicated fast paths).
+        lenient: If True, behave like sum_even_odd.sum_even_and_odd: convert
+            each value with int() and silently skip values that cannot be
+            converted.
+        chunk_size: Items materialised at a time for generic iterables.
+
+    Raises:
+        TypeError: In strict mode, for values that do not support `% 2`.
+    """
+    if lenient:
+        if isinstance(numbers, range):
+            return _sum_even_odd_range(numbers)
+        arr = _as_array(numbers)
+        if arr is not None and arr.dtype.kind in "biu":
+            return _sum_even_odd_array(arr)
+        numbers = _coerce_ints(numbers)
+    elif isinstance(numbers, range):
+        return _sum_even_odd_range(numbers)
+    else:
+        arr = _as_array(numbers)
+        if arr is not None:
+            return _sum_even_odd_array(arr)
+        if isinstance(numbers, (list, tuple)):
+            return _sum_even_odd_list(numbers)
+
+    sum_even: Number = 0
+    sum_odd: Number = 0
+    for chunk in iter_chunks(numbers, chunk_size):
+        chunk_even, chunk_odd = _sum_even_odd_list(chunk)
+        sum_even += chunk_even
+        sum_odd += chunk_odd
+    return sum_even, sum_odd
+
+
+if __name__ == "__main__":
+    import time
+
+    print(f"sum_to_n(10**12) -> {sum_to_n(10**12)}")
+    print(f"sum_even_odd(range(1, 11)) -> {sum_even_odd(range(1, 11))}")
+
+    data = list(range(1_000_000))
+
+    def loop_sum_of_squares(values):
+        total = 0
+        for i, x in enumerate(values):
+            if not isinstance(x, (int, float)):
+                raise TypeError(f"Element at index {i} is not a number: {x!r}")
+            total += x * x
+        return total
+
+    cases = [
+        ("per-item loop", lambda: loop_sum_of_squares(data)),
+        ("list kernel", lambda: sum_of_squares(data)),
+        ("generator, chunked", lambda: sum_of_squares(x for x in data)),
+        ("range, closed form", lambda: sum_of_squares(range(1_000_000))),
+    ]
+    if NUMPY_AVAILABLE:
+        numpy_data = np.arange(1_000_000)
+        cases.append(("NumPy array", lambda: sum_of_squares(numpy_data)))
+
+    print("\nsum_of_squares over 10^6 integers:")
+    for name, func in cases:
+        start = time.perf_counter()
+        result = func()
+        print(f"  {name:<20} {time.perf_counter() - start:.4f}s  ({result})")
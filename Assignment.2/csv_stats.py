@@ -0,0 +1,271 @@
+"""
+csv_stats.py
+
+Bounded-memory column statistics for calculate_csv_statistics (task1.py).
+
+Reading a whole CSV into a DataFrame needs several times the file size in
+RAM. The streaming engine here instead:
+
+- samples the first rows to find the numeric columns and their dtypes
+- reads the file in chunks of rows, parsing only those columns (usecols)
+  with explicit float64 dtypes, so text columns are never materialised
+- reduces every chunk to per-column partial aggregates (count, sum, min,
+  max) and merges them, so memory is bounded by one chunk of numeric data
+
+Partial aggregates are plain dictionaries and merge exactly, so aggregates
+of separate chunks or files combine into the statistics of all the data.
+finalise_statistics turns them into the same {'mean', 'min', 'max'}
+dictionaries that the in-memory calculate_csv_statistics returns.
+
+multi_file_csv_statistics applies this to many files (a directory, a glob
+pattern or a list of paths): every file is aggregated in a process pool,
+only the small aggregates travel back, and they are merged into global
+statistics alongside a per-file breakdown and throughput figures.
+"""
+import glob
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+Number = Union[int, float]
+Aggregate = Dict[str, Optional[Number]]
+
+# Rows parsed per chunk in streaming mode; ~8 MB per numeric column
+DEFAULT_CHUNKSIZE = 1_000_000
+
+# Rows read up front to decide which columns are numeric
+DEFAULT_SAMPLE_ROWS = 10_000
+
+# calculate_csv_statistics switches to streaming above this file size
+STREAMING_THRESHOLD_BYTES = 256 * 2 ** 20
+
+# dtype kinds counted as numeric, like select_dtypes(include=['number'])
+_NUMERIC_KINDS = "iuf"
+
+
+def numeric_column_dtypes(file_path: str, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> Dict[str, Optional[str]]:
+    """Return {column: dtype} for the columns that are numeric in the first rows.
+
+    Float columns map to 'float64'. Integer columns map to None, leaving the
+    parser to infer int64 (or float64 if missing values appear later), so
+    min/max keep the integer type a full read would give them.
+    """
+    sample = pd.read_csv(file_path, nrows=sample_rows)
+    dtypes = {}
+    for column, dtype in sample.dtypes.items():
+        if dtype.kind == "f":
+            dtypes[column] = "float64"
+        elif dtype.kind in _NUMERIC_KINDS:
+            dtypes[column] = None
+    return dtypes
+
+
+def empty_aggregate() -> Aggregate:
+    return {"count": 0, "sum": 0, "min": None, "max": None}
+
+
+def merge_aggregate(into: Aggregate, other: Aggregate) -> Aggregate:
+    """Fold one column aggregate into another and return it."""
+    if other["count"]:
+        into["count"] += other["count"]
+        into["sum"] += other["sum"]
+        into["min"] = other["min"] if into["min"] is None else min(into["min"], other["min"])
+        into["max"] = other["max"] if into["max"] is None else max(into["max"], other["max"])
+    return into
+
+
+def merge_aggregates(parts: Iterable[Dict[str, Aggregate]]) -> Dict[str, Aggregate]:
+    """Merge per-column aggregates of disjoint data, keeping first-seen column order."""
+    merged = {}
+    for part in parts:
+        for column, aggregate in part.items():
+            merge_aggregate(merged.setdefault(column, empty_aggregate()), aggregate)
+    return merged
+
+
+def _series_aggregate(series: pd.Series) -> Aggregate:
+    count = int(series.count())
+    if not count:
+        return empty_aggregate()
+    total = series.sum()
+    # Python ints cannot overflow when many int64 chunk sums are added up
+    total = int(total) if series.dtype.kind in "iu" else float(total)
+    return {"count": count, "sum": total, "min": series.min(), "max": series.max()}
+
+
+def _aggregate_chunks(file_path, dtypes, chunksize):
+    forced = {column: dtype for column, dtype in dtypes.items() if dtype is not None}
+    aggregates = {column: empty_aggregate() for column in dtypes}
+    with pd.read_csv(file_path, usecols=list(dtypes), dtype=forced, chunksize=chunksize) as reader:
+        for chunk in reader:
+            for column in list(aggregates):
+                series = chunk[column]
+                if series.dtype.kind not in _NUMERIC_KINDS:
+                    # Text further down: a full read would not treat the
+                    # column as numeric either
+                    del aggregates[column]
+                    continue
+                merge_aggregate(aggregates[column], _series_aggregate(series))
+    return aggregates
+
+
+def csv_column_aggregates(file_path: str, chunksize: int = DEFAULT_CHUNKSIZE,
+                          dtype: Optional[Dict[str, Optional[str]]] = None,
+                          sample_rows: int = DEFAULT_SAMPLE_ROWS) -> Dict[str, Aggregate]:
+    """
+    Stream a CSV file and return count/sum/min/max for each numeric column.
+
+    Args:
+        file_path: Path to the CSV file
+        chunksize: Rows parsed per chunk; memory is about chunksize * 8 bytes
+            per numeric column
+        dtype: Optional {column: dtype} of the columns to aggregate. By
+            default the numeric columns and their dtypes are inferred from
+            the first sample_rows rows.
+        sample_rows: Rows read to infer the numeric columns
+
+    Returns:
+        Dict mapping column name to {'count', 'sum', 'min', 'max'}, in file
+        column order
+
+    Raises:
+        ValueError: If chunksize is not positive, or a column given in dtype
+            cannot be parsed as that dtype
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+    inferred = dtype is None
+    dtypes = numeric_column_dtypes(file_path, sample_rows) if inferred else dict(dtype)
+    if not dtypes:
+        return {}
+    try:
+        return _aggregate_chunks(file_path, dtypes, chunksize)
+    except ValueError:
+        if not inferred or all(value is None for value in dtypes.values()):
+            raise
+        # A column that looked like floats holds text beyond the sample;
+        # parse again letting pandas infer dtypes so that column is dropped
+        return _aggregate_chunks(file_path, dict.fromkeys(dtypes), chunksize)
+
+
+def finalise_statistics(aggregates: Dict[str, Aggregate]) -> Dict[str, Dict[str, Number]]:
+    """Turn column aggregates into calculate_csv_statistics' {'mean', 'min', 'max'} dicts.
+
+    Columns without any values get NaN everywhere, as pandas would report.
+    """
+    statistics = {}
+    for column, aggregate in aggregates.items():
+        if aggregate["count"]:
+            statistics[column] = {
+                "mean": aggregate["sum"] / aggregate["count"],
+                "min": aggregate["min"],
+                "max": aggregate["max"],
+            }
+        else:
+            statistics[column] = {"mean": math.nan, "min": math.nan, "max": math.nan}
+    return statistics
+
+
+def streaming_csv_statistics(file_path: str, chunksize: int = DEFAULT_CHUNKSIZE,
+                             dtype: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Dict[str, Number]]:
+    """calculate_csv_statistics in bounded memory: mean, min and max per numeric column."""
+    return finalise_statistics(csv_column_aggregates(file_path, chunksize, dtype))
+
+
+def should_stream(file_path) -> bool:
+    """True for local files large enough that a full read risks running out of memory."""
+    return isinstance(file_path, (str, os.PathLike)) and os.path.isfile(file_path) \
+        and os.path.getsize(file_path) > STREAMING_THRESHOLD_BYTES
+
+
+def expand_csv_paths(source: Union[str, os.PathLike, Iterable[str]]) -> List[str]:
+    """Resolve a directory (its *.csv files), a glob pattern or a list of paths, sorted."""
+    if isinstance(source, (str, os.PathLike)):
+        source = os.fspath(source)
+        if os.path.isdir(source):
+            return sorted(glob.glob(os.path.join(glob.escape(source), "*.csv")))
+        if glob.has_magic(source):
+            return sorted(path for path in glob.glob(source) if os.path.isfile(path))
+        return [source]
+    return [os.fspath(path) for path in source]
+
+
+def _file_aggregates(task):
+    """Worker: aggregate one file, reporting failures instead of raising."""
+    path, chunksize, dtype = task
+    try:
+        return path, os.path.getsize(path), csv_column_aggregates(path, chunksize, dtype), None
+    except Exception as e:  # one bad file must not abort hundreds of others
+        return path, 0, None, f"{type(e).__name__}: {e}"
+
+
+def multi_file_csv_statistics(source: Union[str, os.PathLike, Iterable[str]],
+                              workers: Optional[int] = None,
+                              chunksize: int = DEFAULT_CHUNKSIZE,
+                              dtype: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
+    """
+    Compute calculate_csv_statistics over many CSV files in parallel.
+
+    Each file is streamed in its own worker process (so memory per worker
+    is bounded by one chunk) and reduced to column aggregates, which the
+    parent merges. A column counts towards the global statistics from every
+    file in which it is numeric.
+
+    Args:
+        source: Directory (all *.csv files in it), glob pattern such as
+            'logs/2024-*.csv', or an iterable of file paths
+        workers: Worker processes (default: CPU count); 1 runs in-process
+        chunksize: Rows parsed per chunk within each file
+        dtype: Optional {column: dtype} of the columns to aggregate
+
+    Returns:
+        Dict with keys:
+            'statistics': merged {column: {'mean', 'min', 'max'}} of all files
+            'files': {path: statistics of that file}, in path order
+            'errors': {path: message} for files that could not be read
+            'file_count', 'bytes', 'seconds': work done and wall time
+            'files_per_second', 'bytes_per_second': throughput
+
+    Raises:
+        ValueError: If chunksize or workers is not positive
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be positive")
+    paths = expand_csv_paths(source)
+    tasks = [(path, chunksize, dtype) for path in paths]
+
+    start = time.perf_counter()
+    if workers == 1 or len(tasks) <= 1:
+        results = [_file_aggregates(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_file_aggregates, tasks))
+
+    per_file = {}
+    errors = {}
+    total_bytes = 0
+    for path, size, aggregates, error in results:
+        if error is not None:
+            errors[path] = error
+            continue
+        per_file[path] = aggregates
+        total_bytes += size
+    merged = merge_aggregates(per_file.values())
+    seconds = time.perf_counter() - start
+
+    return {
+        "statistics": finalise_statistics(merged),
+        "files": {path: finalise_statistics(aggregates) for path, aggregates in per_file.items()},
+        "errors": errors,
+        "file_count": len(per_file),
+        "bytes": total_bytes,
+        "seconds": seconds,
+        "files_per_second": len(per_file) / seconds if seconds > 0 else math.inf,
+        "bytes_per_second": total_bytes / seconds if seconds > 0 else math.inf,
+    }
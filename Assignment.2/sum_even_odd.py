@@ -14,6 +14,8 @@ The script will also print a demonstration when run directly.
 """
 from typing import Iterable, Tuple
 
+from aggregates import sum_even_odd
+
 
 def sum_even_and_odd(numbers: Iterable) -> Tuple[int, int]:
     """Calculate sums of even and odd integers from `numbers`.
@@ -24,22 +26,7 @@ def sum_even_and_odd(numbers: Iterable) -> Tuple[int, int]:
     Returns:
         (sum_even, sum_odd)
     """
-    sum_even = 0
-    sum_odd = 0
-
-    for value in numbers:
-        try:
-            n = int(value)
-        except (ValueError, TypeError):
-            # ignore values that are not numeric-like
-            continue
-
-        if n % 2 == 0:
-            sum_even += n
-        else:
-            sum_odd += n
-
-    return sum_even, sum_odd
+    return sum_even_odd(numbers, lenient=True)
 
 
 if __name__ == "__main__":
@@ -19,10 +19,15 @@ with open(csv_path, mode='r') as file:
     for row in reader:
         print(row)
 
-from typing import Dict, Union
+from typing import Dict, Iterable, Optional, Union
 import pandas as pd
 
-def calculate_csv_statistics(file_path: str) -> Dict[str, Dict[str, Union[float, int]]]:
+from csv_stats import (DEFAULT_CHUNKSIZE, multi_file_csv_statistics, should_stream,
+                       streaming_csv_statistics)
+
+def calculate_csv_statistics(file_path: str, chunksize: Optional[int] = None,
+                             dtype: Optional[Dict[str, Optional[str]]] = None
+                             ) -> Dict[str, Dict[str, Union[float, int]]]:
     """
     Reads a CSV file and calculates mean, min, and max for each numeric column.
     
@@ -30,6 +35,14 @@ def calculate_csv_statistics(file_path: str) -> Dict[str, Dict[str, Union[float,
     -----------
     file_path : str
         Path to the CSV file to read
+    chunksize : int, optional
+        Stream the file in chunks of this many rows instead of loading it
+        whole. Only numeric columns are parsed and memory stays bounded by
+        one chunk. Files larger than csv_stats.STREAMING_THRESHOLD_BYTES
+        are streamed automatically.
+    dtype : dict, optional
+        {column: dtype} of the columns to aggregate in streaming mode
+        (e.g. {'Salary': 'float64'}); inferred from the first rows if omitted
     
     Returns:
     --------
@@ -45,6 +58,11 @@ def calculate_csv_statistics(file_path: str) -> Dict[str, Dict[str, Union[float,
      'salary': {'mean': 50000.0, 'min': 30000, 'max': 120000}}
     """
     try:
+        if chunksize is None and dtype is None and should_stream(file_path):
+            chunksize = DEFAULT_CHUNKSIZE
+        if chunksize is not None or dtype is not None:
+            return streaming_csv_statistics(file_path, chunksize or DEFAULT_CHUNKSIZE, dtype)
+
         # Read the CSV file
         df = pd.read_csv(file_path)
         
@@ -69,6 +87,45 @@ def calculate_csv_statistics(file_path: str) -> Dict[str, Dict[str, Union[float,
         return {}
 
 
+def calculate_csv_statistics_for_files(source: Union[str, Iterable[str]], workers: Optional[int] = None,
+                                       chunksize: int = DEFAULT_CHUNKSIZE) -> Dict[str, object]:
+    """
+    Calculates mean, min and max per numeric column over many CSV files.
+
+    Files are streamed in parallel worker processes and their per-column
+    aggregates merged, so hundreds of daily files are handled in bounded
+    memory per worker.
+
+    Parameters:
+    -----------
+    source : str or iterable of str
+        A directory (all *.csv files in it), a glob pattern such as
+        'data/2024-*.csv', or a list of file paths
+    workers : int, optional
+        Number of worker processes (default: CPU count)
+    chunksize : int
+        Rows parsed per chunk within each file
+
+    Returns:
+    --------
+    Dict[str, object]
+        'statistics' (merged over all files, same shape as
+        calculate_csv_statistics), 'files' (per-file statistics), 'errors',
+        'file_count', 'bytes', 'seconds', 'files_per_second' and
+        'bytes_per_second'
+
+    Example:
+    --------
+    >>> report = calculate_csv_statistics_for_files('daily/*.csv')
+    >>> report['statistics']['salary']['max']
+    120000
+    """
+    report = multi_file_csv_statistics(source, workers=workers, chunksize=chunksize)
+    for path, message in report['errors'].items():
+        print(f"Error reading CSV file '{path}': {message}")
+    return report
+
+
 def read_and_calculate_statistics():
     """Read the CSV file and return statistics for numeric columns.
 
@@ -1,5 +1,7 @@
 from typing import Iterable, Union
 
+from aggregates import sum_of_squares as _sum_of_squares
+
 Number = Union[int, float]
 
 
@@ -14,13 +16,11 @@ def sum_of_squares(numbers: Iterable[Number]) -> Number:
 
     Raises:
         TypeError: If any element in `numbers` is not int/float.
+
+    Delegates to aggregates.sum_of_squares, which uses a closed form for
+    ranges, NumPy for arrays and chunked C-level kernels for everything else.
     """
-    total: Number = 0
-    for i, x in enumerate(numbers):
-        if not isinstance(x, (int, float)):
-            raise TypeError(f"Element at index {i} is not a number: {x!r}")
-        total += x * x
-    return total
+    return _sum_of_squares(numbers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+import pytest
+
+from aggregates import sum_even_odd, sum_of_squares, sum_to_n
+
+
+def test_sum_to_n_closed_form():
+    assert sum_to_n(100) == 5050
+    assert sum_to_n(0) == 0
+
+
+def test_sum_of_squares_range_matches_loop():
+    r = range(-7, 20, 3)
+    assert sum_of_squares(r) == sum(x * x for x in r)
+
+
+def test_sum_of_squares_generator_reports_index():
+    with pytest.raises(TypeError, match="index 3"):
+        sum_of_squares((x for x in [1, 2, 3, None]), chunk_size=2)
+
+
+def test_sum_even_odd_list_and_range_agree():
+    assert sum_even_odd(list(range(1, 11))) == sum_even_odd(range(1, 11)) == (30, 25)
+
+
+def test_sum_even_odd_float_counts_as_odd():
+    assert sum_even_odd([2.0, 2.5]) == (2.0, 2.5)
+
+
+def test_sum_even_odd_lenient_skips_non_numbers():
+    assert sum_even_odd([1, "7", 8.0, "x", None], lenient=True) == (8, 8)
+
+
+def test_sum_even_odd_strict_type_error():
+    with pytest.raises(TypeError):
+        sum_even_odd([1, None])
+
+
+def test_object_array_of_python_ints():
+    np = pytest.importorskip("numpy")
+    values = [1, 2 ** 40, 2 ** 70]
+    arr = np.array(values, dtype=object)
+    assert sum_of_squares(arr) == sum(x * x for x in values)
+    assert sum_even_odd(arr) == (2 ** 40 + 2 ** 70, 1)
+    with pytest.raises(TypeError, match="index 1"):
+        sum_of_squares(np.array([1, "x"], dtype=object))
+
+
+def test_two_dimensional_array_iterates_rows():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(TypeError, match="index 0"):
+        sum_of_squares(np.arange(6).reshape(2, 3))
@@ -0,0 +1,112 @@
+import math
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from csv_stats import (csv_column_aggregates, finalise_statistics, merge_aggregates, multi_file_csv_statistics,
+                       streaming_csv_statistics)
+
+
+def full_read_statistics(path):
+    df = pd.read_csv(path)
+    return {column: {'mean': df[column].mean(), 'min': df[column].min(), 'max': df[column].max()}
+            for column in df.select_dtypes(include=['number']).columns}
+
+
+def assert_same_statistics(actual, expected):
+    assert list(actual) == list(expected)
+    for column, values in expected.items():
+        for name, value in values.items():
+            if isinstance(value, float) and math.isnan(value):
+                assert math.isnan(actual[column][name])
+            else:
+                assert actual[column][name] == pytest.approx(value)
+
+
+@pytest.fixture
+def mixed_csv(tmp_path):
+    path = tmp_path / "mixed.csv"
+    rows = ["name,age,salary,score,empty"]
+    for i in range(1000):
+        age = "" if i % 97 == 0 else str(20 + i % 40)
+        rows.append(f"user{i},{age},{30000 + i * 7},{(i * 37) % 101 / 3:.4f},")
+    path.write_text("\n".join(rows) + "\n")
+    return path
+
+
+def test_streaming_matches_full_read(mixed_csv):
+    expected = full_read_statistics(mixed_csv)
+    for chunksize in (1, 7, 1000, 5000):
+        assert_same_statistics(streaming_csv_statistics(mixed_csv, chunksize=chunksize), expected)
+
+
+def test_integer_columns_keep_integer_min_max(mixed_csv):
+    stats = streaming_csv_statistics(mixed_csv, chunksize=64)
+    assert stats['salary']['min'] == 30000
+    assert stats['salary']['min'].dtype.kind == 'i'
+
+
+def test_column_with_text_beyond_sample_is_dropped(tmp_path):
+    path = tmp_path / "late_text.csv"
+    values = [f"{i}.5" for i in range(50)] + ["unknown"]
+    path.write_text("value,other\n" + "\n".join(f"{v},{i}" for i, v in enumerate(values)) + "\n")
+    aggregates = csv_column_aggregates(path, chunksize=10, sample_rows=20)
+    assert list(aggregates) == ['other']
+    assert aggregates['other']['count'] == 51
+
+
+def test_explicit_dtype_limits_columns(mixed_csv):
+    stats = streaming_csv_statistics(mixed_csv, chunksize=100, dtype={'score': 'float64'})
+    assert list(stats) == ['score']
+
+
+def test_merge_aggregates_and_finalise():
+    parts = [
+        {'a': {'count': 2, 'sum': 3, 'min': 1, 'max': 2}},
+        {'a': {'count': 1, 'sum': 10, 'min': 10, 'max': 10},
+         'b': {'count': 0, 'sum': 0, 'min': None, 'max': None}},
+    ]
+    stats = finalise_statistics(merge_aggregates(parts))
+    assert stats['a'] == {'mean': 13 / 3, 'min': 1, 'max': 10}
+    assert math.isnan(stats['b']['mean'])
+
+
+def test_invalid_chunksize(mixed_csv):
+    with pytest.raises(ValueError):
+        csv_column_aggregates(mixed_csv, chunksize=0)
+
+
+@pytest.fixture
+def daily_csvs(tmp_path):
+    directory = tmp_path / "daily"
+    directory.mkdir()
+    for day in range(5):
+        rows = ["city,visits,revenue"] + [f"c{i},{day * 10 + i},{(day + 1) * i / 4}" for i in range(30)]
+        (directory / f"2024-01-0{day + 1}.csv").write_text("\n".join(rows) + "\n")
+    (directory / "notes.txt").write_text("not a csv")
+    return directory
+
+
+def test_multi_file_statistics_match_concatenated_read(daily_csvs):
+    paths = sorted(daily_csvs.glob("*.csv"))
+    combined = pd.concat([pd.read_csv(path) for path in paths])
+    combined_path = daily_csvs.parent / "combined.csv"
+    combined.to_csv(combined_path, index=False)
+
+    for workers in (1, 2):
+        report = multi_file_csv_statistics(daily_csvs, workers=workers, chunksize=8)
+        assert_same_statistics(report['statistics'], full_read_statistics(combined_path))
+        assert list(report['files']) == [str(path) for path in paths]
+        assert_same_statistics(report['files'][str(paths[2])], full_read_statistics(paths[2]))
+        assert report['file_count'] == 5
+        assert report['bytes'] == sum(path.stat().st_size for path in paths)
+        assert report['files_per_second'] > 0 and report['bytes_per_second'] > 0
+
+
+def test_multi_file_glob_and_errors(daily_csvs):
+    (daily_csvs / "2024-01-09.csv").write_text("")
+    report = multi_file_csv_statistics(str(daily_csvs / "2024-01-0[19].csv"), workers=2)
+    assert report['file_count'] == 1
+    assert list(report['errors']) == [str(daily_csvs / "2024-01-09.csv")]
+    assert report['statistics']['visits']['max'] == 29
@@ -0,0 +1,339 @@
+"""
+Compact Applicant Records
+A memory-efficient alternative to the free-form applicant dictionaries used by
+task4.py. Each applicant becomes a slotted dataclass whose categorical fields
+(education level, skill levels, interview and reference ratings) are stored as
+small integer codes, and whose repeated strings (skill, certification and
+position names) are interned so that large candidate pools share them.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from task4 import (
+    EDUCATION_SCORES,
+    INTERVIEW_SCORES,
+    REFERENCE_SCORES,
+    SCORING_WEIGHTS,
+    SKILL_LEVELS,
+    calculate_experience_score,
+)
+
+# Applicant keys that have a dedicated field on ApplicantRecord
+RECORD_KEYS = (
+    "name", "email", "position", "education_level", "education_relevant",
+    "experience_years", "skills", "certifications", "interview_performance",
+    "reference_quality", "date_added", "required_skills", "required_certifications"
+)
+
+
+class CodeTable:
+    """
+    Interning table mapping category strings to small integer codes
+
+    The table is seeded with the known categories of a score dictionary, so
+    the usual values always get the same codes. Values are case-folded
+    before encoding, as scoring ignores case anyway, so "Expert" and
+    "expert" share one code and the table only grows with genuinely new
+    categories, which are assigned codes on first use.
+    """
+
+    __slots__ = ("_codes", "_values", "_scores", "_score_map")
+
+    def __init__(self, score_map: Dict[str, float]):
+        self._codes: Dict[str, int] = {}
+        self._values: List[str] = []
+        self._scores: List[float] = []
+        self._score_map = score_map
+        for value in score_map:
+            self.encode(value)
+
+    def encode(self, value: str) -> int:
+        """Return the code for value (case-insensitive), assigning a new one if needed"""
+        value = value.lower()
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            if code > 255:
+                raise ValueError("Too many distinct categories to encode in one byte")
+            value = sys.intern(value)
+            self._codes[value] = code
+            self._values.append(value)
+            self._scores.append(self._score_map.get(value, 0))
+        return code
+
+    def decode(self, code: int) -> str:
+        """Return the (lower-case) category string for a code"""
+        return self._values[code]
+
+    def score(self, code: int) -> float:
+        """Return the precomputed score for a code"""
+        return self._scores[code]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+EDUCATION_CODES = CodeTable(EDUCATION_SCORES)
+SKILL_LEVEL_CODES = CodeTable(SKILL_LEVELS)
+INTERVIEW_CODES = CodeTable(INTERVIEW_SCORES)
+REFERENCE_CODES = CodeTable(REFERENCE_SCORES)
+
+
+def _intern_names(names: Iterable[str]) -> Tuple[str, ...]:
+    """Intern a sequence of names so equal names are shared across records"""
+    return tuple(sys.intern(name) for name in names)
+
+
+@dataclass(slots=True)
+class ApplicantRecord:
+    """
+    Compact representation of one applicant
+
+    Skills and certifications are stored column-wise: a tuple of interned
+    names plus a bytes object holding one level code (or validity flag)
+    per entry. Keys of the original dictionary without a dedicated field
+    (for example 'score' or 'score_breakdown') are kept in `extras`.
+    """
+
+    name: str
+    email: Optional[str]
+    position: str
+    education: int
+    education_relevant: bool
+    experience_years: float
+    skill_names: Tuple[str, ...]
+    skill_levels: bytes
+    cert_names: Tuple[str, ...]
+    cert_valid: bytes
+    interview: int
+    references: int
+    date_added: Optional[str] = None
+    required_skills: Optional[Tuple[str, ...]] = None
+    required_certifications: Optional[Tuple[str, ...]] = None
+    extras: Optional[Dict] = None
+
+    @classmethod
+    def from_dict(cls, applicant: Dict) -> "ApplicantRecord":
+        """
+        Build a record from an applicant dictionary in the task4.py format
+
+        Missing fields take the same defaults that calculate_total_score uses.
+        """
+        skills = applicant.get("skills", []) or []
+        certifications = applicant.get("certifications", []) or []
+        required_skills = applicant.get("required_skills")
+        required_certs = applicant.get("required_certifications")
+        extras = {k: v for k, v in applicant.items() if k not in RECORD_KEYS}
+
+        return cls(
+            name=applicant.get("name", ""),
+            email=applicant.get("email"),
+            position=sys.intern(applicant.get("position") or ""),
+            education=EDUCATION_CODES.encode(applicant.get("education_level", "")),
+            education_relevant=bool(applicant.get("education_relevant", True)),
+            experience_years=applicant.get("experience_years", 0),
+            skill_names=_intern_names(skill.get("name", "") for skill in skills),
+            skill_levels=bytes(
+                SKILL_LEVEL_CODES.encode(skill.get("level", "beginner")) for skill in skills
+            ),
+            cert_names=_intern_names(cert.get("name", "") for cert in certifications),
+            cert_valid=bytes(bool(cert.get("valid", True)) for cert in certifications),
+            interview=INTERVIEW_CODES.encode(applicant.get("interview_performance", "fair")),
+            references=REFERENCE_CODES.encode(applicant.get("reference_quality", "fair")),
+            date_added=applicant.get("date_added"),
+            required_skills=_intern_names(required_skills) if required_skills else None,
+            required_certifications=_intern_names(required_certs) if required_certs else None,
+            extras=extras or None,
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert the record back into an applicant dictionary"""
+        applicant = {
+            "name": self.name,
+            "email": self.email,
+            "position": self.position,
+            "education_level": EDUCATION_CODES.decode(self.education),
+            "education_relevant": self.education_relevant,
+            "experience_years": self.experience_years,
+            "skills": [
+                {"name": name, "level": SKILL_LEVEL_CODES.decode(code)}
+                for name, code in zip(self.skill_names, self.skill_levels)
+            ],
+            "certifications": [
+                {"name": name, "valid": bool(valid)}
+                for name, valid in zip(self.cert_names, self.cert_valid)
+            ],
+            "interview_performance": INTERVIEW_CODES.decode(self.interview),
+            "reference_quality": REFERENCE_CODES.decode(self.references),
+            "date_added": self.date_added,
+        }
+        if self.required_skills is not None:
+            applicant["required_skills"] = list(self.required_skills)
+        if self.required_certifications is not None:
+            applicant["required_certifications"] = list(self.required_certifications)
+        if self.extras:
+            applicant.update(self.extras)
+        return applicant
+
+
+def records_from_dicts(applicants: Iterable[Dict]) -> Iterator[ApplicantRecord]:
+    """Lazily convert applicant dictionaries into compact records"""
+    for applicant in applicants:
+        yield ApplicantRecord.from_dict(applicant)
+
+
+def records_to_dicts(records: Iterable[ApplicantRecord]) -> Iterator[Dict]:
+    """Lazily convert compact records back into applicant dictionaries"""
+    for record in records:
+        yield record.to_dict()
+
+
+def _coverage_count(names: Tuple[str, ...], required: Tuple[str, ...]) -> int:
+    """Count entries whose name (case-insensitive) appears in the required list"""
+    required_lower = {name.lower() for name in required}
+    return sum(1 for name in names if name.lower() in required_lower)
+
+
+def calculate_record_score(record: ApplicantRecord, weights: Dict = None) -> Tuple[float, Dict]:
+    """
+    Calculate the total weighted score for a compact record
+
+    Produces the same result as task4.calculate_total_score on the equivalent
+    dictionary, but looks up precomputed per-code scores instead of
+    lowercasing and hashing category strings.
+
+    Args:
+        record: Applicant record
+        weights: Optional custom weights dictionary
+
+    Returns:
+        Tuple of (total_score, score_breakdown)
+    """
+    if weights is None:
+        weights = SCORING_WEIGHTS
+
+    # Education: base score plus relevant-field bonus
+    education_score = EDUCATION_CODES.score(record.education)
+    if record.education_relevant and education_score > 0:
+        education_score = min(100, education_score + 5)
+
+    experience_score = calculate_experience_score(record.experience_years)
+
+    # Skills: average proficiency plus required-skill coverage bonus
+    skills_score = 0
+    if record.skill_levels:
+        skill_score = SKILL_LEVEL_CODES.score
+        skills_score = sum(skill_score(code) for code in record.skill_levels) / len(record.skill_levels)
+        if record.required_skills:
+            required_count = _coverage_count(record.skill_names, record.required_skills)
+            if required_count > 0:
+                coverage_bonus = (required_count / len(record.required_skills)) * 20
+                skills_score = min(100, skills_score + coverage_bonus)
+
+    # Certifications: share of valid certifications plus coverage bonus
+    certifications_score = 0
+    if record.cert_valid:
+        certifications_score = (sum(record.cert_valid) / len(record.cert_valid)) * 100
+        if record.required_certifications:
+            required_count = _coverage_count(record.cert_names, record.required_certifications)
+            if required_count > 0:
+                coverage_bonus = (required_count / len(record.required_certifications)) * 30
+                certifications_score = min(100, certifications_score + coverage_bonus)
+
+    interview_score = INTERVIEW_CODES.score(record.interview)
+    references_score = REFERENCE_CODES.score(record.references)
+
+    total_score = (
+        education_score * weights.get("education", 0.25) +
+        experience_score * weights.get("experience", 0.30) +
+        skills_score * weights.get("skills", 0.20) +
+        certifications_score * weights.get("certifications", 0.10) +
+        interview_score * weights.get("interview", 0.10) +
+        references_score * weights.get("references", 0.05)
+    )
+
+    score_breakdown = {
+        "education": education_score,
+        "experience": experience_score,
+        "skills": skills_score,
+        "certifications": certifications_score,
+        "interview": interview_score,
+        "references": references_score,
+        "total": total_score
+    }
+
+    return total_score, score_breakdown
+
+
+def score_records(records: List[ApplicantRecord], weights: Dict = None) -> List[Tuple[float, ApplicantRecord]]:
+    """
+    Score records and return (score, record) pairs sorted by score (descending)
+
+    Scores are kept next to the records rather than copied into new
+    dictionaries, so the ranked pool stays compact.
+    """
+    scored = [(calculate_record_score(record, weights)[0], record) for record in records]
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return scored
+
+
+def main():
+    """Compare the memory footprint of dictionaries and compact records"""
+    import random
+    import tracemalloc
+
+    from task4 import calculate_total_score
+
+    skill_names = ["python", "sql", "communication", "testing", "java", "excel", "leadership"]
+    levels = list(SKILL_LEVELS)
+    ratings = list(INTERVIEW_SCORES)
+    pool_size = 20000
+
+    def make_applicant(i):
+        return {
+            "name": f"Applicant {i}",
+            "email": f"applicant{i}@example.com",
+            "position": "Engineer",
+            "education_level": random.choice(list(EDUCATION_SCORES)),
+            "education_relevant": random.random() < 0.7,
+            "experience_years": round(random.uniform(0, 15), 1),
+            "skills": [{"name": random.choice(skill_names), "level": random.choice(levels)}
+                       for _ in range(random.randint(1, 6))],
+            "certifications": [{"name": f"cert {random.randint(1, 20)}", "valid": random.random() < 0.9}
+                               for _ in range(random.randint(0, 3))],
+            "interview_performance": random.choice(ratings),
+            "reference_quality": random.choice(ratings),
+            "date_added": "2025-01-01T00:00:00",
+        }
+
+    random.seed(0)
+    tracemalloc.start()
+    applicants = [make_applicant(i) for i in range(pool_size)]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    random.seed(0)
+    tracemalloc.start()
+    records = list(records_from_dicts(make_applicant(i) for i in range(pool_size)))
+    record_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    mismatches = sum(
+        1 for applicant, record in zip(applicants, records)
+        if abs(calculate_total_score(applicant)[0] - calculate_record_score(record)[0]) > 1e-9
+    )
+
+    print("=" * 60)
+    print("Compact Applicant Record Memory Comparison")
+    print("=" * 60)
+    print(f"Applicants:          {pool_size}")
+    print(f"Dictionaries:        {dict_bytes / pool_size:8.0f} bytes/applicant")
+    print(f"ApplicantRecord:     {record_bytes / pool_size:8.0f} bytes/applicant")
+    print(f"Reduction:           {dict_bytes / record_bytes:8.1f}x")
+    print(f"Score mismatches:    {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
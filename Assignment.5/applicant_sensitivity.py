@@ -0,0 +1,222 @@
+"""
+Sensitivity and What-If Analysis for Applicant Rankings
+Builds on the scoring in task4.py. Because the total score is a weighted sum
+of component scores, every question about changing weights can be answered
+from the stored score breakdowns alone, without re-scoring any applicant:
+
+- weight_sensitivity: how far each weight in SCORING_WEIGHTS can move
+  (others held fixed) before the top-K set changes
+- rerank_with_weights: rank applicants under different weights
+- marginal_gains: total score gained from one extra skill level or one
+  extra valid certification
+"""
+
+import math
+from typing import Dict, List, Optional
+
+from task4 import (
+    SCORING_WEIGHTS,
+    SKILL_LEVELS,
+    calculate_certifications_score,
+    calculate_skills_score,
+    score_applicants,
+)
+
+# Components in the order used by score breakdowns
+COMPONENTS = tuple(SCORING_WEIGHTS)
+
+# Skill levels ordered from lowest to highest score
+SKILL_LEVEL_ORDER = sorted(SKILL_LEVELS, key=SKILL_LEVELS.get)
+
+
+def _weighted_total(breakdown: Dict, weights: Dict) -> float:
+    """Recompute a total score from a breakdown and a set of weights"""
+    return sum(breakdown.get(component, 0) * weights.get(component, SCORING_WEIGHTS[component])
+               for component in COMPONENTS)
+
+
+def rerank_with_weights(scored_applicants: List[Dict], weights: Dict) -> List[Dict]:
+    """
+    Rank already-scored applicants under a different set of weights
+
+    Component scores do not depend on weights, so only the weighted sums
+    are recomputed.
+
+    Args:
+        scored_applicants: Output of task4.score_applicants
+        weights: Weights dictionary to apply
+
+    Returns:
+        New list of applicants with updated 'score' and 'score_breakdown',
+        sorted by total score (descending)
+    """
+    reranked = []
+    for applicant in scored_applicants:
+        breakdown = dict(applicant["score_breakdown"])
+        breakdown["total"] = _weighted_total(breakdown, weights)
+        reranked.append({**applicant, "score": breakdown["total"], "score_breakdown": breakdown})
+
+    reranked.sort(key=lambda x: x["score"], reverse=True)
+    return reranked
+
+
+def weight_sensitivity(scored_applicants: List[Dict], top_k: int,
+                       weights: Dict = None) -> Dict[str, Dict[str, float]]:
+    """
+    Compute how far each weight can move before the top-K set changes
+
+    Changing weight c by delta changes applicant i's total by delta * s_ic,
+    where s_ic is the component score. An outsider j overtakes an insider i
+    exactly when delta = (t_i - t_j) / (s_jc - s_ic), so the stable range
+    for each weight is bounded by the nearest such crossing in each
+    direction. Weights are not allowed to become negative.
+
+    Args:
+        scored_applicants: Ranked output of task4.score_applicants
+        top_k: Size of the selected set (the first top_k applicants)
+        weights: Weights the ranking was produced with (default SCORING_WEIGHTS)
+
+    Returns:
+        Dictionary mapping each component to its 'weight', 'min_weight',
+        'max_weight', 'max_decrease' and 'max_increase'. Unbounded
+        directions are reported as math.inf.
+    """
+    if weights is None:
+        weights = SCORING_WEIGHTS
+
+    breakdowns = [applicant["score_breakdown"] for applicant in scored_applicants]
+    totals = [_weighted_total(breakdown, weights) for breakdown in breakdowns]
+    insiders = range(min(top_k, len(breakdowns)))
+    outsiders = range(len(insiders), len(breakdowns))
+
+    sensitivity = {}
+    for component in COMPONENTS:
+        weight = weights.get(component, SCORING_WEIGHTS[component])
+        scores = [breakdown.get(component, 0) for breakdown in breakdowns]
+        increase = math.inf
+        decrease = math.inf
+
+        for i in insiders:
+            t_i, s_i = totals[i], scores[i]
+            for j in outsiders:
+                slope = scores[j] - s_i
+                gap = t_i - totals[j]
+                if slope > 0:
+                    increase = min(increase, gap / slope)
+                elif slope < 0:
+                    decrease = min(decrease, gap / -slope)
+
+        decrease = min(decrease, weight)
+        sensitivity[component] = {
+            "weight": weight,
+            "min_weight": weight - decrease,
+            "max_weight": weight + increase,
+            "max_decrease": decrease,
+            "max_increase": increase,
+        }
+
+    return sensitivity
+
+
+def _next_skill_level(level: str) -> Optional[str]:
+    """Return the next higher skill level, or None if already at the top"""
+    level = level.lower()
+    if level not in SKILL_LEVELS:
+        return SKILL_LEVEL_ORDER[0]
+    index = SKILL_LEVEL_ORDER.index(level)
+    if index + 1 < len(SKILL_LEVEL_ORDER):
+        return SKILL_LEVEL_ORDER[index + 1]
+    return None
+
+
+def marginal_gains(applicant: Dict, weights: Dict = None) -> Dict:
+    """
+    Compute the total score gained from one extra skill level or certification
+
+    Only the affected component is recomputed; the change in the total is
+    the component change times its weight.
+
+    Args:
+        applicant: Scored applicant dictionary (needs 'score_breakdown')
+        weights: Weights dictionary (default SCORING_WEIGHTS)
+
+    Returns:
+        Dictionary with:
+        - 'skill_level': best total gain from raising one skill by one level
+        - 'skill_to_upgrade': name of that skill (None if no upgrade helps)
+        - 'certification': total gain from one additional valid certification
+    """
+    if weights is None:
+        weights = SCORING_WEIGHTS
+
+    breakdown = applicant["score_breakdown"]
+    skills = applicant.get("skills", [])
+    required_skills = applicant.get("required_skills", None)
+
+    best_skill_gain = 0.0
+    skill_to_upgrade = None
+    for index, skill in enumerate(skills):
+        next_level = _next_skill_level(skill.get("level", "beginner"))
+        if next_level is None:
+            continue
+        upgraded = list(skills)
+        upgraded[index] = {**skill, "level": next_level}
+        gain = calculate_skills_score(upgraded, required_skills) - breakdown["skills"]
+        if gain > best_skill_gain:
+            best_skill_gain = gain
+            skill_to_upgrade = skill.get("name")
+
+    certifications = applicant.get("certifications", [])
+    extra_cert = certifications + [{"name": "", "valid": True}]
+    cert_gain = calculate_certifications_score(
+        extra_cert, applicant.get("required_certifications", None)
+    ) - breakdown["certifications"]
+
+    return {
+        "skill_level": best_skill_gain * weights.get("skills", SCORING_WEIGHTS["skills"]),
+        "skill_to_upgrade": skill_to_upgrade,
+        "certification": cert_gain * weights.get("certifications", SCORING_WEIGHTS["certifications"]),
+    }
+
+
+def main():
+    """Demonstrate sensitivity analysis on a small applicant pool"""
+    applicants = [
+        {"name": "Asha", "education_level": "master", "experience_years": 6,
+         "skills": [{"name": "python", "level": "advanced"}, {"name": "sql", "level": "intermediate"}],
+         "certifications": [{"name": "aws", "valid": True}],
+         "interview_performance": "very_good", "reference_quality": "good"},
+        {"name": "Ben", "education_level": "bachelor", "experience_years": 12,
+         "skills": [{"name": "java", "level": "expert"}],
+         "certifications": [],
+         "interview_performance": "good", "reference_quality": "excellent"},
+        {"name": "Chen", "education_level": "phd", "experience_years": 1.5,
+         "skills": [{"name": "python", "level": "expert"}, {"name": "ml", "level": "advanced"}],
+         "certifications": [{"name": "gcp", "valid": True}, {"name": "old", "valid": False}],
+         "interview_performance": "excellent", "reference_quality": "very_good"},
+        {"name": "Dana", "education_level": "associate", "experience_years": 3,
+         "skills": [{"name": "excel", "level": "beginner"}],
+         "certifications": [{"name": "pmp", "valid": True}],
+         "interview_performance": "fair", "reference_quality": "fair"},
+    ]
+    top_k = 2
+    ranked = score_applicants(applicants)
+
+    print("=" * 70)
+    print(f"WEIGHT SENSITIVITY (top {top_k}: {', '.join(a['name'] for a in ranked[:top_k])})")
+    print("=" * 70)
+    for component, result in weight_sensitivity(ranked, top_k).items():
+        print(f"{component:<15} weight {result['weight']:.2f}  "
+              f"stable range [{result['min_weight']:.3f}, {result['max_weight']:.3f}]")
+
+    print("\n" + "=" * 70)
+    print("MARGINAL GAINS")
+    print("=" * 70)
+    for applicant in ranked:
+        gains = marginal_gains(applicant)
+        print(f"{applicant['name']:<10} +1 skill level: {gains['skill_level']:6.2f} "
+              f"({gains['skill_to_upgrade']})  +1 certification: {gains['certification']:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Benchmark and Profiling Suite for the Job Applicant Scoring System
+Generates synthetic applicant pools and measures the cost of each component
+scorer, calculate_total_score and score_applicants from task4.py, plus the
+compiled-rule and compact-record scorers built on top of it.
+
+Results are appended to a JSON Lines history file so that runs can be
+compared over time, and an optional cProfile dump can be written for
+inspection with pstats, snakeviz or any flame-graph viewer.
+
+Usage:
+    python benchmark_scoring.py --applicants 10000 --skills 5
+    python benchmark_scoring.py --profile scoring.prof
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import platform
+import pstats
+import random
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from task4 import (
+    EDUCATION_SCORES,
+    INTERVIEW_SCORES,
+    REFERENCE_SCORES,
+    SKILL_LEVELS,
+    calculate_certifications_score,
+    calculate_education_score,
+    calculate_experience_score,
+    calculate_interview_score,
+    calculate_references_score,
+    calculate_skills_score,
+    calculate_total_score,
+    score_applicants,
+)
+from applicant_record import calculate_record_score, records_from_dicts
+from scoring_rules import DEFAULT_COMPILED_RULES
+
+DEFAULT_HISTORY_FILE = "benchmark_history.jsonl"
+
+SKILL_NAMES = ["python", "sql", "java", "excel", "communication", "testing",
+               "leadership", "cloud", "statistics", "design"]
+
+
+def generate_applicants(count: int, skills_per_applicant: int = 5,
+                        certifications_per_applicant: int = 2, seed: int = 0) -> List[Dict]:
+    """
+    Generate a reproducible synthetic applicant pool
+
+    Args:
+        count: Number of applicants
+        skills_per_applicant: Length of each applicant's skill list
+        certifications_per_applicant: Length of each certification list
+        seed: Random seed
+
+    Returns:
+        List of applicant dictionaries in the task4.py format
+    """
+    rng = random.Random(seed)
+    education_levels = list(EDUCATION_SCORES)
+    skill_levels = list(SKILL_LEVELS)
+    ratings = list(INTERVIEW_SCORES)
+    required_skills = SKILL_NAMES[:3]
+
+    applicants = []
+    for i in range(count):
+        applicants.append({
+            "name": f"Applicant {i}",
+            "email": f"applicant{i}@example.com",
+            "position": "Engineer",
+            "education_level": rng.choice(education_levels),
+            "education_relevant": rng.random() < 0.7,
+            "experience_years": round(rng.uniform(0, 15), 1),
+            "skills": [{"name": rng.choice(SKILL_NAMES), "level": rng.choice(skill_levels)}
+                       for _ in range(skills_per_applicant)],
+            "certifications": [{"name": f"cert {rng.randint(1, 20)}", "valid": rng.random() < 0.9}
+                               for _ in range(certifications_per_applicant)],
+            "required_skills": required_skills,
+            "interview_performance": rng.choice(ratings),
+            "reference_quality": rng.choice(list(REFERENCE_SCORES)),
+        })
+    return applicants
+
+
+def time_call(func: Callable, repeat: int = 5) -> float:
+    """Return the best wall-clock time in seconds over `repeat` runs of func()"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_components(applicants: List[Dict], repeat: int = 5) -> Dict[str, float]:
+    """
+    Time each scorer over the whole pool
+
+    Returns:
+        Dictionary mapping benchmark name to nanoseconds per applicant
+    """
+    records = list(records_from_dicts(applicants))
+    benchmarks = {
+        "education": lambda: [calculate_education_score(a["education_level"], a["education_relevant"])
+                              for a in applicants],
+        "experience": lambda: [calculate_experience_score(a["experience_years"]) for a in applicants],
+        "skills": lambda: [calculate_skills_score(a["skills"], a["required_skills"]) for a in applicants],
+        "certifications": lambda: [calculate_certifications_score(a["certifications"]) for a in applicants],
+        "interview": lambda: [calculate_interview_score(a["interview_performance"]) for a in applicants],
+        "references": lambda: [calculate_references_score(a["reference_quality"]) for a in applicants],
+        "calculate_total_score": lambda: [calculate_total_score(a) for a in applicants],
+        "score_applicants": lambda: score_applicants(applicants),
+        "compiled_rules_total": lambda: [DEFAULT_COMPILED_RULES.total_score(a) for a in applicants],
+        "record_total": lambda: [calculate_record_score(r) for r in records],
+    }
+
+    count = max(len(applicants), 1)
+    return {name: time_call(func, repeat) * 1e9 / count for name, func in benchmarks.items()}
+
+
+def profile_scoring(applicants: List[Dict], output_file: str, top: int = 15):
+    """Profile score_applicants with cProfile, save the stats and print the hottest calls"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    score_applicants(applicants)
+    profiler.disable()
+    profiler.dump_stats(output_file)
+
+    print(f"\n[SAVED] cProfile stats saved to {output_file}")
+    print("        (view with: python -m pstats, snakeviz, or convert for a flame graph)")
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(top)
+
+
+def load_history(filename: str) -> List[Dict]:
+    """Load previous benchmark runs from a JSON Lines history file"""
+    if not os.path.exists(filename):
+        return []
+    with open(filename, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(run: Dict, filename: str):
+    """Append one benchmark run to the JSON Lines history file"""
+    with open(filename, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run) + "\n")
+
+
+def find_previous_run(history: List[Dict], params: Dict) -> Optional[Dict]:
+    """Return the most recent run with the same parameters, if any"""
+    for run in reversed(history):
+        if run.get("params") == params:
+            return run
+    return None
+
+
+def display_results(results: Dict[str, float], previous: Optional[Dict] = None):
+    """Print per-applicant timings, with the change since the previous comparable run"""
+    print("\n" + "=" * 70)
+    print("SCORING BENCHMARK (nanoseconds per applicant, best of runs)")
+    print("=" * 70)
+    print(f"{'Benchmark':<25} {'ns/applicant':>14} {'Previous':>14} {'Change':>10}")
+    print("-" * 70)
+    for name, value in results.items():
+        line = f"{name:<25} {value:>14.0f}"
+        if previous and name in previous["results"]:
+            old = previous["results"][name]
+            change = (value - old) / old * 100 if old else 0.0
+            line += f" {old:>14.0f} {change:>+9.1f}%"
+        print(line)
+    print("-" * 70)
+
+
+def main():
+    """Parse command-line options and run the benchmark suite"""
+    parser = argparse.ArgumentParser(description="Benchmark the applicant scoring hot path")
+    parser.add_argument("--applicants", type=int, default=10000, help="Pool size")
+    parser.add_argument("--skills", type=int, default=5, help="Skills per applicant")
+    parser.add_argument("--certifications", type=int, default=2, help="Certifications per applicant")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic pool")
+    parser.add_argument("--profile", metavar="FILE", help="Write cProfile stats for score_applicants")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_FILE, help="JSON Lines history file")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+    args = parser.parse_args()
+
+    params = {
+        "applicants": args.applicants,
+        "skills": args.skills,
+        "certifications": args.certifications,
+        "seed": args.seed,
+    }
+    applicants = generate_applicants(args.applicants, args.skills, args.certifications, args.seed)
+    results = benchmark_components(applicants, args.repeat)
+
+    history = load_history(args.history)
+    display_results(results, find_previous_run(history, params))
+
+    if not args.no_history:
+        append_history({
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "params": params,
+            "results": results,
+        }, args.history)
+        print(f"[SAVED] Run recorded in {args.history}")
+
+    if args.profile:
+        profile_scoring(applicants, args.profile)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Fast Fibonacci Number Engine
+
+Companion to task3.py. fibonacci_recursive is O(2^n) and fibonacci_memoized
+is O(n) but recursive (RecursionError around n=1000) and starts a new memo on
+every call. This module adds:
+
+- fibonacci_fast_doubling: O(log n) arithmetic steps using the identities
+      F(2k)   = F(k) * (2*F(k+1) - F(k))
+      F(2k+1) = F(k)^2 + F(k+1)^2
+  iteratively, so it handles n in the millions (F(n) with 10^6+ digits)
+- fibonacci_matrix: O(log n) 2x2 matrix exponentiation of [[1, 1], [1, 0]]
+- fibonacci_mod: F(n) mod m without ever building the huge F(n)
+- fibonacci_cached: fast doubling behind a bounded LRU memo shared by all calls
+
+Author: Generated for Assignment 5
+Date: 2024
+"""
+
+import sys
+import time
+from functools import lru_cache
+
+from task3 import fibonacci_memoized, fibonacci_recursive
+
+# Maximum number of results kept by fibonacci_cached
+FIB_CACHE_SIZE = 1024
+
+
+def _validate(n):
+    """Raise ValueError for negative n, matching task3.py"""
+    if n < 0:
+        raise ValueError("Fibonacci number is only defined for non-negative integers")
+
+
+def _fib_pair(n, m=None):
+    """
+    Return (F(n), F(n+1)) by fast doubling, optionally reduced modulo m.
+
+    Walks the bits of n from the most significant end, so there is no
+    recursion and the number of steps is the bit length of n.
+    """
+    a, b = 0, 1  # F(0), F(1)
+    for bit in bin(n)[2:]:
+        # Doubling step: (F(k), F(k+1)) -> (F(2k), F(2k+1))
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if m is not None:
+            c %= m
+            d %= m
+        # If the bit is set, advance one more: (F(2k+1), F(2k+2))
+        if bit == "1":
+            a, b = d, c + d
+            if m is not None:
+                b %= m
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fibonacci_fast_doubling(n):
+    """
+    Calculate the nth Fibonacci number using fast doubling.
+
+    Args:
+        n (int): The position in the Fibonacci sequence (non-negative integer).
+
+    Returns:
+        int: The nth Fibonacci number.
+
+    Raises:
+        ValueError: If n is negative.
+
+    Examples:
+        >>> fibonacci_fast_doubling(10)
+        55
+        >>> fibonacci_fast_doubling(100)
+        354224848179261915075
+    """
+    _validate(n)
+    return _fib_pair(n)[0]
+
+
+def _matrix_multiply(x, y, m=None):
+    """Multiply two 2x2 matrices stored as (a, b, c, d) tuples, optionally mod m"""
+    a = x[0] * y[0] + x[1] * y[2]
+    b = x[0] * y[1] + x[1] * y[3]
+    c = x[2] * y[0] + x[3] * y[2]
+    d = x[2] * y[1] + x[3] * y[3]
+    if m is not None:
+        return a % m, b % m, c % m, d % m
+    return a, b, c, d
+
+
+def fibonacci_matrix(n, m=None):
+    """
+    Calculate the nth Fibonacci number by matrix exponentiation.
+
+    Uses [[1, 1], [1, 0]]^n = [[F(n+1), F(n)], [F(n), F(n-1)]] with
+    square-and-multiply. Slower than fast doubling by a constant factor,
+    kept as an independent cross-check.
+
+    Args:
+        n (int): The position in the Fibonacci sequence (non-negative integer).
+        m (int, optional): If given, the result is reduced modulo m.
+
+    Returns:
+        int: The nth Fibonacci number (mod m if m is given).
+
+    Raises:
+        ValueError: If n is negative or m is not positive.
+
+    Examples:
+        >>> fibonacci_matrix(10)
+        55
+        >>> fibonacci_matrix(10, 7)
+        6
+    """
+    _validate(n)
+    if m is not None and m <= 0:
+        raise ValueError("Modulus must be a positive integer")
+
+    result = (1, 0, 0, 1)  # Identity matrix
+    base = (1, 1, 1, 0)
+    while n:
+        if n & 1:
+            result = _matrix_multiply(result, base, m)
+        base = _matrix_multiply(base, base, m)
+        n >>= 1
+    return result[1] % m if m is not None else result[1]
+
+
+def fibonacci_mod(n, m):
+    """
+    Calculate F(n) mod m using fast doubling with modular reduction.
+
+    Intermediate values never exceed m^2, so this is fast even for
+    astronomically large n.
+
+    Args:
+        n (int): The position in the Fibonacci sequence (non-negative integer).
+        m (int): Positive modulus.
+
+    Returns:
+        int: F(n) mod m.
+
+    Raises:
+        ValueError: If n is negative or m is not positive.
+
+    Examples:
+        >>> fibonacci_mod(10, 7)
+        6
+        >>> fibonacci_mod(10**18, 10**9 + 7)
+        209783453
+    """
+    _validate(n)
+    if m <= 0:
+        raise ValueError("Modulus must be a positive integer")
+    return _fib_pair(n, m)[0] % m
+
+
+@lru_cache(maxsize=FIB_CACHE_SIZE)
+def fibonacci_cached(n):
+    """
+    Calculate the nth Fibonacci number with a memo shared across calls.
+
+    Results are kept in a bounded LRU cache (FIB_CACHE_SIZE entries), so
+    repeated queries are O(1) while memory stays bounded. Use
+    fibonacci_cached.cache_info() / cache_clear() to inspect or reset it.
+
+    Examples:
+        >>> fibonacci_cached(30)
+        832040
+    """
+    return fibonacci_fast_doubling(n)
+
+
+def _time(func, *args):
+    """Return (result, seconds) for one call"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_fibonacci():
+    """Compare every Fibonacci implementation on sizes each can handle."""
+    cases = [
+        ("fibonacci_recursive", fibonacci_recursive, [20, 25]),
+        ("fibonacci_memoized", fibonacci_memoized, [500, 900]),
+        ("fibonacci_matrix", fibonacci_matrix, [900, 10**5, 10**6]),
+        ("fibonacci_fast_doubling", fibonacci_fast_doubling, [900, 10**5, 10**6, 5 * 10**6]),
+        ("fibonacci_cached (repeat)", fibonacci_cached, [10**5, 10**5]),
+    ]
+
+    print("=" * 60)
+    print("Fibonacci Benchmark")
+    print("=" * 60)
+    print(f"{'Method':<28} {'n':>10} {'Time (s)':>12} {'Bits':>12}")
+    print("-" * 60)
+    for name, func, sizes in cases:
+        for n in sizes:
+            result, seconds = _time(func, n)
+            print(f"{name:<28} {n:>10} {seconds:>12.6f} {result.bit_length():>12}")
+
+    n, m = 10**18, 10**9 + 7
+    result, seconds = _time(fibonacci_mod, n, m)
+    print(f"{'fibonacci_mod':<28} {'10^18':>10} {seconds:>12.6f} {'mod 1e9+7':>12}")
+    print("-" * 60)
+
+    # Cross-check the implementations against each other
+    assert fibonacci_fast_doubling(900) == fibonacci_memoized(900) == fibonacci_matrix(900)
+    assert fibonacci_mod(12345, 1000) == fibonacci_fast_doubling(12345) % 1000
+    print("All implementations agree.")
+
+
+def main():
+    """Accept n from the keyboard and print F(n) using fast doubling."""
+    # Python 3.11+ limits int-to-str conversion of very large integers
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
+
+    benchmark_fibonacci()
+    print()
+
+    while True:
+        try:
+            user_input = input("Enter n to calculate F(n) (or 'q' to quit): ").strip()
+            if user_input.lower() in ("q", "quit"):
+                print("Goodbye!")
+                break
+
+            n = int(user_input)
+            result, seconds = _time(fibonacci_fast_doubling, n)
+            digits = str(result)
+            if len(digits) > 60:
+                print(f"F({n}) = {digits[:30]}...{digits[-30:]} ({len(digits)} digits, {seconds:.4f}s)")
+            else:
+                print(f"F({n}) = {digits} ({seconds:.6f}s)")
+        except ValueError as e:
+            print(f"Error: {e}")
+        except KeyboardInterrupt:
+            print("\nProgram interrupted by user. Goodbye!")
+            break
+
+
+if __name__ == "__main__":
+    main()
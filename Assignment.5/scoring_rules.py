@@ -0,0 +1,334 @@
+"""
+Declarative Scoring Rules for the Job Applicant Scoring System
+Scoring rules (weights, lookup tables and experience thresholds) are described
+as plain data, usually a JSON file, and compiled once into lookup structures:
+
+- Lookup tables are precomputed dictionaries that already contain the common
+  spellings of each key, so most lookups need no lowercasing
+- Piecewise threshold rules (such as years of experience) become a sorted
+  breakpoint list searched with bisect instead of an if/elif chain
+
+Hiring teams can therefore change the rules by editing a config file, and
+the defaults reproduce the hard-coded rules in task4.py exactly. task4.py's
+menu scores with scoring_rules.json (via task4.load_scoring_rules) whenever
+that file sits next to it, and its score_applicants* functions take the
+compiled rules as `rules=`.
+
+Config format (every section is optional and merged over the defaults):
+
+{
+  "weights": {"education": 0.25, "experience": 0.30, ...},
+  "education": {"table": {"bachelor": 80, ...}, "default": 0, "relevant_bonus": 5},
+  "experience": {"breakpoints": [0, 1, 2, 5, 10], "scores": [0, 30, 50, 70, 85, 100]},
+  "skills": {"table": {"expert": 100, ...}, "default": 0,
+             "default_level": "beginner", "coverage_bonus": 20},
+  "certifications": {"coverage_bonus": 30},
+  "interview": {"table": {"good": 70, ...}, "default": 0, "default_rating": "fair"},
+  "references": {"table": {"good": 70, ...}, "default": 0, "default_rating": "fair"}
+}
+
+A threshold rule maps value x to scores[i], where i is the number of
+breakpoints less than or equal to x.
+"""
+
+import json
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+
+from task4 import (
+    EDUCATION_SCORES,
+    INTERVIEW_SCORES,
+    REFERENCE_SCORES,
+    SCORING_WEIGHTS,
+    SKILL_LEVELS,
+)
+
+# Defaults equivalent to the hard-coded rules in task4.py
+DEFAULT_RULES = {
+    "weights": dict(SCORING_WEIGHTS),
+    "education": {"table": dict(EDUCATION_SCORES), "default": 0, "relevant_bonus": 5},
+    "experience": {"breakpoints": [0, 1, 2, 5, 10], "scores": [0, 30, 50, 70, 85, 100]},
+    "skills": {"table": dict(SKILL_LEVELS), "default": 0,
+               "default_level": "beginner", "coverage_bonus": 20},
+    "certifications": {"coverage_bonus": 30},
+    "interview": {"table": dict(INTERVIEW_SCORES), "default": 0, "default_rating": "fair"},
+    "references": {"table": dict(REFERENCE_SCORES), "default": 0, "default_rating": "fair"},
+}
+
+
+class LookupTable(dict):
+    """
+    Case-insensitive score lookup compiled from a {category: score} table
+
+    Lowercase, uppercase and title-case spellings of each key are stored up
+    front, so `table[value]` is a single dictionary hit for the usual
+    spellings and only unusual ones fall back to lowercasing.
+    """
+
+    __slots__ = ("default",)
+
+    def __init__(self, table: Dict[str, float], default: float = 0):
+        super().__init__()
+        self.default = default
+        for key, score in table.items():
+            if not isinstance(key, str):
+                raise ValueError(f"Lookup table keys must be strings, got {key!r}")
+            key = key.lower()
+            for variant in (key, key.upper(), key.title()):
+                self[variant] = score
+
+    def __missing__(self, value: str) -> float:
+        return self.get(value.lower(), self.default)
+
+    def __call__(self, value: str) -> float:
+        return self[value]
+
+
+class ThresholdTable:
+    """Piecewise-constant score function compiled into a bisect table"""
+
+    __slots__ = ("_breakpoints", "_scores")
+
+    def __init__(self, breakpoints: List[float], scores: List[float]):
+        if len(scores) != len(breakpoints) + 1:
+            raise ValueError("A threshold rule needs exactly one more score than breakpoints")
+        if any(a >= b for a, b in zip(breakpoints, breakpoints[1:])):
+            raise ValueError("Threshold breakpoints must be strictly increasing")
+        self._breakpoints = list(breakpoints)
+        self._scores = list(scores)
+
+    def __call__(self, value: float) -> float:
+        return self._scores[bisect_right(self._breakpoints, value)]
+
+
+def _check_number(value, where: str):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Scoring rule {where} must be a number, got {value!r}")
+
+
+def _merge_section(name: str, base: Dict, override) -> Dict:
+    """Merge one config section over its defaults, validating its shape"""
+    if not isinstance(override, dict):
+        raise ValueError(f"Scoring rule section '{name}' must be an object, got {override!r}")
+    merged = {**base, **override}
+    if "table" in override:
+        if not isinstance(override["table"], dict):
+            raise ValueError(f"Scoring rule '{name}.table' must be an object")
+        # Tables are merged entry by entry, so a partial table only
+        # overrides (or adds) the categories it lists
+        merged["table"] = {**base["table"], **override["table"]}
+        for key, score in merged["table"].items():
+            _check_number(score, f"'{name}.table.{key}'")
+    for key in ("breakpoints", "scores"):
+        if key in merged and not isinstance(merged[key], list):
+            raise ValueError(f"Scoring rule '{name}.{key}' must be a list")
+    if name == "weights":
+        for key, weight in merged.items():
+            _check_number(weight, f"weight '{key}'")
+    return merged
+
+
+def merge_rules(config: Dict, base: Dict = None) -> Dict:
+    """
+    Merge a (possibly partial) rules config over base (default DEFAULT_RULES)
+
+    Sections and their lookup tables are merged key by key. Threshold rules
+    are replaced as a whole: "breakpoints" and "scores" only make sense
+    together, so a config that changes one must give a matching other.
+
+    Raises:
+        ValueError: For unknown sections or sections, tables or lists of
+            the wrong JSON type
+    """
+    if base is None:
+        base = DEFAULT_RULES
+    if not isinstance(config, dict):
+        raise ValueError(f"Scoring rules must be an object, got {config!r}")
+    unknown = set(config) - set(base)
+    if unknown:
+        raise ValueError(f"Unknown scoring rule sections: {', '.join(sorted(unknown))}")
+    return {section: _merge_section(section, base[section], config.get(section, {})) for section in base}
+
+
+class CompiledRules:
+    """
+    Scoring rules compiled into lookup tables
+
+    Provides the same component scorers and total as task4.py, driven by
+    the compiled tables instead of hard-coded branches.
+    """
+
+    def __init__(self, config: Dict):
+        rules = merge_rules(config)
+        self.rules = rules
+        self.weights = rules["weights"]
+
+        self.education = LookupTable(rules["education"]["table"], rules["education"]["default"])
+        self.education_bonus = rules["education"]["relevant_bonus"]
+        self.experience = ThresholdTable(rules["experience"]["breakpoints"],
+                                         rules["experience"]["scores"])
+        self.skill_level = LookupTable(rules["skills"]["table"], rules["skills"]["default"])
+        self.default_skill_level = rules["skills"]["default_level"]
+        self.skills_bonus = rules["skills"]["coverage_bonus"]
+        self.certifications_bonus = rules["certifications"]["coverage_bonus"]
+        self.interview = LookupTable(rules["interview"]["table"], rules["interview"]["default"])
+        self.default_interview = rules["interview"]["default_rating"]
+        self.references = LookupTable(rules["references"]["table"], rules["references"]["default"])
+        self.default_references = rules["references"]["default_rating"]
+
+    def education_score(self, education_level: str, relevant_field: bool = True) -> float:
+        """Education score with the relevant-field bonus"""
+        base_score = self.education[education_level]
+        if relevant_field and base_score > 0:
+            return min(100, base_score + self.education_bonus)
+        return base_score
+
+    def skills_score(self, skills: List[Dict[str, str]], required_skills: List[str] = None) -> float:
+        """Average skill proficiency plus required-skill coverage bonus"""
+        if not skills:
+            return 0
+
+        skill_level = self.skill_level
+        default_level = self.default_skill_level
+        average_score = sum([skill_level[skill.get("level", default_level)] for skill in skills]) / len(skills)
+
+        if required_skills:
+            required = {s.lower() for s in required_skills}
+            required_count = len([skill for skill in skills if skill.get("name", "").lower() in required])
+            if required_count > 0:
+                coverage_bonus = (required_count / len(required_skills)) * self.skills_bonus
+                average_score = min(100, average_score + coverage_bonus)
+
+        return average_score
+
+    def certifications_score(self, certifications: List[Dict[str, str]],
+                             required_certs: List[str] = None) -> float:
+        """Share of valid certifications plus required-certification coverage bonus"""
+        if not certifications:
+            return 0
+
+        valid_count = len([cert for cert in certifications if cert.get("valid", True)])
+        base_score = (valid_count / len(certifications)) * 100
+
+        if required_certs:
+            required = {c.lower() for c in required_certs}
+            required_count = len([cert for cert in certifications if cert.get("name", "").lower() in required])
+            if required_count > 0:
+                coverage_bonus = (required_count / len(required_certs)) * self.certifications_bonus
+                base_score = min(100, base_score + coverage_bonus)
+
+        return base_score
+
+    def total_score(self, applicant: Dict, weights: Dict = None) -> Tuple[float, Dict]:
+        """
+        Calculate total weighted score for an applicant
+
+        Args:
+            applicant: Dictionary containing applicant information
+            weights: Optional weights overriding the configured ones
+
+        Returns:
+            Tuple of (total_score, score_breakdown)
+        """
+        if weights is None:
+            weights = self.weights
+
+        education_score = self.education_score(applicant.get("education_level", ""),
+                                               applicant.get("education_relevant", True))
+        experience_score = self.experience(applicant.get("experience_years", 0))
+        skills_score = self.skills_score(applicant.get("skills", []),
+                                         applicant.get("required_skills", None))
+        certifications_score = self.certifications_score(applicant.get("certifications", []),
+                                                         applicant.get("required_certifications", None))
+        interview_score = self.interview[applicant.get("interview_performance", self.default_interview)]
+        references_score = self.references[applicant.get("reference_quality", self.default_references)]
+
+        total_score = (
+            education_score * weights.get("education", SCORING_WEIGHTS["education"]) +
+            experience_score * weights.get("experience", SCORING_WEIGHTS["experience"]) +
+            skills_score * weights.get("skills", SCORING_WEIGHTS["skills"]) +
+            certifications_score * weights.get("certifications", SCORING_WEIGHTS["certifications"]) +
+            interview_score * weights.get("interview", SCORING_WEIGHTS["interview"]) +
+            references_score * weights.get("references", SCORING_WEIGHTS["references"])
+        )
+
+        score_breakdown = {
+            "education": education_score,
+            "experience": experience_score,
+            "skills": skills_score,
+            "certifications": certifications_score,
+            "interview": interview_score,
+            "references": references_score,
+            "total": total_score
+        }
+
+        return total_score, score_breakdown
+
+    def score_applicants(self, applicants: List[Dict], weights: Dict = None) -> List[Dict]:
+        """Score all applicants and return them sorted by total score (descending)"""
+        scored_applicants = []
+        for applicant in applicants:
+            total_score, score_breakdown = self.total_score(applicant, weights)
+            scored_applicants.append({**applicant, "score": total_score, "score_breakdown": score_breakdown})
+
+        scored_applicants.sort(key=lambda x: x["score"], reverse=True)
+        return scored_applicants
+
+
+def compile_rules(config: Dict = None) -> CompiledRules:
+    """Compile a rules config (merged over DEFAULT_RULES) into lookup tables"""
+    return CompiledRules(config or {})
+
+
+def load_rules(filename: str) -> CompiledRules:
+    """Load a JSON rules config from disk and compile it"""
+    with open(filename, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError(f"Scoring rules in '{filename}' must be a JSON object")
+    return compile_rules(config)
+
+
+def save_rules(config: Dict, filename: str):
+    """Write a full rules config (merged over DEFAULT_RULES) to a JSON file"""
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(merge_rules(config), f, indent=2)
+
+
+DEFAULT_COMPILED_RULES = compile_rules()
+
+
+def main():
+    """Check the compiled default rules against task4.py and show a custom rule"""
+    from task4 import calculate_total_score, score_applicants
+
+    applicants = [
+        {"name": "Asha", "education_level": "Master", "experience_years": 6,
+         "skills": [{"name": "python", "level": "Advanced"}], "certifications": [],
+         "interview_performance": "very_good", "reference_quality": "GOOD"},
+        {"name": "Ben", "education_level": "bachelor", "experience_years": 1,
+         "skills": [{"name": "java", "level": "expert"}],
+         "certifications": [{"name": "aws", "valid": True}], "required_certifications": ["AWS"],
+         "interview_performance": "excellent", "reference_quality": "fair"},
+    ]
+
+    print("=" * 60)
+    print("Compiled Scoring Rules")
+    print("=" * 60)
+    for applicant in applicants:
+        expected = calculate_total_score(applicant)[0]
+        compiled = DEFAULT_COMPILED_RULES.total_score(applicant)[0]
+        print(f"{applicant['name']:<6} task4: {expected:6.2f}  compiled: {compiled:6.2f}")
+
+    # A hiring team that values experience more steeply, without code changes
+    custom = compile_rules({"experience": {"breakpoints": [0, 3, 8], "scores": [0, 20, 60, 100]}})
+    print("\nCustom experience thresholds:")
+    for applicant in custom.score_applicants(applicants):
+        print(f"{applicant['name']:<6} {applicant['score']:6.2f}")
+
+    default_order = [a["name"] for a in score_applicants(applicants)]
+    print(f"\nDefault ranking: {', '.join(default_order)}")
+
+
+if __name__ == "__main__":
+    main()
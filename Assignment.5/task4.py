@@ -4,8 +4,11 @@ This system evaluates and scores job applicants based on multiple features
 including education, experience, skills, certifications, and other qualifications.
 """
 
+import gzip
+import heapq
 import json
-from typing import Dict, List, Optional, Tuple
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 from collections import defaultdict
 
@@ -438,21 +441,47 @@ def get_applicant_from_keyboard() -> Optional[Dict]:
     print(f"\n[OK] Applicant added: {name}")
     return applicant
 
-def score_applicants(applicants: List[Dict], weights: Dict = None) -> List[Dict]:
+# Data-driven scoring rules used by main() when this file exists
+SCORING_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scoring_rules.json")
+
+def load_scoring_rules(filename: str = SCORING_RULES_FILE):
+    """
+    Load and compile the scoring rules config, if the file exists
+    
+    Args:
+        filename: Path to a JSON rules file in the scoring_rules.py format
+    
+    Returns:
+        scoring_rules.CompiledRules, or None if the file does not exist
+    """
+    if not os.path.exists(filename):
+        return None
+    # Imported here because scoring_rules builds its defaults from this module
+    from scoring_rules import load_rules
+    return load_rules(filename)
+
+def _total_scorer(rules=None):
+    """Return the total-score function for compiled rules, or the built-in one"""
+    return rules.total_score if rules is not None else calculate_total_score
+
+def score_applicants(applicants: List[Dict], weights: Dict = None, rules=None) -> List[Dict]:
     """
     Score all applicants and return sorted list by total score
     
     Args:
         applicants: List of applicant dictionaries
         weights: Optional custom weights dictionary
+        rules: Optional scoring_rules.CompiledRules (see load_scoring_rules)
+               used instead of the built-in scoring rules
     
     Returns:
         List of applicants with scores, sorted by total score (descending)
     """
     scored_applicants = []
+    total_scorer = _total_scorer(rules)
     
     for applicant in applicants:
-        total_score, score_breakdown = calculate_total_score(applicant, weights)
+        total_score, score_breakdown = total_scorer(applicant, weights)
         
         scored_applicant = {
             **applicant,
@@ -546,7 +575,12 @@ def display_detailed_applicant(applicant: Dict):
     print("=" * 100)
 
 def save_results_to_file(applicants: List[Dict], filename: str = "applicant_scores.json"):
-    """Save scoring results to JSON file"""
+    """Save scoring results to JSON file (or JSON Lines for .jsonl/.jsonl.gz names)"""
+    if is_jsonl_file(filename):
+        write_applicants_jsonl(applicants, filename)
+        print(f"\n[SAVED] Results saved to {filename}")
+        return
+    
     output = {
         "timestamp": datetime.now().isoformat(),
         "total_applicants": len(applicants),
@@ -559,6 +593,179 @@ def save_results_to_file(applicants: List[Dict], filename: str = "applicant_scor
     
     print(f"\n[SAVED] Results saved to {filename}")
 
+def is_jsonl_file(filename: str) -> bool:
+    """Return True if the filename denotes a JSON Lines file (.jsonl or .jsonl.gz)"""
+    return filename.endswith(".jsonl") or filename.endswith(".jsonl.gz")
+
+def open_applicant_file(filename: str, mode: str = "r"):
+    """
+    Open an applicant file in text mode, transparently handling gzip
+    
+    Args:
+        filename: Path to the file; a '.gz' suffix selects gzip compression
+        mode: 'r' to read, 'w' to write, 'a' to append
+    
+    Returns:
+        A text file object
+    """
+    if filename.endswith(".gz"):
+        return gzip.open(filename, mode + "t", encoding="utf-8")
+    return open(filename, mode, encoding="utf-8")
+
+def read_applicants_jsonl(filename: str) -> Iterator[Dict]:
+    """
+    Stream applicants from a JSON Lines file, one applicant per line
+    
+    Only one applicant is held in memory at a time. Blank lines are skipped.
+    
+    Args:
+        filename: Path to a .jsonl or .jsonl.gz file
+    
+    Yields:
+        Applicant dictionaries
+    
+    Raises:
+        ValueError: If a line is not a JSON object
+    """
+    with open_applicant_file(filename, "r") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            applicant = json.loads(line)
+            if not isinstance(applicant, dict):
+                raise ValueError(f"Line {line_number} of '{filename}' is not a JSON object")
+            yield applicant
+
+def write_applicants_jsonl(applicants: Iterable[Dict], filename: str,
+                           include_breakdown: bool = True) -> int:
+    """
+    Write applicants to a JSON Lines file, one compact JSON object per line
+    
+    Args:
+        applicants: Any iterable of applicant dictionaries (may be a generator)
+        filename: Path to a .jsonl or .jsonl.gz file
+        include_breakdown: Whether to keep each applicant's 'score_breakdown'
+    
+    Returns:
+        int: Number of applicants written
+    """
+    count = 0
+    with open_applicant_file(filename, "w") as f:
+        for applicant in applicants:
+            if not include_breakdown and "score_breakdown" in applicant:
+                applicant = {k: v for k, v in applicant.items() if k != "score_breakdown"}
+            f.write(json.dumps(applicant, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+    return count
+
+def score_applicants_stream(applicants: Iterable[Dict], weights: Dict = None, rules=None) -> Iterator[Dict]:
+    """
+    Score applicants lazily, in input order
+    
+    Unlike score_applicants, this does not build or sort a list, so it can be
+    chained between read_applicants_jsonl and write_applicants_jsonl to score
+    arbitrarily large pools in constant memory.
+    
+    Args:
+        applicants: Any iterable of applicant dictionaries
+        weights: Optional custom weights dictionary
+        rules: Optional scoring_rules.CompiledRules to score with
+    
+    Yields:
+        Applicant dictionaries with 'score' and 'score_breakdown' added
+    """
+    total_scorer = _total_scorer(rules)
+    for applicant in applicants:
+        total_score, score_breakdown = total_scorer(applicant, weights)
+        yield {
+            **applicant,
+            "score": total_score,
+            "score_breakdown": score_breakdown
+        }
+
+def top_applicants_stream(applicants: Iterable[Dict], top_k: int, weights: Dict = None,
+                          rules=None) -> List[Dict]:
+    """
+    Return the top_k highest scoring applicants from a stream
+    
+    Uses a bounded heap, so memory is O(top_k) regardless of pool size.
+    Ties keep input order, matching the stable sort in score_applicants.
+    
+    Args:
+        applicants: Any iterable of applicant dictionaries
+        top_k: Number of applicants to keep
+        weights: Optional custom weights dictionary
+        rules: Optional scoring_rules.CompiledRules to score with
+    
+    Returns:
+        List of scored applicants, sorted by total score (descending)
+    """
+    if top_k <= 0:
+        return []
+    
+    heap = []
+    for index, scored in enumerate(score_applicants_stream(applicants, weights, rules)):
+        # Negated index so that, among equal scores, earlier applicants win
+        entry = (scored["score"], -index, scored)
+        if len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    
+    heap.sort(key=lambda entry: entry[:2], reverse=True)
+    return [entry[2] for entry in heap]
+
+def score_file_jsonl(input_filename: str, output_filename: str, weights: Dict = None,
+                     top_k: Optional[int] = None, include_breakdown: bool = True,
+                     rules=None) -> int:
+    """
+    Streaming pipeline: read applicants -> score -> write results as JSON Lines
+    
+    Args:
+        input_filename: Source .jsonl or .jsonl.gz file
+        output_filename: Destination .jsonl or .jsonl.gz file
+        weights: Optional custom weights dictionary
+        top_k: If given, write only the top_k applicants ranked by score;
+               otherwise every applicant is written in input order
+        include_breakdown: Whether to keep each applicant's 'score_breakdown'
+        rules: Optional scoring_rules.CompiledRules to score with
+    
+    Returns:
+        int: Number of applicants written
+    """
+    applicants = read_applicants_jsonl(input_filename)
+    if top_k is None:
+        scored = score_applicants_stream(applicants, weights, rules)
+    else:
+        scored = top_applicants_stream(applicants, top_k, weights, rules)
+    return write_applicants_jsonl(scored, output_filename, include_breakdown)
+
+def load_applicants_from_file(filename: str) -> List[Dict]:
+    """
+    Load applicants from a JSON document or a JSON Lines file
+    
+    Args:
+        filename: Path to a .json, .jsonl or .jsonl.gz file
+    
+    Returns:
+        List of applicant dictionaries
+    
+    Raises:
+        ValueError: If the JSON document has an unsupported layout
+    """
+    if is_jsonl_file(filename):
+        return list(read_applicants_jsonl(filename))
+    
+    with open_applicant_file(filename, "r") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and "applicants" in data:
+        return data["applicants"]
+    raise ValueError("Invalid file format.")
+
 def display_menu():
     """Display the main menu"""
     print("\n" + "=" * 70)
@@ -591,6 +798,14 @@ def main():
     print("  - Reference Quality")
     print("\nApplicants are scored using weighted criteria and ranked accordingly.")
     
+    try:
+        rules = load_scoring_rules()
+    except (ValueError, json.JSONDecodeError) as e:
+        print(f"\n[WARNING] Ignoring invalid scoring rules file: {e}")
+        rules = None
+    if rules is not None:
+        print(f"\n[INFO] Scoring rules loaded from {os.path.basename(SCORING_RULES_FILE)}")
+    
     while True:
         display_menu()
         choice = input("\nEnter your choice (1-8): ").strip()
@@ -608,7 +823,7 @@ def main():
             if not applicants:
                 print("[ERROR] No applicants to score. Please add applicants first.")
             else:
-                scored_applicants = score_applicants(applicants)
+                scored_applicants = score_applicants(applicants, rules=rules)
                 print(f"\n[OK] Scored {len(scored_applicants)} applicants.")
                 display_applicant_scores(scored_applicants)
         
@@ -640,13 +855,13 @@ def main():
             print("\n--- SAVE RESULTS ---")
             if not scored_applicants:
                 print("[WARNING] No scored applicants. Scoring applicants first...")
-                scored_applicants = score_applicants(applicants)
+                scored_applicants = score_applicants(applicants, rules=rules)
             
             filename = input("Enter filename (default: applicant_scores.json): ").strip()
             if not filename:
                 filename = "applicant_scores.json"
             
-            if not filename.endswith('.json'):
+            if not filename.endswith('.json') and not is_jsonl_file(filename):
                 filename += '.json'
             
             save_results_to_file(scored_applicants, filename)
@@ -655,22 +870,15 @@ def main():
             print("\n--- LOAD APPLICANTS FROM FILE ---")
             filename = input("Enter filename to load: ").strip()
             try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        applicants = data
-                    elif isinstance(data, dict) and "applicants" in data:
-                        applicants = data["applicants"]
-                    else:
-                        print("[ERROR] Invalid file format.")
-                        continue
-                
+                applicants = load_applicants_from_file(filename)
                 scored_applicants = []  # Reset scored list
                 print(f"[OK] Loaded {len(applicants)} applicants from {filename}.")
             except FileNotFoundError:
                 print(f"[ERROR] File '{filename}' not found.")
             except json.JSONDecodeError:
                 print(f"[ERROR] Invalid JSON file: '{filename}'.")
+            except ValueError as e:
+                print(f"[ERROR] {e}")
             except Exception as e:
                 print(f"[ERROR] Error loading file: {e}")
         
@@ -690,7 +898,7 @@ def main():
                 save_choice = input("Do you want to save results before exiting? (y/n): ").strip().lower()
                 if save_choice == 'y':
                     if not scored_applicants:
-                        scored_applicants = score_applicants(applicants)
+                        scored_applicants = score_applicants(applicants, rules=rules)
                     save_results_to_file(scored_applicants)
             
             print("Thank you for using the Job Applicant Scoring System. Goodbye!")